@@ -0,0 +1,90 @@
+"""
+Enrollment Scaling Benchmark
+
+This script measures how long oop_school_management.load_data takes as the number of
+registrations grows. Every student registers for a few of a small, fixed set of
+courses, so each course becomes a large lecture with thousands of enrolled students,
+the case where list-based membership checks made loading quadratic. With hashed
+enrollment sets the time per registration stays flat. The time json.load alone takes
+on the same file is shown for comparison; since objects are wired in bulk through id
+maps, the rest of the load should cost no more than parsing.
+
+Usage:
+    python benchmark_enrollments.py [--registrations 10000 100000 1000000] [--courses N] [--per-student N]
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+
+from oop_school_management import load_data
+
+
+def write_data(filename, registrations, courses, per_student):
+    # Write a school_data.json with the given number of registrations
+    students = registrations // per_student
+    data = {
+        "students": [
+            {
+                "name": f"Student {i}",
+                "age": 18 + i % 10,
+                "email": f"s{i}@school.edu",
+                "student_id": f"S{i:07}",
+                "registered_courses": [f"C{(i + k) % courses:03}" for k in range(per_student)],
+            }
+            for i in range(students)
+        ],
+        "instructors": [
+            {
+                "name": f"Instructor {i}",
+                "age": 40,
+                "email": f"i{i}@school.edu",
+                "instructor_id": f"I{i:03}",
+                "assigned_courses": [f"C{i:03}"],
+            }
+            for i in range(courses)
+        ],
+        "courses": [
+            {
+                "course_id": f"C{i:03}",
+                "course_name": f"Course {i}",
+                "instructor": f"I{i:03}",
+                "enrolled_students": [],
+            }
+            for i in range(courses)
+        ],
+    }
+    with open(filename, "w") as file:
+        json.dump(data, file)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure load_data time against the number of registrations.")
+    parser.add_argument("--registrations", type=int, nargs="+", default=[10000, 100000, 1000000])
+    parser.add_argument("--courses", type=int, default=50)
+    parser.add_argument("--per-student", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'registrations':>14}{'per course':>12}{'json (s)':>10}{'load (s)':>10}{'us/registration':>17}")
+    with tempfile.TemporaryDirectory() as directory:
+        for registrations in args.registrations:
+            filename = os.path.join(directory, f"school_{registrations}.json")
+            write_data(filename, registrations, args.courses, args.per_student)
+            start = time.perf_counter()
+            with open(filename) as file:
+                json.load(file)
+            parsing = time.perf_counter() - start
+            start = time.perf_counter()
+            students, _, courses = load_data(filename)
+            elapsed = time.perf_counter() - start
+            loaded = sum(len(student.registered_courses) for student in students)
+            print(
+                f"{loaded:>14}{loaded // len(courses):>12}{parsing:>10.2f}{elapsed:>10.2f}"
+                f"{elapsed / loaded * 1e6:>17.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Model Memory Benchmark
+
+This script uses tracemalloc to measure the memory held by large numbers of Student
+objects. It compares the slotted classes of oop_school_management and
+tkinter_application/Part1 with equivalents laid out like the classes used to be, with
+every field in a per-instance __dict__. Both sides receive the same field values, so
+the difference is the per-object overhead.
+
+Usage:
+    python benchmark_memory.py [--students 100000 1000000]
+"""
+
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+
+import oop_school_management
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "tkinter_application"))
+import Part1  # noqa: E402
+
+
+# Layout of oop_school_management.Student before __slots__: a __dict__ and a course list
+class LegacyOopStudent:
+    def __init__(self, name, age, email, student_id):
+        self.name = name
+        self.age = age
+        self._email = email
+        self.student_id = student_id
+        self.registered_courses = []
+
+
+# Layout of Part1.Student before __slots__
+class LegacyPart1Student:
+    def __init__(self, name, age, email, student_id):
+        self.name = name
+        self.age = age
+        self._email = email
+        self.student_id = student_id
+        self.registered_courses = []
+
+
+MODELS = {
+    "oop_school_management": (LegacyOopStudent, oop_school_management.Student),
+    "Part1": (LegacyPart1Student, Part1.Student),
+}
+
+
+def measure(cls, count):
+    # Bytes still allocated after creating count students and keeping them in a list
+    gc.collect()
+    tracemalloc.start()
+    students = [cls(f"Student {i}", 18 + i % 10, f"s{i}@school.edu", f"S{i:07}") for i in range(count)]
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del students
+    return allocated
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the memory of dict-based and slotted model classes.")
+    parser.add_argument("--students", type=int, nargs="+", default=[100000, 1000000])
+    args = parser.parse_args()
+
+    print(f"{'model':<24}{'students':>10}{'__dict__ MB':>13}{'slots MB':>10}{'saved MB':>10}{'bytes/obj saved':>17}")
+    for model, (legacy, slotted) in MODELS.items():
+        for count in args.students:
+            before = measure(legacy, count)
+            after = measure(slotted, count)
+            print(
+                f"{model:<24}{count:>10}{before / 2**20:>13.1f}{after / 2**20:>10.1f}"
+                f"{(before - after) / 2**20:>10.1f}{(before - after) / count:>17.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,76 @@
+import bisect
+import gc
 import json
+import os
 import re
+import sys
+import threading
+from contextlib import contextmanager
+from operator import attrgetter
+
+# Email format accepted by Person, compiled once for every instance
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$')
+# The same format for a whole column of emails joined by newlines, checked in one match
+EMAIL_COLUMN_PATTERN = re.compile(r'(?:[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+\n)*')
+
+# Stable ids used to key enrollment collections; shared by every instance
+COURSE_ID = attrgetter("course_id")
+STUDENT_ID = attrgetter("student_id")
+INSTRUCTOR_ID = attrgetter("instructor_id")
+
+# Intern strings so equal values share one object; ids of other types are kept as they are
+def _intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
+# Helper: Insertion-ordered collection with O(1) membership by id
+class OrderedIdSet:
+    __slots__ = ("_key", "_items")
+
+    def __init__(self, key, items=()):
+        self._key = key  # Maps an item to its stable id, e.g. COURSE_ID
+        self._items = None  # id -> item, in insertion order; created on the first add
+        for item in items:
+            self.add(item)
+
+    # Add an item unless one with the same id is already present; returns True if added
+    def add(self, item):
+        item_id = self._key(item)
+        if self._items is None:
+            self._items = {}
+        elif item_id in self._items:
+            return False
+        self._items[item_id] = item
+        return True
+
+    # Replace the contents in bulk with items under the given ids, in order
+    def replace(self, ids, items):
+        self._items = dict(zip(ids, items)) or None
+
+    # Remove an item if present
+    def discard(self, item):
+        if self._items:
+            self._items.pop(self._key(item), None)
+
+    # Look an item up by its id
+    def get(self, item_id, default=None):
+        return self._items.get(item_id, default) if self._items else default
+
+    def __contains__(self, item):
+        return bool(self._items) and self._key(item) in self._items
+
+    def __iter__(self):
+        return iter(self._items.values() if self._items else ())
+
+    def __len__(self):
+        return len(self._items) if self._items else 0
+
+    def __repr__(self):
+        return f"OrderedIdSet({list(self._items or ())})"
 
 # Class 1: Define the Person Class
 class Person:
+    __slots__ = ("name", "age", "_email")  # No per-instance __dict__
+
     def __init__(self, name, age, email):
         self.name = name
         self.age = self._validate_age(age)
@@ -11,10 +79,17 @@ class Person:
     def introduce(self):
         print(f"Hello, my name is {self.name} and I am {self.age} years old.")
 
+    # Serialization: fields as a plain dict, and back
+    def to_dict(self):
+        return {"name": self.name, "age": self.age, "email": self._email}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data["name"], data["age"], data["email"])
+
     # Private method to validate email
     def _validate_email(self, email):
-        pattern = r'^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$'
-        if re.match(pattern, email):
+        if EMAIL_PATTERN.match(email):
             return email
         else:
             raise ValueError(f"Invalid email format: {email}")
@@ -28,15 +103,16 @@ class Person:
 
 # Class 2: Define the Student Subclass
 class Student(Person):
+    __slots__ = ("student_id", "registered_courses")
+
     def __init__(self, name, age, email, student_id):
         super().__init__(name, age, email)  # Inherits from Person
         self.student_id = student_id
-        self.registered_courses = []  # List of Course objects
+        self.registered_courses = OrderedIdSet(COURSE_ID)  # Course objects by course_id
 
     # Method to register for a course
     def register_course(self, course):
-        if course not in self.registered_courses:
-            self.registered_courses.append(course)
+        if self.registered_courses.add(course):
             course.add_student(self)
         else:
             print(f"Student {self.name} is already registered for {course.course_name}.")
@@ -45,17 +121,29 @@ class Student(Person):
     def introduce(self):
         print(f"Hello, I am {self.name}, a student with ID {self.student_id}.")
 
+    # Registered courses are saved as course ids; from_dict leaves them to register_course
+    def to_dict(self):
+        data = super().to_dict()
+        data["student_id"] = self.student_id
+        data["registered_courses"] = [course.course_id for course in self.registered_courses]
+        return data
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data["name"], data["age"], data["email"], data["student_id"])
+
 # Class 3: Define the Instructor Subclass
 class Instructor(Person):
+    __slots__ = ("instructor_id", "assigned_courses")
+
     def __init__(self, name, age, email, instructor_id):
         super().__init__(name, age, email)  # Inherits from Person
         self.instructor_id = instructor_id
-        self.assigned_courses = []  # List of Course objects
+        self.assigned_courses = OrderedIdSet(COURSE_ID)  # Course objects by course_id
 
     # Method to assign an instructor to a course
     def assign_course(self, course):
-        if course not in self.assigned_courses:
-            self.assigned_courses.append(course)
+        if self.assigned_courses.add(course):
             course.instructor = self  # Set the course's instructor
         else:
             print(f"Instructor {self.name} is already assigned to {course.course_name}.")
@@ -64,19 +152,31 @@ class Instructor(Person):
     def introduce(self):
         print(f"Hello, I am {self.name}, an instructor with ID {self.instructor_id}.")
 
+    # Assigned courses are saved as course ids; from_dict leaves them to assign_course
+    def to_dict(self):
+        data = super().to_dict()
+        data["instructor_id"] = self.instructor_id
+        data["assigned_courses"] = [course.course_id for course in self.assigned_courses]
+        return data
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data["name"], data["age"], data["email"], data["instructor_id"])
+
 # Class 4: Define the Course Class
 class Course:
+    __slots__ = ("course_id", "course_name", "instructor", "enrolled_students")
+
     def __init__(self, course_id, course_name):
-        self.course_id = course_id
-        self.course_name = course_name
+        # Interned, so the many references to a course's id and name share one string
+        self.course_id = _intern(course_id)
+        self.course_name = _intern(course_name)
         self.instructor = None  # Instructor assigned to the course
-        self.enrolled_students = []  # List of Student objects
+        self.enrolled_students = OrderedIdSet(STUDENT_ID)  # Student objects by student_id
 
     # Method to add a student to a course
     def add_student(self, student):
-        if student not in self.enrolled_students:
-            self.enrolled_students.append(student)
-        else:
+        if not self.enrolled_students.add(student):
             print(f"Student {student.name} is already enrolled in {self.course_name}.")
 
     # Display course details
@@ -85,35 +185,162 @@ class Course:
         print(f"Course {self.course_name} (ID: {self.course_id}) is taught by {instructor_name}.")
         print(f"Enrolled students: {[student.name for student in self.enrolled_students]}")
 
+    # The instructor and students are saved as ids; from_dict leaves them to be linked
+    def to_dict(self):
+        return {
+            "course_id": self.course_id,
+            "course_name": self.course_name,
+            "instructor": self.instructor.instructor_id if self.instructor else None,
+            "enrolled_students": [student.student_id for student in self.enrolled_students]
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data["course_id"], data["course_name"])
+
+# Class 5: In-memory registry with indexes by id and by name
+class SchoolRegistry:
+    def __init__(self, students=(), instructors=(), courses=()):
+        # Primary indexes: id -> object, in insertion order
+        self.students = OrderedIdSet(STUDENT_ID)
+        self.instructors = OrderedIdSet(INSTRUCTOR_ID)
+        self.courses = OrderedIdSet(COURSE_ID)
+        # Secondary name indexes: sorted lists of (casefolded name, id) for bisect lookups
+        self._names = {"student": [], "instructor": [], "course": []}
+        # Substring indexes: casefolded labels in insertion order, with their ids and the
+        # offset of each label in the newline-joined haystack, which is rebuilt lazily
+        self._labels = {kind: ([], [], []) for kind in self._names}
+        self._haystacks = dict.fromkeys(self._names, "")
+        self._add_many(self.students, "student", students, STUDENT_ID, attrgetter("name"))
+        self._add_many(self.instructors, "instructor", instructors, INSTRUCTOR_ID, attrgetter("name"))
+        self._add_many(self.courses, "course", courses, COURSE_ID, attrgetter("course_name"))
+
+    # Add entities; each returns False if an entity with the same id already exists
+    def add_student(self, student):
+        return self._add(self.students, "student", student, student.name, student.student_id)
+
+    def add_instructor(self, instructor):
+        return self._add(self.instructors, "instructor", instructor, instructor.name, instructor.instructor_id)
+
+    def add_course(self, course):
+        return self._add(self.courses, "course", course, course.course_name, course.course_id)
+
+    def _add(self, collection, kind, item, name, item_id):
+        if not collection.add(item):
+            return False
+        bisect.insort(self._names[kind], (name.casefold(), item_id))
+        self._index_label(kind, item, item_id)
+        return True
+
+    # Bulk version of _add for the constructor: sorts the name index once
+    def _add_many(self, collection, kind, items, key, name_of):
+        added = [item for item in items if collection.add(item)]
+        self._names[kind].extend((name_of(item).casefold(), key(item)) for item in added)
+        self._names[kind].sort()
+        for item in added:
+            self._index_label(kind, item, key(item))
+
+    def _index_label(self, kind, item, item_id):
+        labels, ids, starts = self._labels[kind]
+        starts.append(starts[-1] + len(labels[-1]) + 1 if labels else 0)
+        labels.append(self.label(item).casefold().replace("\n", " "))
+        ids.append(item_id)
+        self._haystacks[kind] = None
+
+    # O(1) lookups by id
+    def get_student(self, student_id):
+        return self.students.get(student_id)
+
+    def get_instructor(self, instructor_id):
+        return self.instructors.get(instructor_id)
+
+    def get_course(self, course_id):
+        return self.courses.get(course_id)
+
+    # Case-insensitive name lookups; names are not unique, so these return lists
+    def find_students(self, name, prefix=False, limit=None):
+        return [self.students.get(i) for i in self._find_ids("student", name, prefix, limit)]
+
+    def find_instructors(self, name, prefix=False, limit=None):
+        return [self.instructors.get(i) for i in self._find_ids("instructor", name, prefix, limit)]
+
+    def find_courses(self, name, prefix=False, limit=None):
+        return [self.courses.get(i) for i in self._find_ids("course", name, prefix, limit)]
+
+    def _find_ids(self, kind, name, prefix, limit):
+        index = self._names[kind]
+        key = name.casefold()
+        ids = []
+        position = bisect.bisect_left(index, (key,))
+        while position < len(index) and (limit is None or len(ids) < limit):
+            entry_name, entry_id = index[position]
+            if not (entry_name.startswith(key) if prefix else entry_name == key):
+                break
+            ids.append(entry_id)
+            position += 1
+        return ids
+
+    # Type-ahead search: names starting with text first, in name order, then labels
+    # ("Name (ID)") containing text anywhere, in insertion order; at most limit results
+    def search_students(self, text, limit=50):
+        return [self.students.get(i) for i in self._search_ids("student", text, limit)]
+
+    def search_instructors(self, text, limit=50):
+        return [self.instructors.get(i) for i in self._search_ids("instructor", text, limit)]
+
+    def search_courses(self, text, limit=50):
+        return [self.courses.get(i) for i in self._search_ids("course", text, limit)]
+
+    def _search_ids(self, kind, text, limit):
+        key = text.casefold()
+        ids = self._find_ids(kind, key, True, limit)
+        if len(ids) >= limit or not key or "\n" in key:
+            return ids
+        seen = set(ids)
+        labels, entry_ids, starts = self._labels[kind]
+        if self._haystacks[kind] is None:
+            self._haystacks[kind] = "\n".join(labels)
+        haystack = self._haystacks[kind]
+        position = haystack.find(key)
+        while position != -1 and len(ids) < limit:
+            entry = bisect.bisect_right(starts, position) - 1
+            if entry_ids[entry] not in seen:
+                seen.add(entry_ids[entry])
+                ids.append(entry_ids[entry])
+            # Continue after this label, so each one is reported once
+            position = haystack.find(key, starts[entry] + len(labels[entry]) + 1)
+        return ids
+
+    # Display labels that stay unique when names are not, e.g. "Alice (S001)"
+    @staticmethod
+    def label(item):
+        if isinstance(item, Student):
+            return f"{item.name} ({item.student_id})"
+        if isinstance(item, Instructor):
+            return f"{item.name} ({item.instructor_id})"
+        return f"{item.course_name} ({item.course_id})"
+
+    # Resolve a label produced by label() back to its entity in O(1)
+    def resolve_student(self, label):
+        return self.students.get(self._label_id(label))
+
+    def resolve_instructor(self, label):
+        return self.instructors.get(self._label_id(label))
+
+    def resolve_course(self, label):
+        return self.courses.get(self._label_id(label))
+
+    @staticmethod
+    def _label_id(label):
+        name, separator, rest = label.rpartition(" (")
+        return rest[:-1] if separator and rest.endswith(")") else None
+
 # Data management: Serialization (Save and Load)
 def save_data(students, instructors, courses, filename="school_data.json"):
     data = {
-        "students": [
-            {
-                "name": student.name,
-                "age": student.age,
-                "email": student._email,
-                "student_id": student.student_id,
-                "registered_courses": [course.course_id for course in student.registered_courses]
-            } for student in students
-        ],
-        "instructors": [
-            {
-                "name": instructor.name,
-                "age": instructor.age,
-                "email": instructor._email,
-                "instructor_id": instructor.instructor_id,
-                "assigned_courses": [course.course_id for course in instructor.assigned_courses]
-            } for instructor in instructors
-        ],
-        "courses": [
-            {
-                "course_id": course.course_id,
-                "course_name": course.course_name,
-                "instructor": course.instructor.instructor_id if course.instructor else None,
-                "enrolled_students": [student.student_id for student in course.enrolled_students]
-            } for course in courses
-        ]
+        "students": [student.to_dict() for student in students],
+        "instructors": [instructor.to_dict() for instructor in instructors],
+        "courses": [course.to_dict() for course in courses]
     }
     
     with open(filename, 'w') as file:
@@ -121,46 +348,475 @@ def save_data(students, instructors, courses, filename="school_data.json"):
     print(f"Data saved to {filename}")
 
 def load_data(filename="school_data.json"):
-    with open(filename, 'r') as file:
-        data = json.load(file)
+    students, instructors, courses, report = load_data_with_report(filename)
+    if not report.ok:
+        print(report.summary())
+    return students, instructors, courses
 
-    students = []
-    instructors = []
-    courses = []
+# Load like load_data, and also return a LoadReport instead of failing on bad records
+def load_data_with_report(filename="school_data.json"):
+    with paused_gc():
+        with open(filename, 'r') as file:
+            data = json.load(file)
+        return build_objects(data)
 
-    # Create Course objects first (we need them for students and instructors)
-    course_dict = {}
-    for course_data in data['courses']:
-        course = Course(course_data['course_id'], course_data['course_name'])
-        courses.append(course)
-        course_dict[course.course_id] = course
-
-    # Create Student objects
-    for student_data in data['students']:
-        student = Student(
-            name=student_data['name'], 
-            age=student_data['age'], 
-            email=student_data['email'], 
-            student_id=student_data['student_id']
+# Build linked Student, Instructor and Course objects from the dict written by save_data
+def objects_from_data(data):
+    students, instructors, courses, report = build_objects(data)
+    return students, instructors, courses
+
+# Summary of a load: what was built, which records were skipped, which ids were missing
+class LoadReport:
+    def __init__(self):
+        self.counts = {"students": 0, "instructors": 0, "courses": 0, "registrations": 0, "assignments": 0}
+        self.invalid = []  # (kind, id, reason) for every skipped record
+        self.dangling = []  # (kind, id, field, missing id) for every unresolved reference
+
+    @property
+    def ok(self):
+        return not self.invalid and not self.dangling
+
+    def summary(self, limit=10):
+        lines = [", ".join(f"{count} {name}" for name, count in self.counts.items()) + " loaded."]
+        if self.invalid:
+            lines.append(f"{len(self.invalid)} invalid records skipped:")
+            lines += [f"  {kind} {item_id}: {reason}" for kind, item_id, reason in self.invalid[:limit]]
+        if self.dangling:
+            lines.append(f"{len(self.dangling)} references to unknown ids ignored:")
+            lines += [f"  {kind} {item_id}: {field} {missing}" for kind, item_id, field, missing in self.dangling[:limit]]
+        return "\n".join(lines)
+
+# Check the names, ages and emails of a list of person records as whole columns, like
+# Person._validate_age/_validate_email; returns {index: reason} for the failures
+def _validate_people(records):
+    problems = {}
+    try:
+        named = all(['name' in record for record in records])
+        ages = [record['age'] for record in records]
+        emails = [record['email'] for record in records]
+        column = "\n".join(emails) + "\n"
+        clean = (
+            named
+            and min(ages, default=0) >= 0
+            and column.count("\n") == len(emails)
+            and EMAIL_COLUMN_PATTERN.fullmatch(column) is not None
         )
-        # Register courses for student
-        for course_id in student_data['registered_courses']:
-            course = course_dict[course_id]
-            student.register_course(course)
+    except (KeyError, TypeError):
+        clean = False
+    if clean:
+        return problems
+    # Something is wrong somewhere: find out which records, one at a time
+    for index, record in enumerate(records):
+        try:
+            if 'name' not in record:
+                problems[index] = "Missing name"
+            elif record['age'] < 0:
+                problems[index] = f"Age must be a non-negative integer: {record['age']}"
+            elif not EMAIL_PATTERN.match(record['email']):
+                problems[index] = f"Invalid email format: {record['email']}"
+        except (KeyError, TypeError) as e:
+            problems[index] = f"Malformed record: {e!r}"
+    return problems
+
+# Describe what is wrong with a registered_courses/assigned_courses value, or None if
+# it is a list of ids that can be looked up
+def _course_list_problem(course_ids):
+    if not isinstance(course_ids, list):
+        return f"must be a list of course ids, not {type(course_ids).__name__}"
+    for course_id in course_ids:
+        try:
+            hash(course_id)
+        except TypeError:
+            return f"contains an invalid course id: {course_id!r}"
+    return None
+
+# Create a Person subclass instance from fields that were already validated;
+# the caller sets the subclass fields
+def _restore(cls, record):
+    person = cls.__new__(cls)
+    person.name = record['name']
+    person.age = record['age']
+    person._email = record['email']
+    return person
+
+# Build linked objects in one pass per entity: objects are created from bulk-validated
+# records and relationships are wired through id maps, so the cost is linear and
+# dominated by JSON parsing. Bad records and unknown ids end up in the LoadReport.
+def build_objects(data):
+    with paused_gc():
+        return _build_objects(data)
+
+# Suspend cyclic garbage collection while a load allocates millions of objects that all
+# stay alive; otherwise every collection rescans them for nothing
+@contextmanager
+def paused_gc():
+    collecting = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if collecting:
+            gc.enable()
+
+def _build_objects(data):
+    report = LoadReport()
+
+    courses = []
+    course_map = {}
+    for course_data in data.get('courses', []):
+        try:
+            course = Course.from_dict(course_data)
+        except (KeyError, TypeError) as e:
+            report.invalid.append(("course", course_data.get('course_id') if isinstance(course_data, dict) else None, f"Malformed record: {e!r}"))
+            continue
+        if course.course_id in course_map:
+            report.invalid.append(("course", course.course_id, "Duplicate id"))
+            continue
+        course_map[course.course_id] = course
+        courses.append(course)
+
+    # Enrolled students per course, collected while the students are built
+    enrolled = {course_id: [] for course_id in course_map}
+    enroll = {course_id: members.append for course_id, members in enrolled.items()}
+    course_lookup = course_map.__getitem__
+
+    students = []
+    student_ids = set()
+    student_data = data.get('students', [])
+    problems = _validate_people(student_data)
+    for index, record in enumerate(student_data):
+        if index in problems:
+            report.invalid.append(("student", record.get('student_id') if isinstance(record, dict) else None, problems[index]))
+            continue
+        student_id = record.get('student_id')
+        if student_id is None or student_id in student_ids:
+            report.invalid.append(("student", student_id, "Missing or duplicate id"))
+            continue
+        registered = OrderedIdSet(COURSE_ID)
+        course_ids = record.get('registered_courses', [])
+        try:
+            if not isinstance(course_ids, list):
+                raise TypeError
+            registered.replace(course_ids, map(course_lookup, course_ids))
+        except (KeyError, TypeError):
+            # Slow path only for students with a malformed course list or a dangling course id
+            problem = _course_list_problem(course_ids)
+            if problem:
+                report.invalid.append(("student", student_id, f"registered_courses {problem}"))
+                continue
+            for course_id in course_ids:
+                if course_id not in course_map:
+                    report.dangling.append(("student", student_id, "registered_courses", course_id))
+            course_ids = [course_id for course_id in course_ids if course_id in course_map]
+            registered.replace(course_ids, map(course_lookup, course_ids))
+        student_ids.add(student_id)
+        student = _restore(Student, record)
+        student.student_id = student_id
+        student.registered_courses = registered
+        for course_id in course_ids:
+            enroll[course_id](student)
         students.append(student)
 
-    # Create Instructor objects
-    for instructor_data in data['instructors']:
-        instructor = Instructor(
-            name=instructor_data['name'], 
-            age=instructor_data['age'], 
-            email=instructor_data['email'], 
-            instructor_id=instructor_data['instructor_id']
-        )
-        # Assign courses to instructor
-        for course_id in instructor_data['assigned_courses']:
-            course = course_dict[course_id]
-            instructor.assign_course(course)
+    for course in courses:
+        members = enrolled[course.course_id]
+        course.enrolled_students.replace(map(STUDENT_ID, members), members)
+
+    instructors = []
+    instructor_ids = set()
+    instructor_data = data.get('instructors', [])
+    problems = _validate_people(instructor_data)
+    for index, record in enumerate(instructor_data):
+        if index in problems:
+            report.invalid.append(("instructor", record.get('instructor_id') if isinstance(record, dict) else None, problems[index]))
+            continue
+        instructor_id = record.get('instructor_id')
+        if instructor_id is None or instructor_id in instructor_ids:
+            report.invalid.append(("instructor", instructor_id, "Missing or duplicate id"))
+            continue
+        course_ids = record.get('assigned_courses', [])
+        problem = _course_list_problem(course_ids)
+        if problem:
+            report.invalid.append(("instructor", instructor_id, f"assigned_courses {problem}"))
+            continue
+        instructor_ids.add(instructor_id)
+        instructor = _restore(Instructor, record)
+        instructor.instructor_id = instructor_id
+        instructor.assigned_courses = OrderedIdSet(COURSE_ID)
+        for course_id in course_ids:
+            course = course_map.get(course_id)
+            if course is None:
+                report.dangling.append(("instructor", instructor_id, "assigned_courses", course_id))
+            elif instructor.assigned_courses.add(course):
+                course.instructor = instructor
+                report.counts["assignments"] += 1
         instructors.append(instructor)
 
-    return students, instructors, courses
+    report.counts["registrations"] = sum(map(len, (course.enrolled_students for course in courses)))
+    report.counts["students"] = len(students)
+    report.counts["instructors"] = len(instructors)
+    report.counts["courses"] = len(courses)
+    return students, instructors, courses, report
+
+# Write JSON to a temporary file and atomically rename it over filename, so a crash
+# leaves either the old or the new file, never a partial one
+def write_json_atomic(data, filename):
+    temporary = f"{filename}.tmp"
+    with open(temporary, 'w') as file:
+        json.dump(data, file, indent=4)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temporary, filename)
+
+# Class 6: Append-only change journal on top of a school_data.json snapshot
+class SchoolJournal:
+    # Journal size in bytes after which a background compaction starts
+    COMPACT_THRESHOLD = 1024 * 1024
+
+    def __init__(self, filename="school_data.json", compact_threshold=COMPACT_THRESHOLD):
+        self.filename = filename  # Snapshot, in the save_data format plus "journal_seq"
+        self.journal_filename = f"{filename}.journal"  # One JSON operation per line
+        self.compact_threshold = compact_threshold
+        self.registry = SchoolRegistry()
+        self.load_report = None  # LoadReport of the snapshot read by load()
+        self.seq = 0  # Sequence number of the last recorded operation
+        self._loaded = False  # Set by load(); until then seq and the registry do not reflect the files
+        self._lock = threading.RLock()  # Guards the registry, seq and the journal file
+        self._journal = None
+        self._journal_bytes = 0
+        self._compaction = None  # Background compaction thread, if one is running
+        self.compaction_error = None  # Exception of the last failed background compaction
+        self._retry_compaction_at = 0  # Journal size a failed compaction waits for before retrying
+        self._compacting = threading.Lock()  # Lets only one compaction run at a time
+
+    # Load the snapshot and replay the journal on top of it; returns False if neither exists
+    def load(self):
+        with self._lock:
+            found = False
+            snapshot_seq = 0
+            if os.path.exists(self.filename):
+                with paused_gc():
+                    with open(self.filename, 'r') as file:
+                        data = json.load(file)
+                    if not isinstance(data, dict):
+                        raise ValueError(f"{self.filename}: expected a JSON object.")
+                    students, instructors, courses, self.load_report = build_objects(data)
+                self.registry = SchoolRegistry(students, instructors, courses)
+                snapshot_seq = data.get("journal_seq", 0)
+                found = True
+            self.seq = snapshot_seq
+            self._journal_bytes = 0
+            if os.path.exists(self.journal_filename):
+                self._replay(snapshot_seq)
+                found = True
+            self._loaded = True
+            return found
+
+    def _replay(self, snapshot_seq):
+        with open(self.journal_filename, 'rb') as file:
+            content = file.read()
+        # A crash can leave a partial last line; drop it so new entries start on a fresh line
+        end = content.rfind(b"\n") + 1
+        if end < len(content):
+            with open(self.journal_filename, 'r+b') as file:
+                file.truncate(end)
+        for line_number, line in enumerate(content[:end].splitlines(), 1):
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{self.journal_filename} line {line_number}: invalid JSON ({e.msg}).") from e
+            # Entries up to the snapshot's sequence number are already part of it
+            try:
+                if entry["seq"] > snapshot_seq:
+                    self._apply(entry)
+                    self.seq = entry["seq"]
+            except (KeyError, TypeError) as e:
+                raise ValueError(f"{self.journal_filename} line {line_number}: malformed entry ({e!r}).") from e
+        self._journal_bytes = end
+
+    # Apply one journal entry to the registry; returns False if it changed nothing.
+    # item is the object an add entry stores; replay passes none and builds it from the data.
+    def _apply(self, entry, item=None):
+        op = entry["op"]
+        registry = self.registry
+        if op == "add_student":
+            return registry.add_student(item if item is not None else Student.from_dict(entry["data"]))
+        if op == "add_instructor":
+            return registry.add_instructor(item if item is not None else Instructor.from_dict(entry["data"]))
+        if op == "add_course":
+            return registry.add_course(item if item is not None else Course.from_dict(entry["data"]))
+        course = registry.get_course(entry["course_id"])
+        if op == "register_course":
+            student = registry.get_student(entry["student_id"])
+            if student is None or course is None or course in student.registered_courses:
+                return False
+            student.register_course(course)
+            return True
+        if op == "assign_course":
+            instructor = registry.get_instructor(entry["instructor_id"])
+            if instructor is None or course is None or course in instructor.assigned_courses:
+                return False
+            instructor.assign_course(course)
+            return True
+        raise ValueError(f"Unknown journal operation: {op}")
+
+    # Record an operation: apply it, then append it to the journal and fsync.
+    # The files are loaded first if load() was never called, so the new entry continues
+    # their sequence instead of reusing numbers the snapshot already covers.
+    def _record(self, entry, item=None):
+        with self._lock:
+            if not self._loaded:
+                self.load()
+            if not self._apply(entry, item):
+                return False
+            self.seq += 1
+            line = json.dumps({"seq": self.seq, **entry}, separators=(",", ":")).encode("utf-8") + b"\n"
+            if self._journal is None:
+                self._journal = open(self.journal_filename, 'ab')
+            self._journal.write(line)
+            self._journal.flush()
+            os.fsync(self._journal.fileno())
+            self._journal_bytes += len(line)
+            if (self._journal_bytes >= max(self.compact_threshold, self._retry_compaction_at)
+                    and self._compaction is None):
+                self._compaction = threading.Thread(target=self._compact_in_background, name="SchoolJournalCompaction")
+                self._compaction.start()
+            return True
+
+    # Mutations; each returns False if it was a duplicate or referred to an unknown id.
+    # The add methods store the object passed in, so the registry and the caller share it;
+    # change it afterwards only through this journal, or the change is never saved. Links
+    # the object already has are taken off it and recorded again as register_course and
+    # assign_course entries, which keep those to objects in the registry and drop the rest,
+    # the same as replaying the journal does.
+    def add_student(self, student):
+        with self._lock:
+            if not self._loaded:
+                self.load()
+            if self.registry.get_student(student.student_id) is not None:
+                return False
+            courses = list(student.registered_courses)
+            for course in courses:
+                course.enrolled_students.discard(student)
+            student.registered_courses = OrderedIdSet(COURSE_ID)
+            self._record({"op": "add_student", "data": student.to_dict()}, student)
+            for course in courses:
+                known = self.registry.get_course(course.course_id)
+                if known is not None:
+                    self.register_course(student, known)
+            return True
+
+    def add_instructor(self, instructor):
+        with self._lock:
+            if not self._loaded:
+                self.load()
+            if self.registry.get_instructor(instructor.instructor_id) is not None:
+                return False
+            courses = list(instructor.assigned_courses)
+            for course in courses:
+                if course.instructor is instructor:
+                    course.instructor = None
+            instructor.assigned_courses = OrderedIdSet(COURSE_ID)
+            self._record({"op": "add_instructor", "data": instructor.to_dict()}, instructor)
+            for course in courses:
+                known = self.registry.get_course(course.course_id)
+                if known is not None:
+                    self.assign_course(instructor, known)
+            return True
+
+    def add_course(self, course):
+        with self._lock:
+            if not self._loaded:
+                self.load()
+            if self.registry.get_course(course.course_id) is not None:
+                return False
+            instructor = course.instructor
+            students = list(course.enrolled_students)
+            if instructor is not None:
+                instructor.assigned_courses.discard(course)
+            for student in students:
+                student.registered_courses.discard(course)
+            course.instructor = None
+            course.enrolled_students = OrderedIdSet(STUDENT_ID)
+            self._record({"op": "add_course", "data": course.to_dict()}, course)
+            if instructor is not None:
+                known = self.registry.get_instructor(instructor.instructor_id)
+                if known is not None:
+                    self.assign_course(known, course)
+            for student in students:
+                known = self.registry.get_student(student.student_id)
+                if known is not None:
+                    self.register_course(known, course)
+            return True
+
+    def register_course(self, student, course):
+        return self._record({"op": "register_course", "student_id": student.student_id, "course_id": course.course_id})
+
+    def assign_course(self, instructor, course):
+        return self._record({"op": "assign_course", "instructor_id": instructor.instructor_id, "course_id": course.course_id})
+
+    # Fold the journal into a fresh snapshot and keep only entries recorded since
+    def compact(self):
+        try:
+            with self._compacting:
+                self._compact()
+        finally:
+            if self._compaction is threading.current_thread():
+                self._compaction = None
+
+    # Thread target for compactions started by _record. A failure is printed and kept in
+    # compaction_error; the journal stays valid, and the next attempt waits until it has
+    # grown by another threshold so a failing disk is not retried on every operation.
+    def _compact_in_background(self):
+        try:
+            self.compact()
+        except (OSError, ValueError) as e:
+            with self._lock:
+                self.compaction_error = e
+                self._retry_compaction_at = self._journal_bytes + self.compact_threshold
+            print(f"Compacting {self.journal_filename} failed: {e}")
+        else:
+            self.compaction_error = None
+            self._retry_compaction_at = 0
+
+    def _compact(self):
+        with self._lock:
+            # An unloaded registry would replace the saved data with only this session's changes
+            if not self._loaded:
+                raise ValueError("The saved data was never loaded, so it cannot be compacted.")
+            registry = self.registry
+            data = {
+                "journal_seq": self.seq,
+                "students": [student.to_dict() for student in registry.students],
+                "instructors": [instructor.to_dict() for instructor in registry.instructors],
+                "courses": [course.to_dict() for course in registry.courses]
+            }
+            covered = self._journal_bytes
+        # Writing the snapshot is the slow part and runs without blocking new operations
+        write_json_atomic(data, self.filename)
+        with self._lock:
+            if self._journal is not None:
+                self._journal.close()
+                self._journal = None
+            if os.path.exists(self.journal_filename):
+                with open(self.journal_filename, 'rb') as file:
+                    file.seek(covered)
+                    tail = file.read()
+                temporary = f"{self.journal_filename}.tmp"
+                with open(temporary, 'wb') as file:
+                    file.write(tail)
+                    file.flush()
+                    os.fsync(file.fileno())
+                os.replace(temporary, self.journal_filename)
+                self._journal_bytes = len(tail)
+
+    # Wait for a running compaction and close the journal file
+    def close(self):
+        compaction = self._compaction
+        if compaction is not None:
+            compaction.join()
+        with self._lock:
+            if self._journal is not None:
+                self._journal.close()
+                self._journal = None
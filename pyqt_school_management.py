@@ -1,8 +1,162 @@
 import sys
+from PyQt5.QtCore import QAbstractListModel, QAbstractTableModel, QModelIndex, Qt
 from PyQt5.QtWidgets import (
-    QApplication, QMainWindow, QVBoxLayout, QWidget, QLabel, QLineEdit, QPushButton, QTableWidget, QTableWidgetItem, QMessageBox, QTabWidget, QComboBox, QHBoxLayout
+    QApplication, QMainWindow, QVBoxLayout, QWidget, QLabel, QLineEdit, QPushButton, QTableView, QHeaderView, QMessageBox, QTabWidget, QCompleter, QHBoxLayout
 )
-from oop_school_management import Student, Instructor, Course
+from oop_school_management import Student, Instructor, Course, SchoolRegistry, STUDENT_ID, INSTRUCTOR_ID, COURSE_ID
+
+
+# Read-only table of every student, then every instructor, then every course.
+# Rows hold the objects themselves; cell text is only built in data(), for the rows the
+# view actually paints, and changes are signalled per row instead of rebuilding the table.
+class RecordsTableModel(QAbstractTableModel):
+    HEADERS = ["Type", "Name", "ID", "Additional Info"]
+    # Sections in display order: (type label, class, id getter)
+    SECTIONS = (("Student", Student, STUDENT_ID), ("Instructor", Instructor, INSTRUCTOR_ID), ("Course", Course, COURSE_ID))
+
+    def __init__(self, registry, parent=None):
+        super().__init__(parent)
+        self._rows = ([], [], [])  # Objects per section
+        self._positions = ({}, {}, {})  # Per section: id -> index in _rows
+        self.reset(registry)
+
+    # Reload every row from the registry, e.g. after a bulk load
+    def reset(self, registry):
+        self.beginResetModel()
+        for section, items in enumerate((registry.students, registry.instructors, registry.courses)):
+            key = self.SECTIONS[section][2]
+            self._rows[section][:] = items
+            self._positions[section].clear()
+            self._positions[section].update((key(item), index) for index, item in enumerate(self._rows[section]))
+        self.endResetModel()
+
+    # Append an entity at the end of its section; emits rowsInserted for that one row
+    def add(self, item):
+        section = self._section(item)
+        row = self._offset(section) + len(self._rows[section])
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._positions[section][self.SECTIONS[section][2](item)] = len(self._rows[section])
+        self._rows[section].append(item)
+        self.endInsertRows()
+
+    # Signal that an entity's row text changed; emits dataChanged for that one row
+    def changed(self, item):
+        section = self._section(item)
+        index = self._positions[section].get(self.SECTIONS[section][2](item))
+        if index is not None:
+            row = self._offset(section) + index
+            self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1), [Qt.DisplayRole])
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else sum(map(len, self._rows))
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        row = index.row()
+        for section, items in enumerate(self._rows):
+            if row < len(items):
+                return self._cell(section, items[row], index.column())
+            row -= len(items)
+        return None
+
+    def _cell(self, section, item, column):
+        kind, cls, key = self.SECTIONS[section]
+        if column == 0:
+            return kind
+        if column == 1:
+            return item.course_name if cls is Course else item.name
+        if column == 2:
+            return key(item)
+        if cls is Student:
+            return "Courses: " + ", ".join(course.course_name for course in item.registered_courses)
+        if cls is Instructor:
+            return "Courses: " + ", ".join(course.course_name for course in item.assigned_courses)
+        return f"Instructor: {item.instructor.name if item.instructor else 'None'}"
+
+    def _section(self, item):
+        for section, (kind, cls, key) in enumerate(self.SECTIONS):
+            if isinstance(item, cls):
+                return section
+        raise TypeError(f"Not a school entity: {item!r}")
+
+    # Row number of the first row of a section
+    def _offset(self, section):
+        return sum(len(items) for items in self._rows[:section])
+
+
+# The current matches of an EntitySelector: label for display, entity id as Qt.UserRole
+class EntityMatchModel(QAbstractListModel):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._matches = []  # (label, id)
+
+    def set_matches(self, matches):
+        self.beginResetModel()
+        self._matches = matches
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._matches)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            return self._matches[index.row()][0]
+        if role == Qt.UserRole:
+            return self._matches[index.row()][1]
+        return None
+
+
+# Type-ahead replacement for a QComboBox of every student, instructor or course. Each
+# keystroke asks the registry's prefix/substring indexes for at most MAX_MATCHES
+# entities, and the completer popup shows only those. Like a QComboBox filled with
+# addItem(label, id), currentData() returns the id of the chosen entity.
+class EntitySelector(QLineEdit):
+    MAX_MATCHES = 50
+    ID_GETTERS = {"student": STUDENT_ID, "instructor": INSTRUCTOR_ID, "course": COURSE_ID}
+
+    def __init__(self, registry, kind, parent=None):
+        super().__init__(parent)
+        self.registry = registry
+        self.kind = kind  # "student", "instructor" or "course"
+        self._chosen = None  # (label, id) picked from the popup
+        self.setPlaceholderText(f"Type a {kind} name or ID")
+        self.matches = EntityMatchModel(self)
+        completer = QCompleter(self.matches, self)
+        completer.setCompletionMode(QCompleter.UnfilteredPopupCompletion)  # The model is already filtered
+        completer.setCaseSensitivity(Qt.CaseInsensitive)
+        completer.setMaxVisibleItems(15)
+        completer.activated[QModelIndex].connect(self._choose)
+        self.setCompleter(completer)
+        self.textEdited.connect(self._update_matches)
+
+    def _update_matches(self, text):
+        search = getattr(self.registry, f"search_{self.kind}s")
+        id_of = self.ID_GETTERS[self.kind]
+        self.matches.set_matches([(SchoolRegistry.label(item), id_of(item)) for item in search(text.strip(), self.MAX_MATCHES)])
+        self.completer().complete()
+
+    def _choose(self, index):
+        self._chosen = (index.data(Qt.DisplayRole), index.data(Qt.UserRole))
+
+    # Id of the selected entity: the one picked from the popup, or one whose
+    # label or id was typed in full; None if the text matches neither
+    def currentData(self):
+        text = self.text().strip()
+        if self._chosen and self._chosen[0] == text:
+            return self._chosen[1]
+        entity = getattr(self.registry, f"get_{self.kind}")(text) or getattr(self.registry, f"resolve_{self.kind}")(text)
+        return None if entity is None else self.ID_GETTERS[self.kind](entity)
 
 
 class SchoolManagementSystemQt(QMainWindow):
@@ -11,10 +165,8 @@ class SchoolManagementSystemQt(QMainWindow):
         self.setWindowTitle("School Management System")
         self.setGeometry(100, 100, 1000, 600)
 
-        # Data storage (in memory for now)
-        self.students = []
-        self.instructors = []
-        self.courses = []
+        # Data storage (in memory for now), indexed by id and name
+        self.registry = SchoolRegistry()
 
         # Main layout
         self.tabs = QTabWidget()
@@ -62,8 +214,8 @@ class SchoolManagementSystemQt(QMainWindow):
         # Assign student to course layout
         assign_layout = QHBoxLayout()
 
-        self.student_dropdown = QComboBox()
-        self.course_dropdown_student = QComboBox()  # This is for the course selection in the student form
+        self.student_dropdown = EntitySelector(self.registry, "student")
+        self.course_dropdown_student = EntitySelector(self.registry, "course")  # This is for the course selection in the student form
 
         self.assign_student_btn = QPushButton("Assign Student to Course")
         self.assign_student_btn.clicked.connect(self.assign_student_to_course)
@@ -102,8 +254,8 @@ class SchoolManagementSystemQt(QMainWindow):
         layout.addWidget(self.add_instructor_btn)
 
         # Assign instructor to course layout
-        self.instructor_dropdown = QComboBox()
-        self.course_dropdown_instructor = QComboBox()  # Adding course dropdown for instructor
+        self.instructor_dropdown = EntitySelector(self.registry, "instructor")
+        self.course_dropdown_instructor = EntitySelector(self.registry, "course")  # Adding course dropdown for instructor
 
         self.assign_instructor_btn = QPushButton("Assign Instructor to Course")
         self.assign_instructor_btn.clicked.connect(self.assign_instructor_to_course)
@@ -145,10 +297,14 @@ class SchoolManagementSystemQt(QMainWindow):
         self.course_tab.setLayout(layout)
 
     def create_table(self):
-        self.table = QTableWidget()
-        self.table.setColumnCount(4)
-        self.table.setHorizontalHeaderLabels(["Type", "Name", "ID", "Additional Info"])
-        self.table.setEditTriggers(QTableWidget.NoEditTriggers)  # Make the table read-only
+        self.records = RecordsTableModel(self.registry)
+        self.table = QTableView()
+        self.table.setModel(self.records)  # The model is read-only
+        # Fixed row heights and column widths, so the view never measures every row
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+        self.table.horizontalHeader().setStretchLastSection(True)
+        self.table.setWordWrap(False)
         self.tabs.addTab(self.table, "All Records")
 
         # Add refresh button styled as a button
@@ -162,12 +318,13 @@ class SchoolManagementSystemQt(QMainWindow):
         student_id = self.student_id_input.text()
         if name and student_id:
             student = Student(name, 20, "student@example.com", student_id)
-            self.students.append(student)
-            self.student_dropdown.addItem(student.name)
+            if not self.registry.add_student(student):
+                QMessageBox.warning(self, "Input Error", f"Student ID {student_id} already exists.")
+                return
             QMessageBox.information(self, "Success", f"Student {name} added successfully.")
             self.student_name_input.clear()
             self.student_id_input.clear()
-            self.refresh_table()
+            self.records.add(student)
         else:
             QMessageBox.warning(self, "Input Error", "Please enter all fields.")
 
@@ -177,12 +334,13 @@ class SchoolManagementSystemQt(QMainWindow):
         instructor_id = self.instructor_id_input.text()
         if name and instructor_id:
             instructor = Instructor(name, 30, "instructor@example.com", instructor_id)
-            self.instructors.append(instructor)
-            self.instructor_dropdown.addItem(instructor.name)
+            if not self.registry.add_instructor(instructor):
+                QMessageBox.warning(self, "Input Error", f"Instructor ID {instructor_id} already exists.")
+                return
             QMessageBox.information(self, "Success", f"Instructor {name} added successfully.")
             self.instructor_name_input.clear()
             self.instructor_id_input.clear()
-            self.refresh_table()
+            self.records.add(instructor)
         else:
             QMessageBox.warning(self, "Input Error", "Please enter all fields.")
 
@@ -192,74 +350,43 @@ class SchoolManagementSystemQt(QMainWindow):
         course_id = self.course_id_input.text()
         if name and course_id:
             course = Course(course_id, name)
-            self.courses.append(course)
-            self.course_dropdown_student.addItem(course.course_name)  # Add course to student section dropdown
-            self.course_dropdown_instructor.addItem(course.course_name)  # Add course to instructor section dropdown
+            if not self.registry.add_course(course):
+                QMessageBox.warning(self, "Input Error", f"Course ID {course_id} already exists.")
+                return
             QMessageBox.information(self, "Success", f"Course {name} added successfully.")
             self.course_name_input.clear()
             self.course_id_input.clear()
-            self.refresh_table()
+            self.records.add(course)
         else:
             QMessageBox.warning(self, "Input Error", "Please enter all fields.")
 
     # Assign Student to Course
     def assign_student_to_course(self):
-        student_name = self.student_dropdown.currentText()
-        course_name = self.course_dropdown_student.currentText()
-        student = next((s for s in self.students if s.name == student_name), None)
-        course = next((c for c in self.courses if c.course_name == course_name), None)
+        # The selectors return the id of the chosen entity
+        student = self.registry.get_student(self.student_dropdown.currentData())
+        course = self.registry.get_course(self.course_dropdown_student.currentData())
         if student and course:
             student.register_course(course)
-            QMessageBox.information(self, "Success", f"Student {student_name} assigned to {course_name}.")
-            self.refresh_table()
+            self.records.changed(student)
+            QMessageBox.information(self, "Success", f"Student {student.name} assigned to {course.course_name}.")
         else:
             QMessageBox.warning(self, "Error", "Invalid student or course selection.")
 
     # Assign Instructor to Course
     def assign_instructor_to_course(self):
-        instructor_name = self.instructor_dropdown.currentText()
-        course_name = self.course_dropdown_instructor.currentText()
-        instructor = next((i for i in self.instructors if i.name == instructor_name), None)
-        course = next((c for c in self.courses if c.course_name == course_name), None)
+        instructor = self.registry.get_instructor(self.instructor_dropdown.currentData())
+        course = self.registry.get_course(self.course_dropdown_instructor.currentData())
         if instructor and course:
             instructor.assign_course(course)
-            QMessageBox.information(self, "Success", f"Instructor {instructor_name} assigned to {course_name}.")
-            self.refresh_table()
+            self.records.changed(instructor)
+            self.records.changed(course)  # The course row shows its instructor
+            QMessageBox.information(self, "Success", f"Instructor {instructor.name} assigned to {course.course_name}.")
         else:
             QMessageBox.warning(self, "Error", "Invalid instructor or course selection.")
 
-    # Refresh the table
+    # Refresh the table: reload every row from the registry
     def refresh_table(self):
-        # Step 1: Clear the table before inserting new rows
-        self.table.setRowCount(0)
-
-        # Step 2: Populate students
-        for student in self.students:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            self.table.setItem(row, 0, QTableWidgetItem("Student"))
-            self.table.setItem(row, 1, QTableWidgetItem(student.name))
-            self.table.setItem(row, 2, QTableWidgetItem(student.student_id))
-            self.table.setItem(row, 3, QTableWidgetItem(f"Courses: {[course.course_name for course in student.registered_courses]}"))
-
-        # Step 3: Populate instructors
-        for instructor in self.instructors:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            self.table.setItem(row, 0, QTableWidgetItem("Instructor"))
-            self.table.setItem(row, 1, QTableWidgetItem(instructor.name))
-            self.table.setItem(row, 2, QTableWidgetItem(instructor.instructor_id))
-            self.table.setItem(row, 3, QTableWidgetItem(f"Courses: {[course.course_name for course in instructor.assigned_courses]}"))
-
-        # Step 4: Populate courses
-        for course in self.courses:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            self.table.setItem(row, 0, QTableWidgetItem("Course"))
-            self.table.setItem(row, 1, QTableWidgetItem(course.course_name))
-            self.table.setItem(row, 2, QTableWidgetItem(course.course_id))
-            self.table.setItem(row, 3, QTableWidgetItem(f"Instructor: {course.instructor.name if course.instructor else 'None'}"))
-
+        self.records.reset(self.registry)
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
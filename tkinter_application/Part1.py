@@ -1,8 +1,50 @@
 import csv
+import io
 import json
+import multiprocessing
 import os
+import re
+import sys
+import zipfile
+from bisect import bisect_right
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from email.utils import parseaddr
 
+# Addresses of this shape are always accepted by parseaddr, so they skip the slower parse.
+SIMPLE_EMAIL = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9-]+(?:\.[A-Za-z0-9-]+)*")
+# A whole column of such addresses, each followed by a newline, checked in one match.
+SIMPLE_EMAIL_COLUMN = re.compile(r"(?:[A-Za-z0-9._%+-]+@[A-Za-z0-9-]+(?:\.[A-Za-z0-9-]+)*\n)*")
+
+
+def is_valid_email(email) -> bool:
+    """
+    Checks an email address the way Person.validate_email does.
+
+    Parameters:
+    ----------
+    email : str
+        The email address to check.
+
+    Returns:
+    -------
+    bool
+        True if the address is accepted.
+    """
+    if not isinstance(email, str):
+        return False
+    if SIMPLE_EMAIL.fullmatch(email):
+        return True
+    address = parseaddr(email)[1]
+    return bool(address) and "@" in address
+
+
+def _intern(value):
+    """
+    Interns a string so that equal values share one object; other values are returned as is.
+    """
+    return sys.intern(value) if isinstance(value, str) else value
+
 
 class Person:
     """
@@ -25,8 +67,15 @@ class Person:
         Validates the person's age, ensuring it is non-negative.
     validate_email(email: str):
         Validates the email format.
+    to_dict():
+        Returns the person's fields as a dict.
+    from_dict(data: dict):
+        Creates a person from a dict produced by to_dict.
     """
 
+    # Instances store their fields in slots instead of a per-instance __dict__.
+    __slots__ = ("name", "age", "_email")
+
     def __init__(self, name: str, age: int, email: str):
         """
         Constructs all the necessary attributes for the Person object.
@@ -50,6 +99,36 @@ class Person:
         """
         print(f"Hi, my name is {self.name}, I am {self.age} years old.")
 
+    def to_dict(self):
+        """
+        Returns the person's fields as a dict.
+
+        Returns:
+        -------
+        dict
+            The name, age and email.
+        """
+        return {"name": self.name, "age": self.age, "email": self.email}
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        """
+        Creates a person from a dict produced by to_dict.
+
+        The age may be given as a string, as read from a CSV file.
+
+        Parameters:
+        ----------
+        data : dict
+            The person's fields.
+
+        Returns:
+        -------
+        Person
+            The new person.
+        """
+        return cls(data["name"], int(data["age"]), data["email"])
+
     @property
     def email(self):
         """Gets the email address of the person."""
@@ -109,8 +188,7 @@ class Person:
         ValueError:
             If the email format is invalid.
         """
-        address = parseaddr(email)[1]
-        if not address or "@" not in address:
+        if not is_valid_email(email):
             raise ValueError("Invalid email format.")
         return email
 
@@ -130,8 +208,14 @@ class Student(Person):
     -------
     register_course(course: Course):
         Registers a student for a course.
+    to_dict():
+        Returns the student's fields, with registered courses as course IDs.
+    from_dict(data: dict):
+        Creates a student from a dict produced by to_dict.
     """
 
+    __slots__ = ("student_id", "registered_courses")
+
     def __init__(self, name: str, age: int, _email: str, student_id: str):
         """
         Constructs all the necessary attributes for the Student object.
@@ -170,6 +254,41 @@ class Student(Person):
         else:
             raise TypeError("Only Course objects can be added.")
 
+    def to_dict(self):
+        """
+        Returns the student's fields as a dict.
+
+        Returns:
+        -------
+        dict
+            The student ID, name, age, email and the IDs of the registered courses.
+        """
+        return {
+            "student_id": self.student_id,
+            **super().to_dict(),
+            "registered_courses": [course.course_id for course in self.registered_courses],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        """
+        Creates a student from a dict produced by to_dict.
+
+        Registered courses are not restored, since they refer to Course objects; register
+        them afterwards with register_course.
+
+        Parameters:
+        ----------
+        data : dict
+            The student's fields.
+
+        Returns:
+        -------
+        Student
+            The new student.
+        """
+        return cls(data["name"], int(data["age"]), data["email"], data["student_id"])
+
 
 class Instructor(Person):
     """
@@ -186,8 +305,14 @@ class Instructor(Person):
     -------
     assign_course(course: Course):
         Assigns a course to the instructor.
+    to_dict():
+        Returns the instructor's fields, with assigned courses as course IDs.
+    from_dict(data: dict):
+        Creates an instructor from a dict produced by to_dict.
     """
 
+    __slots__ = ("instructor_id", "assigned_courses")
+
     def __init__(self, name: str, age: int, _email: str, instructor_id: str):
         """
         Constructs all the necessary attributes for the Instructor object.
@@ -226,6 +351,41 @@ class Instructor(Person):
         else:
             raise TypeError("Only Course objects can be added.")
 
+    def to_dict(self):
+        """
+        Returns the instructor's fields as a dict.
+
+        Returns:
+        -------
+        dict
+            The instructor ID, name, age, email and the IDs of the assigned courses.
+        """
+        return {
+            "instructor_id": self.instructor_id,
+            **super().to_dict(),
+            "assigned_courses": [course.course_id for course in self.assigned_courses],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        """
+        Creates an instructor from a dict produced by to_dict.
+
+        Assigned courses are not restored, since they refer to Course objects; assign
+        them afterwards with assign_course.
+
+        Parameters:
+        ----------
+        data : dict
+            The instructor's fields.
+
+        Returns:
+        -------
+        Instructor
+            The new instructor.
+        """
+        return cls(data["name"], int(data["age"]), data["email"], data["instructor_id"])
+
 
 class Course:
     """
@@ -246,8 +406,14 @@ class Course:
     -------
     add_student(student: Student):
         Adds a student to the course.
+    to_dict():
+        Returns the course's fields, with the instructor and students as IDs.
+    from_dict(data: dict, instructor: Instructor = None):
+        Creates a course from a dict produced by to_dict.
     """
 
+    __slots__ = ("course_id", "course_name", "instructor", "enrolled_students")
+
     def __init__(self, course_id: str, course_name: str, instructor: "Instructor"):
         """
         Constructs all the necessary attributes for the Course object.
@@ -268,8 +434,9 @@ class Course:
         """
         if instructor is not None and not isinstance(instructor, Instructor):
             raise TypeError("Instructor must be an instance of Instructor class.")
-        self.course_id = course_id
-        self.course_name = course_name
+        # Course IDs and names repeat across many records, so equal values share one string.
+        self.course_id = _intern(course_id)
+        self.course_name = _intern(course_name)
         self.instructor = instructor
         self.enrolled_students = []
 
@@ -292,10 +459,267 @@ class Course:
         else:
             raise TypeError("Only Student objects can be added.")
 
+    def to_dict(self):
+        """
+        Returns the course's fields as a dict.
+
+        Returns:
+        -------
+        dict
+            The course ID and name, the instructor's ID (or None) and the IDs of the
+            enrolled students.
+        """
+        return {
+            "course_id": self.course_id,
+            "course_name": self.course_name,
+            "instructor_id": self.instructor.instructor_id if self.instructor else None,
+            "enrolled_students": [student.student_id for student in self.enrolled_students],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict, instructor: "Instructor" = None):
+        """
+        Creates a course from a dict produced by to_dict.
+
+        Enrolled students are not restored, since they refer to Student objects; add
+        them afterwards with add_student.
+
+        Parameters:
+        ----------
+        data : dict
+            The course's fields.
+        instructor : Instructor, optional
+            The instructor named by the dict's instructor_id, if it should be linked.
+
+        Returns:
+        -------
+        Course
+            The new course.
+        """
+        return cls(data["course_id"], data["course_name"], instructor)
+
+
+class BatchValidator:
+    """
+    A class to validate imported student or instructor records in column batches.
+
+    Records are split into batches, and each batch into its id, name, age and email
+    columns, which are checked with the same rules as Person without building a model
+    object per row. Rows that fail are left out and every problem is collected, so a
+    file with bad rows is imported without them instead of aborting on the first one.
+    Batches can be fanned out to a process pool for very large files.
+
+    Attributes:
+    ----------
+    id_field : str
+        the record field holding the ID, "student_id" or "instructor_id"
+    errors : list
+        ``(row_number, key, message)`` for every rejected row, with row numbers
+        counted from 0 over all records given to validate
+
+    Methods:
+    -------
+    validate(records):
+        Yields the valid records as ``(id, name, age, email)`` tuples.
+    validate_columns(start, ids, names, ages, emails):
+        Checks one batch of columns.
+    input_row(valid_row):
+        Maps the position of a valid row to its position in the input.
+    merge_into(report):
+        Adds the rejected rows to a bulk insert report.
+    """
+
+    def __init__(self, id_field: str, batch_size: int = 10000, processes: int = 0):
+        """
+        Constructs a validator with no errors.
+
+        Parameters:
+        ----------
+        id_field : str
+            The record field holding the ID.
+        batch_size : int, optional
+            Records per batch. Defaults to 10000.
+        processes : int, optional
+            Worker processes to validate batches in, or 0 to validate in the calling
+            process. Defaults to 0.
+        """
+        self.id_field = id_field
+        self.batch_size = batch_size
+        self.processes = processes
+        self.errors = []
+        # For every rejected row, in input order, the number of valid rows before it.
+        self._valid_before = []
+
+    def validate(self, records):
+        """
+        Validates records and yields the valid ones, in input order.
+
+        Parameters:
+        ----------
+        records : iterable of dict
+            Records with the ID field and "name", "age" and "email".
+
+        Yields:
+        ------
+        tuple
+            ``(id, name, age, email)`` with the age converted to int.
+        """
+        batches = self._columns(records)
+        if not self.processes:
+            results = (self.validate_columns(*batch) for batch in batches)
+        else:
+            results = self._validate_in_pool(batches)
+        for rows, errors in results:
+            for error in errors:
+                self._valid_before.append(error[0] - len(self._valid_before))
+                self.errors.append(error)
+            yield from rows
+
+    def _columns(self, records):
+        """
+        Splits records into batches of ``(start, ids, names, ages, emails)`` columns.
+        """
+        start = 0
+        batch = []
+        for record in records:
+            batch.append(record)
+            if len(batch) == self.batch_size:
+                yield self._split(start, batch)
+                start += len(batch)
+                batch = []
+        if batch:
+            yield self._split(start, batch)
+
+    def _split(self, start, batch):
+        """
+        Transposes a batch of records into columns; missing fields become None.
+        """
+        return (
+            start,
+            [record.get(self.id_field) for record in batch],
+            [record.get("name") for record in batch],
+            [record.get("age") for record in batch],
+            [record.get("email") for record in batch],
+        )
+
+    def _validate_in_pool(self, batches):
+        """
+        Validates batches in worker processes, keeping a bounded number in flight so
+        memory stays constant, and yields the results in input order.
+        """
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(self.processes, mp_context=context) as pool:
+            pending = deque()
+            for batch in batches:
+                pending.append(pool.submit(BatchValidator.validate_columns, *batch))
+                if len(pending) >= 2 * self.processes:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    @staticmethod
+    def validate_columns(start, ids, names, ages, emails):
+        """
+        Checks one batch of columns.
+
+        Parameters:
+        ----------
+        start : int
+            The row number of the first row in the batch.
+        ids, names, ages, emails : list
+            The batch's columns.
+
+        Returns:
+        -------
+        tuple
+            The valid rows as ``(id, name, age, email)`` tuples, and
+            ``(row_number, key, message)`` for every invalid row, where the message lists
+            all of the row's problems.
+        """
+        problems = {}
+        for index, value in enumerate(ids):
+            if not value:
+                problems.setdefault(index, []).append("ID is required.")
+
+        # Clean columns are checked with one C-level call each; only a column that has
+        # a problem somewhere is walked value by value.
+        try:
+            converted = list(map(int, ages))
+        except (TypeError, ValueError):
+            converted = []
+            for index, value in enumerate(ages):
+                try:
+                    converted.append(int(value))
+                except (TypeError, ValueError):
+                    problems.setdefault(index, []).append("Age must be an integer.")
+                    converted.append(None)
+        if min((age for age in converted if age is not None), default=0) < 0:
+            for index, age in enumerate(converted):
+                if age is not None and age < 0:
+                    problems.setdefault(index, []).append("Age cannot be negative.")
+
+        try:
+            column = "\n".join(emails) + "\n"
+            clean = column.count("\n") == len(emails) and SIMPLE_EMAIL_COLUMN.fullmatch(column) is not None
+        except TypeError:
+            clean = False
+        if not clean:
+            for index, value in enumerate(emails):
+                if not is_valid_email(value):
+                    problems.setdefault(index, []).append("Invalid email format.")
+
+        if problems:
+            rows = [
+                (ids[index], names[index], converted[index], emails[index])
+                for index in range(len(ids))
+                if index not in problems
+            ]
+        else:
+            rows = list(zip(ids, names, converted, emails))
+        errors = [
+            (start + index, str(ids[index]), " ".join(messages))
+            for index, messages in sorted(problems.items())
+        ]
+        return rows, errors
+
+    def input_row(self, valid_row: int) -> int:
+        """
+        Maps the position of a row among the valid rows to its position in the input.
+
+        Every rejected row with no more valid rows before it than ``valid_row`` comes
+        before it in the input, so a binary search gives the offset.
+
+        Parameters:
+        ----------
+        valid_row : int
+            The row number among the rows yielded by validate.
+
+        Returns:
+        -------
+        int
+            The row number among all records given to validate.
+        """
+        return valid_row + bisect_right(self._valid_before, valid_row)
+
+    def merge_into(self, report):
+        """
+        Adds the rejected rows to the report of a bulk insert fed by validate.
+
+        The report's own failures are renumbered to input rows, so every failure refers
+        to the record's position in the original input.
+
+        Parameters:
+        ----------
+        report : BulkInsertReport
+            The report of the bulk insert.
+        """
+        failures = [(self.input_row(row), key, error) for row, key, error in report.failures]
+        report.failures = sorted(failures + self.errors)
+
 
 class DataManagement:
     """
-    A class to manage data saving and loading in JSON and CSV formats.
+    A class to manage data saving and loading in JSON, JSON Lines, CSV and CSV bundle formats.
 
     Methods:
     -------
@@ -305,18 +729,41 @@ class DataManagement:
         Loads data from a JSON or CSV file.
     save_to_json(data, filename):
         Saves data to a JSON file.
+    to_serializable(data):
+        Converts model objects within lists and dicts to plain dicts.
     load_from_json(filename):
         Loads data from a JSON file.
+    save_to_ndjson(records, filename):
+        Streams (type, record) pairs to a JSON Lines file.
+    iter_ndjson(filename):
+        Yields (type, record) pairs from a JSON Lines file, one line at a time.
     save_to_csv(data, filename):
         Saves data to a CSV file.
     load_from_csv(filename):
         Loads data from a CSV file.
+    save_to_csv_bundle(tables, path):
+        Streams several tables to a zip file or directory with one CSV per table.
+    load_csv_bundle_manifest(path):
+        Reads the manifest of a CSV bundle.
+    iter_csv_bundle(path):
+        Yields each table of a CSV bundle with a streaming row iterator.
     """
 
+    # File extensions handled as JSON Lines (one JSON object per line).
+    NDJSON_EXTENSIONS = (".ndjson", ".jsonl")
+
+    # Name of the file describing the tables in a CSV bundle.
+    BUNDLE_MANIFEST = "manifest.json"
+    BUNDLE_FORMAT = "csv-bundle"
+    BUNDLE_VERSION = 1
+
     @staticmethod
     def save_data(data, filename):
         """
-        Saves the data to the specified file in either JSON or CSV format.
+        Saves the data to the specified file in JSON, JSON Lines or CSV format.
+
+        A dict of tables can also be saved as a CSV bundle by passing a ``.zip`` file or
+        an existing directory.
 
         Parameters:
         ----------
@@ -328,20 +775,38 @@ class DataManagement:
         Raises:
         ------
         ValueError:
-            If the file format is not supported (only JSON and CSV are supported).
+            If the file format is not supported (only JSON, JSON Lines, CSV and CSV bundles
+            are supported).
         """
         ext = os.path.splitext(filename)[1].lower()
-        if ext == ".json":
+        if ext == ".zip" or os.path.isdir(filename):
+            DataManagement.save_to_csv_bundle(
+                (
+                    (name, list(rows[0].keys()) if rows else [], (list(row.values()) for row in rows))
+                    for name, rows in data.items()
+                ),
+                filename,
+            )
+        elif ext == ".json":
             DataManagement.save_to_json(data, filename)
+        elif ext in DataManagement.NDJSON_EXTENSIONS:
+            DataManagement.save_to_ndjson(
+                ((record_type, record) for record_type, records in data.items() for record in records),
+                filename,
+            )
         elif ext == ".csv":
             DataManagement.save_to_csv(data, filename)
         else:
-            raise ValueError("Unsupported file type. Only JSON and CSV are supported.")
+            raise ValueError("Unsupported file type. Only JSON, JSON Lines, CSV and CSV bundles are supported.")
 
     @staticmethod
     def load_data(filename):
         """
-        Loads data from the specified file in either JSON or CSV format.
+        Loads data from the specified file in JSON, JSON Lines or CSV format.
+
+        JSON Lines files and CSV bundles (a ``.zip`` file or a directory) are returned as a
+        dict mapping each record type to its list of records. Use iter_ndjson or
+        iter_csv_bundle instead to read them without holding every record in memory.
 
         Parameters:
         ----------
@@ -351,7 +816,8 @@ class DataManagement:
         Raises:
         ------
         ValueError:
-            If the file format is not supported (only JSON and CSV are supported).
+            If the file format is not supported (only JSON, JSON Lines, CSV and CSV bundles
+            are supported).
 
         Returns:
         -------
@@ -359,27 +825,63 @@ class DataManagement:
             The loaded data.
         """
         ext = os.path.splitext(filename)[1].lower()
-        if ext == ".json":
+        if ext == ".zip" or os.path.isdir(filename):
+            return {
+                name: [dict(zip(columns, row)) for row in rows]
+                for name, columns, rows in DataManagement.iter_csv_bundle(filename)
+            }
+        elif ext == ".json":
             return DataManagement.load_from_json(filename)
+        elif ext in DataManagement.NDJSON_EXTENSIONS:
+            data = {}
+            for record_type, record in DataManagement.iter_ndjson(filename):
+                data.setdefault(record_type, []).append(record)
+            return data
         elif ext == ".csv":
             return DataManagement.load_from_csv(filename)
         else:
-            raise ValueError("Unsupported file type. Only JSON and CSV are supported.")
+            raise ValueError("Unsupported file type. Only JSON, JSON Lines, CSV and CSV bundles are supported.")
 
     @staticmethod
     def save_to_json(data, filename):
         """
         Saves data to a JSON file.
 
+        Model objects are written through their to_dict method, also when nested in lists
+        or dicts, e.g. a dict mapping each record type to its records.
+
         Parameters:
         ----------
-        data : list
+        data : list or dict
             The data to be saved.
         filename : str
             The file to save the data to.
         """
         with open(filename, "w") as file:
-            json.dump([obj.__dict__ for obj in data], file, indent=4)
+            json.dump(DataManagement.to_serializable(data), file, indent=4)
+
+    @staticmethod
+    def to_serializable(data):
+        """
+        Converts model objects within lists and dicts to plain dicts with to_dict.
+
+        Parameters:
+        ----------
+        data : object
+            A model object, or a list or dict that may contain model objects.
+
+        Returns:
+        -------
+        object
+            The data with every model object replaced by its dict.
+        """
+        if hasattr(data, "to_dict"):
+            return data.to_dict()
+        if isinstance(data, dict):
+            return {key: DataManagement.to_serializable(value) for key, value in data.items()}
+        if isinstance(data, (list, tuple)):
+            return [DataManagement.to_serializable(value) for value in data]
+        return data
 
     @staticmethod
     def load_from_json(filename):
@@ -399,6 +901,70 @@ class DataManagement:
         with open(filename, "r") as file:
             return json.load(file)
 
+    @staticmethod
+    def save_to_ndjson(records, filename):
+        """
+        Streams records to a JSON Lines file, one object per line.
+
+        Each line holds the record's fields plus a "type" tag, e.g.
+        ``{"type": "students", "student_id": "S1", ...}``. Records are written as they are
+        produced, so a generator reading from a database cursor is written in constant memory.
+
+        Parameters:
+        ----------
+        records : iterable of (str, dict)
+            The record type and the record's fields.
+        filename : str
+            The file to save the data to.
+
+        Returns:
+        -------
+        int
+            The number of records written.
+        """
+        count = 0
+        with open(filename, "w", encoding="utf-8") as file:
+            for record_type, record in records:
+                file.write(json.dumps({"type": record_type, **record}, separators=(",", ":")))
+                file.write("\n")
+                count += 1
+        return count
+
+    @staticmethod
+    def iter_ndjson(filename):
+        """
+        Reads a JSON Lines file one line at a time.
+
+        Blank lines are skipped. Only the current line is held in memory, so the records
+        can be piped into a bulk insert without loading the whole file.
+
+        Parameters:
+        ----------
+        filename : str
+            The file to load the data from.
+
+        Raises:
+        ------
+        ValueError:
+            If a line is not a JSON object with a "type" tag.
+
+        Yields:
+        ------
+        (str, dict)
+            The record type and the record's remaining fields.
+        """
+        with open(filename, "r", encoding="utf-8") as file:
+            for line_number, line in enumerate(file, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError as e:
+                    raise ValueError(f"Line {line_number}: invalid JSON ({e.msg}).") from e
+                if not isinstance(record, dict) or "type" not in record:
+                    raise ValueError(f"Line {line_number}: expected an object with a \"type\" field.")
+                yield record.pop("type"), record
+
     @staticmethod
     def save_to_csv(data, filename):
         """
@@ -442,3 +1008,135 @@ class DataManagement:
         with open(filename, "r") as file:
             reader = csv.DictReader(file)
             return list(reader)
+
+    @staticmethod
+    def save_to_csv_bundle(tables, path):
+        """
+        Streams several tables to a CSV bundle: one CSV file per table plus a manifest.
+
+        If ``path`` ends in ``.zip`` the bundle is written as a zip archive, otherwise as a
+        directory. Rows are written as they are produced, so tables read from database
+        cursors are exported in constant memory. The manifest, written last, records each
+        table's file, columns and row count.
+
+        Parameters:
+        ----------
+        tables : iterable of (str, list of str, iterable of sequence)
+            The name, column names and rows of each table.
+        path : str
+            The zip file or directory to write.
+
+        Returns:
+        -------
+        dict
+            The manifest that was written.
+        """
+        manifest = {
+            "format": DataManagement.BUNDLE_FORMAT,
+            "version": DataManagement.BUNDLE_VERSION,
+            "tables": [],
+        }
+
+        def write_table(file, name, columns, rows):
+            writer = csv.writer(file)
+            writer.writerow(columns)
+            count = 0
+            for row in rows:
+                writer.writerow(row)
+                count += 1
+            manifest["tables"].append(
+                {"name": name, "file": f"{name}.csv", "columns": list(columns), "rows": count}
+            )
+
+        if path.lower().endswith(".zip"):
+            with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+                for name, columns, rows in tables:
+                    with archive.open(f"{name}.csv", "w", force_zip64=True) as raw:
+                        with io.TextIOWrapper(raw, encoding="utf-8", newline="") as file:
+                            write_table(file, name, columns, rows)
+                archive.writestr(DataManagement.BUNDLE_MANIFEST, json.dumps(manifest, indent=4))
+        else:
+            os.makedirs(path, exist_ok=True)
+            for name, columns, rows in tables:
+                with open(os.path.join(path, f"{name}.csv"), "w", encoding="utf-8", newline="") as file:
+                    write_table(file, name, columns, rows)
+            with open(os.path.join(path, DataManagement.BUNDLE_MANIFEST), "w", encoding="utf-8") as file:
+                json.dump(manifest, file, indent=4)
+        return manifest
+
+    @staticmethod
+    def load_csv_bundle_manifest(path):
+        """
+        Reads the manifest of a CSV bundle.
+
+        Parameters:
+        ----------
+        path : str
+            The zip file or directory of the bundle.
+
+        Raises:
+        ------
+        ValueError:
+            If the manifest is missing or is not a CSV bundle manifest.
+
+        Returns:
+        -------
+        dict
+            The manifest, with a "tables" list of name, file, columns and row count.
+        """
+        try:
+            if path.lower().endswith(".zip"):
+                with zipfile.ZipFile(path) as archive:
+                    manifest = json.loads(archive.read(DataManagement.BUNDLE_MANIFEST))
+            else:
+                with open(os.path.join(path, DataManagement.BUNDLE_MANIFEST), encoding="utf-8") as file:
+                    manifest = json.load(file)
+        except (KeyError, FileNotFoundError) as e:
+            raise ValueError(f"{path} is not a CSV bundle: no {DataManagement.BUNDLE_MANIFEST}.") from e
+        if not isinstance(manifest, dict) or manifest.get("format") != DataManagement.BUNDLE_FORMAT:
+            raise ValueError(f"{path} is not a CSV bundle: unexpected manifest.")
+        if manifest.get("version", 0) > DataManagement.BUNDLE_VERSION:
+            raise ValueError(f"CSV bundle version {manifest['version']} is not supported.")
+        return manifest
+
+    @staticmethod
+    def iter_csv_bundle(path):
+        """
+        Reads a CSV bundle table by table, in manifest order.
+
+        Each table's rows are read lazily with ``csv.reader``, so they can be piped into a
+        bulk insert in constant memory. A table's rows must be consumed before moving on
+        to the next table. Values are returned as strings; empty fields stand for None.
+
+        Parameters:
+        ----------
+        path : str
+            The zip file or directory of the bundle.
+
+        Raises:
+        ------
+        ValueError:
+            If the manifest is invalid or a file's header does not match it.
+
+        Yields:
+        ------
+        (str, list of str, iterator of list)
+            The name, column names and rows of each table.
+        """
+        manifest = DataManagement.load_csv_bundle_manifest(path)
+        archive = zipfile.ZipFile(path) if path.lower().endswith(".zip") else None
+        try:
+            for table in manifest["tables"]:
+                if archive is not None:
+                    file = io.TextIOWrapper(archive.open(table["file"]), encoding="utf-8", newline="")
+                else:
+                    file = open(os.path.join(path, table["file"]), encoding="utf-8", newline="")
+                with file:
+                    reader = csv.reader(file)
+                    header = next(reader, [])
+                    if header != table["columns"]:
+                        raise ValueError(f"{table['file']}: header does not match the manifest.")
+                    yield table["name"], header, ([value or None for value in row] for row in reader)
+        finally:
+            if archive is not None:
+                archive.close()
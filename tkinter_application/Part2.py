@@ -4,9 +4,11 @@ School Management System Application
 This module implements a comprehensive School Management System using Tkinter for the GUI.
 It allows users to manage students, instructors, courses, and registrations. The system
 supports adding, editing, deleting, searching, and assigning instructors to courses. Data
-can be saved to and loaded from JSON or CSV files.
+can be saved to and loaded from JSON, JSON Lines or CSV files.
 
 Classes:
+    VirtualTreeview: A virtual-scrolling adapter that pages rows into a ttk.Treeview.
+    TypeAheadCombobox: A combobox that looks its options up by prefix as the user types.
     SchoolManagementSystem: The main application frame containing the GUI components.
     AddStudent: A window to add a new student to the system.
     AddInstructor: A window to add a new instructor to the system.
@@ -16,17 +18,402 @@ Classes:
     EditStudent: A window to edit an existing student's information.
     EditInstructor: A window to edit an existing instructor's information.
     EditCourse: A window to edit an existing course's information.
+    DiagnosticsWindow: A window showing query statistics and the slow-query log.
 
 Functions:
     main: Initializes and starts the School Management System application.
 """
 
+import bisect
+import os
 import tkinter as tk
+from collections import deque
+from itertools import groupby
+from operator import itemgetter
 from tkinter import Button, Frame, Menu, Toplevel, filedialog, messagebox, ttk
 from typing import List
 
-from Part1 import Course, DataManagement, Instructor, Student
-from Part4 import Database
+from Part1 import BatchValidator, Course, DataManagement, Instructor, Student
+from Part4 import Database, DatabaseWorker, JobCancelled, QueryInstrumentation
+
+
+class VirtualTreeview:
+    """
+    A virtual-scrolling adapter around a ttk.Treeview.
+
+    Rows are pulled from a page source as the user scrolls and only a window of
+    ``max_pages`` pages is kept in the widget. Pages that scroll far out of view are
+    dropped and fetched again, with keyset pagination, when the user scrolls back.
+    Each item's iid is the row's primary key (its first column).
+    """
+
+    # Fraction of the scroll range from either end at which the next page is loaded.
+    SCROLL_THRESHOLD = 0.1
+
+    def __init__(self, treeview, page_size=100, max_pages=3, format_row=None, hidden_key=False, fetch_row=None):
+        """
+        Initialize the adapter and attach a vertical scrollbar to the treeview.
+
+        Args:
+            treeview (ttk.Treeview): The treeview to fill. It must already be packed.
+            page_size (int, optional): Rows fetched per page. Defaults to 100.
+            max_pages (int, optional): Pages kept in the widget at once. Defaults to 3.
+            format_row (callable, optional): Maps a row to the values shown in the treeview.
+            hidden_key (bool, optional): If True, the first column is used as the key but
+                not displayed. Defaults to False.
+            fetch_row (callable, optional): Returns the current row for a primary key, or
+                None if it no longer exists. Needed by apply and refresh_matching.
+        """
+        self.tree = treeview
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self.format_row = format_row
+        self.hidden_key = hidden_key
+        self.fetch_row = fetch_row
+        self.fetch = None
+        self.keyed = False
+        self.pages = deque()
+        self.has_before = False
+        self.has_after = False
+        self._loading = False
+
+        self.scrollbar = ttk.Scrollbar(treeview.master, orient=tk.VERTICAL, command=treeview.yview)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y, before=treeview)
+        treeview.configure(yscrollcommand=self._on_scroll)
+
+    def set_source(self, fetch_page):
+        """
+        Show rows from a keyset-paginated source, starting from the first page.
+
+        Args:
+            fetch_page (callable): Called as ``fetch_page(after=..., before=..., limit=...)``
+                and returning rows ordered by their first column, e.g.
+                ``Database.get_students_page``.
+        """
+
+        def fetch(after, before, limit):
+            return [(row[0], row) for row in fetch_page(after=after, before=before, limit=limit)]
+
+        self.keyed = True
+        self._reset(fetch)
+
+    def set_rows(self, rows):
+        """
+        Show an already computed list of rows, such as search results, page by page.
+
+        Only the visible window is inserted into the widget, so large result sets do
+        not create a Tcl item per row.
+
+        Args:
+            rows (list): The rows to show, in display order.
+        """
+
+        def fetch(after, before, limit):
+            if before is not None:
+                start = max(before - limit, 0)
+                return list(enumerate(rows[start:before], start))
+            start = 0 if after is None else after + 1
+            return list(enumerate(rows[start:start + limit], start))
+
+        self.keyed = False
+        self._reset(fetch)
+
+    def refresh(self):
+        """
+        Reload the current source from its first page.
+        """
+        if self.fetch is not None:
+            self._reset(self.fetch)
+
+    def apply(self, action, key):
+        """
+        Patch the widget for a single changed row instead of reloading it.
+
+        Args:
+            action (str): "insert", "update" or "delete".
+            key: The primary key of the changed row.
+        """
+        row = None if action == "delete" or self.fetch_row is None else self.fetch_row(key)
+        if row is None:
+            self.remove(key)
+        else:
+            self.upsert(row)
+
+    def upsert(self, row):
+        """
+        Update a row in place, or insert it at its sorted position.
+
+        A new row is only inserted when the widget shows a keyset source and the row
+        falls inside the loaded window; otherwise it appears when its page is fetched.
+
+        Args:
+            row (tuple): The row, with its primary key as the first column.
+        """
+        iid = str(row[0])
+        if self.tree.exists(iid):
+            self.tree.item(iid, values=self._values(row))
+            return
+        if not self.keyed:
+            return
+        key = row[0]
+        if not self.pages:
+            if not self.has_after and not self.has_before:
+                self._insert_page([(key, row)], at_end=True)
+            return
+        if (key < self.pages[0][0][0] and self.has_before) or (
+            key > self.pages[-1][-1][0] and self.has_after
+        ):
+            return
+        index = 0
+        for number, page in enumerate(self.pages):
+            if number == len(self.pages) - 1 or key < page[-1][0]:
+                offset = bisect.bisect_left([k for k, _ in page], key)
+                page.insert(offset, (key, iid))
+                self.tree.insert("", index + offset, iid=iid, values=self._values(row))
+                return
+            index += len(page)
+
+    def remove(self, key):
+        """
+        Remove the row with the given primary key if it is loaded.
+
+        Args:
+            key: The primary key of the row.
+        """
+        iid = str(key)
+        if not self.tree.exists(iid):
+            return
+        self.tree.delete(iid)
+        for page in self.pages:
+            for offset, (_, item) in enumerate(page):
+                if item == iid:
+                    del page[offset]
+                    if not page:
+                        self.pages.remove(page)
+                    return
+
+    def refresh_matching(self, column, value):
+        """
+        Re-fetch the loaded rows whose displayed ``column`` equals ``value``.
+
+        This keeps joined columns, such as a student's name in the registrations view,
+        current after the referenced row changes.
+
+        Args:
+            column (int): Index of the displayed column to compare.
+            value: The value to look for.
+        """
+        if self.fetch_row is None:
+            return
+        value = str(value)
+        for iid in self.tree.get_children():
+            values = self.tree.item(iid, "values")
+            if column < len(values) and str(values[column]) == value:
+                row = self.fetch_row(iid)
+                if row is None:
+                    self.remove(iid)
+                else:
+                    self.tree.item(iid, values=self._values(row))
+
+    def _reset(self, fetch):
+        """
+        Clear the widget and load the first page from ``fetch``.
+
+        Args:
+            fetch (callable): Returns ``(key, row)`` pairs for ``(after, before, limit)``.
+        """
+        self.fetch = fetch
+        self.pages.clear()
+        self.tree.delete(*self.tree.get_children())
+        self.has_before = False
+        page = self.fetch(None, None, self.page_size)
+        self._insert_page(page, at_end=True)
+        self.has_after = len(page) == self.page_size
+
+    def _values(self, row):
+        """
+        Return the values displayed for a row.
+        """
+        values = row[1:] if self.hidden_key else row
+        return self.format_row(values) if self.format_row else values
+
+    def _insert_page(self, page, at_end):
+        """
+        Insert a page of ``(key, row)`` pairs at either end of the widget.
+        """
+        if not page:
+            return
+        index = tk.END if at_end else 0
+        for offset, (key, row) in enumerate(page):
+            self.tree.insert(
+                "",
+                index if at_end else offset,
+                iid=str(row[0]),
+                values=self._values(row),
+            )
+        keys = [(key, str(row[0])) for key, row in page]
+        if at_end:
+            self.pages.append(keys)
+        else:
+            self.pages.appendleft(keys)
+
+    def _on_scroll(self, first, last):
+        """
+        Forward scroll updates to the scrollbar and load pages near either end.
+        """
+        self.scrollbar.set(first, last)
+        if self._loading or not self.pages:
+            return
+        if float(last) >= 1.0 - self.SCROLL_THRESHOLD and self.has_after:
+            self._loading = True
+            self.tree.after_idle(self._load_after)
+        elif float(first) <= self.SCROLL_THRESHOLD and self.has_before:
+            self._loading = True
+            self.tree.after_idle(self._load_before)
+
+    def _load_after(self):
+        """
+        Append the next page and drop the first one if the window is full.
+        """
+        try:
+            page = self.fetch(self.pages[-1][-1][0], None, self.page_size)
+            self.has_after = len(page) == self.page_size
+            self._insert_page(page, at_end=True)
+            if len(self.pages) > self.max_pages:
+                self._drop_page(at_end=False)
+        finally:
+            self._loading = False
+
+    def _load_before(self):
+        """
+        Prepend the previous page and drop the last one if the window is full.
+        """
+        try:
+            page = self.fetch(None, self.pages[0][0][0], self.page_size)
+            self.has_before = len(page) == self.page_size
+            top = self._top_index()
+            self._insert_page(page, at_end=False)
+            self._scroll_to(top + len(page))
+            if len(self.pages) > self.max_pages:
+                self._drop_page(at_end=True)
+        finally:
+            self._loading = False
+
+    def _drop_page(self, at_end):
+        """
+        Remove the first or last page from the widget, keeping the visible rows in place.
+        """
+        top = self._top_index()
+        keys = self.pages.pop() if at_end else self.pages.popleft()
+        self.tree.delete(*(iid for _, iid in keys))
+        if at_end:
+            self.has_after = True
+        else:
+            self.has_before = True
+            self._scroll_to(top - len(keys))
+
+    def _top_index(self):
+        """
+        Return the index of the first visible item.
+        """
+        return round(self.tree.yview()[0] * len(self.tree.get_children()))
+
+    def _scroll_to(self, index):
+        """
+        Scroll so that the item at ``index`` is the first visible one.
+        """
+        count = len(self.tree.get_children())
+        if count:
+            self.tree.yview_moveto(max(index, 0) / count)
+
+
+class TypeAheadCombobox(ttk.Combobox):
+    """
+    A ttk.Combobox whose options are looked up by prefix as the user types.
+
+    Instead of holding every row of a table, the dropdown holds at most ``limit``
+    options returned by a prefix search such as ``Database.search_students_by_prefix``.
+    The search runs ``delay`` milliseconds after the last keystroke, and again when the
+    dropdown is opened. Options are formatted as "id: name", like the comboboxes they
+    replace, and the user may also type an ID directly.
+    """
+
+    def __init__(self, master, search, limit=20, delay=250, allow_none=False, **kwargs):
+        """
+        Initialize the combobox and load the first options.
+
+        Args:
+            master (tk.Widget): The parent widget.
+            search (callable): Called as ``search(prefix, limit)``; returns rows whose
+                first two columns are the ID and the name.
+            limit (int, optional): Maximum number of options shown. Defaults to 20.
+            delay (int, optional): Milliseconds to wait after a keystroke before
+                searching. Defaults to 250.
+            allow_none (bool, optional): If True, "None" is offered as the first option.
+                Defaults to False.
+            **kwargs: Passed on to ttk.Combobox.
+        """
+        super().__init__(master, postcommand=self.update_options, **kwargs)
+        self.search = search
+        self.limit = limit
+        self.delay = delay
+        self.allow_none = allow_none
+        self._pending = None
+        self._ids = {}
+        self.bind("<KeyRelease>", self._on_key)
+        self.update_options()
+
+    def update_options(self):
+        """
+        Replace the options with the matches for the current text.
+
+        For a chosen option, or text in the "id: name" form, only the ID part is used
+        as the prefix, so reopening the dropdown finds the chosen row again.
+        """
+        self._pending = None
+        text = self.get().strip()
+        if text in self._ids:
+            text = self._ids[text] or ""
+        elif ": " in text:
+            text = text.split(": ", 1)[0]
+        rows = self.search(text, self.limit)
+        labels = [f"{row[0]}: {row[1]}" for row in rows]
+        self._ids = {label: row[0] for label, row in zip(labels, rows)}
+        if self.allow_none:
+            labels.insert(0, "None")
+            self._ids["None"] = None
+        self["values"] = labels
+
+    def selected_id(self):
+        """
+        Return the ID of the chosen option, or the text itself if an ID was typed.
+
+        Returns:
+            Optional[str]: The ID, or None if nothing (or "None") is selected.
+        """
+        text = self.get().strip()
+        if text in self._ids:
+            return self._ids[text]
+        return text.split(": ", 1)[0] or None
+
+    def destroy(self):
+        """
+        Cancel a pending search and destroy the widget.
+        """
+        if self._pending is not None:
+            self.after_cancel(self._pending)
+            self._pending = None
+        super().destroy()
+
+    def _on_key(self, event):
+        """
+        Restart the debounce timer after a keystroke that may have changed the text.
+        """
+        if event.keysym in ("Up", "Down", "Return", "Escape", "Tab"):
+            return
+        if self._pending is not None:
+            self.after_cancel(self._pending)
+        self._pending = self.after(self.delay, self.update_options)
 
 
 class SchoolManagementSystem(Frame):
@@ -36,8 +423,40 @@ class SchoolManagementSystem(Frame):
     This class sets up the main window, menus, buttons, and tabs for managing students,
     instructors, courses, and registrations. It interacts with the Database class to
     perform CRUD operations and handles data persistence.
+
+    Imports, exports, clearing and searches run on a DatabaseWorker thread so the
+    window stays responsive; their results are delivered back through ``after()``
+    polling.
     """
 
+    # Milliseconds between checks for finished background jobs.
+    POLL_INTERVAL = 50
+
+    # Rows between progress updates and cancellation checks in streaming exports.
+    REPORT_INTERVAL = 1000
+
+    # Imports with at least this many rows validate students and instructors in a process pool.
+    PARALLEL_VALIDATION_ROWS = 1000000
+
+    # Rejected rows listed in the message shown after an import.
+    IMPORT_ERRORS_SHOWN = 10
+
+    # Milliseconds the search box text must stay unchanged before a live search runs.
+    LIVE_SEARCH_DELAY = 300
+
+    # Tables in the order they are exported and imported, with their exported columns.
+    SECTIONS = ("students", "instructors", "courses", "registrations")
+    EXPORT_COLUMNS = {
+        "students": ("student_id", "name", "age", "email"),
+        "instructors": ("instructor_id", "name", "age", "email"),
+        "courses": ("course_id", "course_name", "instructor_id"),
+        "registrations": ("id", "student_id", "course_id"),
+    }
+
+    # A single CSV file holds one flat table, so the four tables are saved as a CSV
+    # bundle: a zip archive with one CSV file per table.
+    FILETYPES = [("JSON files", "*.json"), ("JSON Lines files", "*.ndjson *.jsonl"), ("CSV bundles", "*.zip")]
+
     def __init__(self, master=None):
         """
         Initialize the SchoolManagementSystem frame.
@@ -51,18 +470,33 @@ class SchoolManagementSystem(Frame):
         self.master.geometry("1000x700")
 
         self.database = Database()
+        self.worker = DatabaseWorker(self.database.db_name, self.database.profile)
+        self.task = None
+        self.action_windows = []
+        self.search_jobs = {}
+        self.search_queries = {}
+        self.search_timers = {}
+        self.instrumentation = QueryInstrumentation()
+        self.record_queries = tk.BooleanVar(value=False)
 
         self.create_menu()
 
         self.create_main_buttons()
 
+        self.create_status_bar()
+
         self.create_tabs()
 
+        self.database.subscribe(self.on_database_change)
+        self.worker.subscribe(self.on_database_change)
+        self.poll_worker()
+
     def create_menu(self):
         """
-        Create the menu bar with File options.
+        Create the menu bar with File and Diagnostics options.
 
-        Adds 'Save Data', 'Load Data', and 'Exit' options to the File menu.
+        Adds 'Save Data', 'Load Data', and 'Exit' options to the File menu, and a switch
+        for query statistics and the Diagnostics window to the Diagnostics menu.
         """
         menubar = Menu(self.master)
         self.master.config(menu=menubar)
@@ -75,6 +509,23 @@ class SchoolManagementSystem(Frame):
         file_menu.add_separator()
         file_menu.add_command(label="Exit", command=self.master.quit)
 
+        diagnostics_menu = Menu(menubar, tearoff=0)
+        menubar.add_cascade(label="Diagnostics", menu=diagnostics_menu)
+
+        diagnostics_menu.add_checkbutton(
+            label="Record Query Statistics", variable=self.record_queries, command=self.toggle_instrumentation
+        )
+        diagnostics_menu.add_command(label="Show Diagnostics", command=self.diagnostics_window)
+
+    def toggle_instrumentation(self):
+        """
+        Start or stop recording query statistics on both the window's and the worker's
+        database, following the 'Record Query Statistics' menu switch.
+        """
+        instrumentation = self.instrumentation if self.record_queries.get() else None
+        self.database.set_instrumentation(instrumentation)
+        self.worker.submit(lambda job, value: job.database.set_instrumentation(value), instrumentation)
+
     def create_main_buttons(self):
         """
         Create the main action buttons for adding students, instructors, courses,
@@ -111,6 +562,165 @@ class SchoolManagementSystem(Frame):
         )
         self.button_assign_instructor.grid(row=0, column=4, padx=5)
 
+        self.action_buttons = (
+            self.button_add_student,
+            self.button_add_instructor,
+            self.button_add_course,
+            self.button_register_course,
+            self.button_assign_instructor,
+        )
+
+    def create_status_bar(self):
+        """
+        Create the status bar showing the progress of the running background task,
+        with a button to cancel it.
+        """
+        status_frame = Frame(self)
+        status_frame.pack(side=tk.BOTTOM, fill=tk.X, padx=10, pady=(0, 5))
+
+        self.status_var = tk.StringVar(value="Ready")
+        tk.Label(status_frame, textvariable=self.status_var, anchor='w').pack(side=tk.LEFT, fill=tk.X, expand=True)
+        self.button_cancel_task = Button(
+            status_frame, text="Cancel", width=10, state=tk.DISABLED, command=self.cancel_task
+        )
+        self.button_cancel_task.pack(side=tk.RIGHT)
+
+    def poll_worker(self):
+        """
+        Deliver finished background jobs and reschedule itself on the Tk event loop.
+        """
+        self.worker.poll()
+        self.after(self.POLL_INTERVAL, self.poll_worker)
+
+    def start_task(self, description, func, *args, on_done=None):
+        """
+        Run a long operation on the database worker, reporting progress in the status bar.
+
+        Only one such task runs at a time. The worker writes through its own connection,
+        so a write from the Tk thread would wait for the task's transaction and freeze the
+        window. A task therefore only starts once every add and edit window is closed, and
+        the actions that write are disabled until it finishes.
+
+        Args:
+            description (str): What the task does, e.g. "Loading data".
+            func (callable): Called as ``func(job, *args)`` on the worker thread.
+            *args: Extra positional arguments for ``func``.
+            on_done (callable, optional): Called on the Tk thread with the result.
+        """
+        if self.task is not None:
+            messagebox.showerror("Busy", "Another operation is still running.")
+            return
+        self.action_windows = [window for window in self.action_windows if window.winfo_exists()]
+        if self.action_windows:
+            messagebox.showerror("Busy", "Close the open add and edit windows first.")
+            return
+
+        def finish(status):
+            self.task = None
+            self.status_var.set(status)
+            self.button_cancel_task.config(state=tk.DISABLED)
+            for button in self.action_buttons:
+                button.config(state=tk.NORMAL)
+
+        def done(result):
+            finish("Ready")
+            if on_done:
+                on_done(result)
+
+        def failed(error):
+            if isinstance(error, JobCancelled):
+                finish(f"{description} cancelled.")
+            else:
+                finish("Ready")
+                messagebox.showerror("Error", f"{description} failed: {error}")
+
+        def progress(count, total):
+            self.status_var.set(f"{description}: {count}/{total}" if total else f"{description}: {count}")
+
+        self.status_var.set(f"{description}...")
+        self.button_cancel_task.config(state=tk.NORMAL)
+        for button in self.action_buttons:
+            button.config(state=tk.DISABLED)
+        self.task = self.worker.submit(func, *args, on_done=done, on_error=failed, on_progress=progress)
+
+    def cancel_task(self):
+        """
+        Cancel the running background task.
+        """
+        if self.task is not None:
+            self.task.cancel()
+
+    def run_search(self, view, method, query):
+        """
+        Run a database search on the worker and show the results in a view.
+
+        A search still pending for the same view is cancelled, so only the latest
+        query's results are shown.
+
+        Args:
+            view (VirtualTreeview): The view to fill.
+            method (str): Name of the Database search method, e.g. "search_students".
+            query (str): The search query.
+        """
+        def failed(error):
+            if not isinstance(error, JobCancelled):
+                messagebox.showerror("Error", f"Search failed: {error}")
+
+        self.cancel_search(view)
+        self.search_queries[view] = query
+        self.search_jobs[view] = self.worker.submit(
+            lambda job: getattr(job.database, method)(query),
+            on_done=view.set_rows,
+            on_error=failed,
+        )
+
+    def cancel_search(self, view):
+        """
+        Cancel the pending search for a view, if any.
+
+        Args:
+            view (VirtualTreeview): The view whose search to cancel.
+        """
+        self.search_queries.pop(view, None)
+        job = self.search_jobs.pop(view, None)
+        if job is not None:
+            job.cancel()
+
+    def enable_live_search(self, variable, view, method, populate):
+        """
+        Search as the user types into a tab's search box.
+
+        The search runs once the text has stopped changing for LIVE_SEARCH_DELAY
+        milliseconds. It goes through run_search, so it runs on the worker, and a stale
+        search is cancelled: skipped if still queued, interrupted through the worker
+        connection's progress handler if already running. Its results are then never
+        shown. Clearing the box shows every record again.
+
+        Args:
+            variable (tk.StringVar): The search box's variable.
+            view (VirtualTreeview): The view to fill.
+            method (str): Name of the Database search method, e.g. "search_students".
+            populate (callable): Shows every record in the view.
+        """
+        def search():
+            self.search_timers.pop(view, None)
+            query = variable.get().strip()
+            if query == self.search_queries.get(view, ""):
+                return
+            if query:
+                self.run_search(view, method, query)
+            else:
+                self.cancel_search(view)
+                populate()
+
+        def changed(*args):
+            timer = self.search_timers.pop(view, None)
+            if timer is not None:
+                self.after_cancel(timer)
+            self.search_timers[view] = self.after(self.LIVE_SEARCH_DELAY, search)
+
+        variable.trace_add("write", changed)
+
     def create_tabs(self):
         """
         Create the tabbed interface for viewing all records, students, instructors,
@@ -166,10 +776,14 @@ class SchoolManagementSystem(Frame):
             self.tree_all_records.heading(col, text=col)
             self.tree_all_records.column(col, width=120, anchor='center')
         self.tree_all_records.pack(fill=tk.BOTH, expand=True)
+        self.all_records_view = VirtualTreeview(
+            self.tree_all_records, hidden_key=True, fetch_row=self.database.get_all_records_row
+        )
 
         self.attach_context_menu(self.tree_all_records, 'all_records')
 
         self.populate_all_records()
+        self.enable_live_search(self.all_records_search_var, self.all_records_view, "search_all_records", self.populate_all_records)
 
     def create_students_tab(self):
         """
@@ -200,10 +814,12 @@ class SchoolManagementSystem(Frame):
             self.tree_students.heading(col, text=col)
             self.tree_students.column(col, width=150, anchor='center')
         self.tree_students.pack(fill=tk.BOTH, expand=True)
+        self.students_view = VirtualTreeview(self.tree_students, fetch_row=self.database.get_student_by_id)
 
         self.attach_context_menu(self.tree_students, 'students')
 
         self.populate_students()
+        self.enable_live_search(self.students_search_var, self.students_view, "search_students", self.populate_students)
 
     def create_instructors_tab(self):
         """
@@ -234,10 +850,14 @@ class SchoolManagementSystem(Frame):
             self.tree_instructors.heading(col, text=col)
             self.tree_instructors.column(col, width=150, anchor='center')
         self.tree_instructors.pack(fill=tk.BOTH, expand=True)
+        self.instructors_view = VirtualTreeview(
+            self.tree_instructors, fetch_row=self.database.get_instructor_by_id
+        )
 
         self.attach_context_menu(self.tree_instructors, 'instructors')
 
         self.populate_instructors()
+        self.enable_live_search(self.instructors_search_var, self.instructors_view, "search_instructors", self.populate_instructors)
 
     def create_courses_tab(self):
         """
@@ -262,16 +882,23 @@ class SchoolManagementSystem(Frame):
         )
         self.button_courses_reset.pack(side=tk.LEFT, padx=5)
 
-        columns = ("Course ID", "Course Name", "Instructor ID", "Instructor Name")
+        columns = ("Course ID", "Course Name", "Instructor ID", "Instructor Name", "Enrolled")
         self.tree_courses = ttk.Treeview(frame, columns=columns, show="headings")
         for col in columns:
             self.tree_courses.heading(col, text=col)
             self.tree_courses.column(col, width=150, anchor='center')
+        self.tree_courses.column("Enrolled", width=80)
         self.tree_courses.pack(fill=tk.BOTH, expand=True)
+        self.courses_view = VirtualTreeview(
+            self.tree_courses,
+            format_row=self.format_course,
+            fetch_row=self.database.get_course_with_instructor,
+        )
 
         self.attach_context_menu(self.tree_courses, 'courses')
 
         self.populate_courses()
+        self.enable_live_search(self.courses_search_var, self.courses_view, "search_courses", self.populate_courses)
 
     def create_registrations_tab(self):
         """
@@ -302,255 +929,200 @@ class SchoolManagementSystem(Frame):
             self.tree_registrations.heading(col, text=col)
             self.tree_registrations.column(col, width=120, anchor='center')
         self.tree_registrations.pack(fill=tk.BOTH, expand=True)
+        self.registrations_view = VirtualTreeview(
+            self.tree_registrations, fetch_row=self.database.get_registration_record
+        )
 
         self.attach_context_menu(self.tree_registrations, 'registrations')
 
         self.populate_registrations()
+        self.enable_live_search(self.registrations_search_var, self.registrations_view, "search_registrations", self.populate_registrations)
 
     def populate_all_records(self):
         """
         Populate the 'All Records' treeview with combined data from students,
         courses, and instructors.
+
+        Rows are paged in from the database as the user scrolls.
         """
-        for row in self.tree_all_records.get_children():
-            self.tree_all_records.delete(row)
-
-        self.database.cursor.execute(
-            """
-            SELECT 
-                s.student_id, s.name, 
-                c.course_id, c.course_name,
-                i.instructor_id, i.name
-            FROM registrations r
-            JOIN students s ON r.student_id = s.student_id
-            JOIN courses c ON r.course_id = c.course_id
-            LEFT JOIN instructors i ON c.instructor_id = i.instructor_id
-            """
-        )
-        records = self.database.cursor.fetchall()
-        for record in records:
-            self.tree_all_records.insert("", tk.END, values=record)
+        self.all_records_view.set_source(self.database.get_all_records_page)
 
     def populate_students(self):
         """
         Populate the 'Students' treeview with student data from the database.
         """
-        for row in self.tree_students.get_children():
-            self.tree_students.delete(row)
-
-        students = self.database.get_students()
-        for student in students:
-            self.tree_students.insert("", tk.END, values=student)
+        self.students_view.set_source(self.database.get_students_page)
 
     def populate_instructors(self):
         """
         Populate the 'Instructors' treeview with instructor data from the database.
         """
-        for row in self.tree_instructors.get_children():
-            self.tree_instructors.delete(row)
-
-        instructors = self.database.get_instructors()
-        for instructor in instructors:
-            self.tree_instructors.insert("", tk.END, values=instructor)
+        self.instructors_view.set_source(self.database.get_instructors_page)
 
     def populate_courses(self):
         """
         Populate the 'Courses' treeview with course data from the database,
-        including instructor information if assigned.
+        including instructor information if assigned and the number of enrolled students.
         """
-        for row in self.tree_courses.get_children():
-            self.tree_courses.delete(row)
+        self.courses_view.set_source(self.database.get_courses_with_instructors)
 
-        courses = self.database.get_courses()
-        for course in courses:
-            if course[2]:
-                instructor_record = self.database.get_instructor_by_id(course[2])
-                instructor_name = instructor_record[1] if instructor_record else "N/A"
-            else:
-                instructor_name = "N/A"
-            self.tree_courses.insert("", tk.END, values=(course[0], course[1], course[2] if course[2] else "N/A", instructor_name))
+    @staticmethod
+    def format_course(course):
+        """
+        Format a course row for the 'Courses' treeview.
+
+        Args:
+            course (tuple): ``(course_id, course_name, instructor_id, instructor_name, enrolled)``.
+
+        Returns:
+            tuple: The displayed values, with "N/A" for a missing instructor.
+        """
+        return (course[0], course[1], course[2] if course[2] else "N/A", course[3] if course[3] else "N/A", course[4])
 
     def populate_registrations(self):
         """
         Populate the 'Registrations' treeview with registration data from the database.
         """
-        for row in self.tree_registrations.get_children():
-            self.tree_registrations.delete(row)
-
-        self.database.cursor.execute(
-            """
-            SELECT 
-                r.id, 
-                s.student_id, s.name, 
-                c.course_id, c.course_name
-            FROM registrations r
-            JOIN students s ON r.student_id = s.student_id
-            JOIN courses c ON r.course_id = c.course_id
-            """
-        )
-        records = self.database.cursor.fetchall()
-        for record in records:
-            self.tree_registrations.insert("", tk.END, values=record)
+        self.registrations_view.set_source(self.database.get_registrations_page)
+
+    def on_database_change(self, table, action, key):
+        """
+        Patch the treeviews after a change reported by the database.
+
+        Single-row changes update, insert or remove just that row, and re-fetch the
+        loaded rows of other tabs that display it through a join. Bulk changes reload
+        every tab that shows the affected table.
+
+        Args:
+            table (str): The table that changed.
+            action (str): "insert", "update", "delete" or "reload".
+            key: The primary key of the changed row, or None for "reload".
+        """
+        if action == "reload":
+            populate = {
+                "students": (self.populate_students, self.populate_registrations, self.populate_all_records),
+                "instructors": (self.populate_instructors, self.populate_courses, self.populate_all_records),
+                "courses": (self.populate_courses, self.populate_registrations, self.populate_all_records),
+                "registrations": (self.populate_registrations, self.populate_all_records, self.populate_courses),
+            }
+            for callback in populate[table]:
+                callback()
+        elif table == "students":
+            self.students_view.apply(action, key)
+            self.registrations_view.refresh_matching(1, key)
+            self.all_records_view.refresh_matching(0, key)
+        elif table == "instructors":
+            self.instructors_view.apply(action, key)
+            self.courses_view.refresh_matching(2, key)
+            self.all_records_view.refresh_matching(4, key)
+        elif table == "courses":
+            self.courses_view.apply(action, key)
+            self.registrations_view.refresh_matching(3, key)
+            self.all_records_view.refresh_matching(2, key)
+        elif table == "registrations":
+            self.registrations_view.apply(action, key)
+            self.all_records_view.apply(action, key)
+        elif table == "course_stats":
+            self.courses_view.apply("update", key)
 
     def search_all_records(self):
         """
         Search and display records in the 'All Records' tab based on the search query.
 
         The search is performed on student ID, student name, course ID, and course name.
+        Each word of the query is matched as a prefix and the best matches come first.
 
         Raises:
             messagebox.showerror: If the search query is empty.
         """
-        query = self.all_records_search_var.get().strip().lower()
+        query = self.all_records_search_var.get().strip()
         if not query:
             messagebox.showerror("Input Error", "Please enter a search query.")
             return
 
-        for row in self.tree_all_records.get_children():
-            self.tree_all_records.delete(row)
-
-        self.database.cursor.execute(
-            """
-            SELECT 
-                s.student_id, s.name, 
-                c.course_id, c.course_name,
-                i.instructor_id, i.name
-            FROM registrations r
-            JOIN students s ON r.student_id = s.student_id
-            JOIN courses c ON r.course_id = c.course_id
-            LEFT JOIN instructors i ON c.instructor_id = i.instructor_id
-            WHERE 
-                LOWER(s.student_id) LIKE ? OR 
-                LOWER(s.name) LIKE ? OR
-                LOWER(c.course_id) LIKE ? OR
-                LOWER(c.course_name) LIKE ?
-            """,
-            (f"%{query}%", f"%{query}%", f"%{query}%", f"%{query}%")
-        )
-        records = self.database.cursor.fetchall()
-        for record in records:
-            self.tree_all_records.insert("", tk.END, values=record)
+        self.run_search(self.all_records_view, "search_all_records", query)
 
     def reset_all_records_search(self):
         """
         Reset the search in the 'All Records' tab and repopulate all records.
         """
         self.all_records_search_var.set("")
+        self.cancel_search(self.all_records_view)
         self.populate_all_records()
 
     def search_students(self):
         """
         Search and display student records based on the search query.
 
-        The search is performed on student ID and name.
+        The search is performed on student ID and name. Each word of the query is
+        matched as a prefix and the best matches come first.
 
         Raises:
             messagebox.showerror: If the search query is empty.
         """
-        query = self.students_search_var.get().strip().lower()
+        query = self.students_search_var.get().strip()
         if not query:
             messagebox.showerror("Input Error", "Please enter a search query.")
             return
 
-        for row in self.tree_students.get_children():
-            self.tree_students.delete(row)
-
-        self.database.cursor.execute(
-            """
-            SELECT * FROM students
-            WHERE 
-                LOWER(student_id) LIKE ? OR 
-                LOWER(name) LIKE ?
-            """,
-            (f"%{query}%", f"%{query}%")
-        )
-        students = self.database.cursor.fetchall()
-        for student in students:
-            self.tree_students.insert("", tk.END, values=student)
+        self.run_search(self.students_view, "search_students", query)
 
     def reset_students_search(self):
         """
         Reset the search in the 'Students' tab and repopulate all student records.
         """
         self.students_search_var.set("")
+        self.cancel_search(self.students_view)
         self.populate_students()
 
     def search_instructors(self):
         """
         Search and display instructor records based on the search query.
 
-        The search is performed on instructor ID and name.
+        The search is performed on instructor ID and name. Each word of the query is
+        matched as a prefix and the best matches come first.
 
         Raises:
             messagebox.showerror: If the search query is empty.
         """
-        query = self.instructors_search_var.get().strip().lower()
+        query = self.instructors_search_var.get().strip()
         if not query:
             messagebox.showerror("Input Error", "Please enter a search query.")
             return
 
-        for row in self.tree_instructors.get_children():
-            self.tree_instructors.delete(row)
-
-        self.database.cursor.execute(
-            """
-            SELECT * FROM instructors
-            WHERE 
-                LOWER(instructor_id) LIKE ? OR 
-                LOWER(name) LIKE ?
-            """,
-            (f"%{query}%", f"%{query}%")
-        )
-        instructors = self.database.cursor.fetchall()
-        for instructor in instructors:
-            self.tree_instructors.insert("", tk.END, values=instructor)
+        self.run_search(self.instructors_view, "search_instructors", query)
 
     def reset_instructors_search(self):
         """
         Reset the search in the 'Instructors' tab and repopulate all instructor records.
         """
         self.instructors_search_var.set("")
+        self.cancel_search(self.instructors_view)
         self.populate_instructors()
 
     def search_courses(self):
         """
         Search and display course records based on the search query.
 
-        The search is performed on course ID and course name.
+        The search is performed on course ID and course name. Each word of the query is
+        matched as a prefix and the best matches come first.
 
         Raises:
             messagebox.showerror: If the search query is empty.
         """
-        query = self.courses_search_var.get().strip().lower()
+        query = self.courses_search_var.get().strip()
         if not query:
             messagebox.showerror("Input Error", "Please enter a search query.")
             return
 
-        for row in self.tree_courses.get_children():
-            self.tree_courses.delete(row)
-
-        self.database.cursor.execute(
-            """
-            SELECT 
-                c.course_id, c.course_name, c.instructor_id, i.name
-            FROM courses c
-            LEFT JOIN instructors i ON c.instructor_id = i.instructor_id
-            WHERE 
-                LOWER(c.course_id) LIKE ? OR 
-                LOWER(c.course_name) LIKE ?
-            """,
-            (f"%{query}%", f"%{query}%")
-        )
-        courses = self.database.cursor.fetchall()
-        for course in courses:
-            instructor_name = course[3] if course[3] else "N/A"
-            self.tree_courses.insert("", tk.END, values=(course[0], course[1], course[2] if course[2] else "N/A", instructor_name))
+        self.run_search(self.courses_view, "search_courses", query)
 
     def reset_courses_search(self):
         """
         Reset the search in the 'Courses' tab and repopulate all course records.
         """
         self.courses_search_var.set("")
+        self.cancel_search(self.courses_view)
         self.populate_courses()
 
     def search_registrations(self):
@@ -558,130 +1130,319 @@ class SchoolManagementSystem(Frame):
         Search and display registration records based on the search query.
 
         The search is performed on student ID, student name, course ID, and course name.
+        Each word of the query is matched as a prefix and the best matches come first.
 
         Raises:
             messagebox.showerror: If the search query is empty.
         """
-        query = self.registrations_search_var.get().strip().lower()
+        query = self.registrations_search_var.get().strip()
         if not query:
             messagebox.showerror("Input Error", "Please enter a search query.")
             return
 
-        for row in self.tree_registrations.get_children():
-            self.tree_registrations.delete(row)
-
-        self.database.cursor.execute(
-            """
-            SELECT 
-                r.id, s.student_id, s.name, c.course_id, c.course_name
-            FROM registrations r
-            JOIN students s ON r.student_id = s.student_id
-            JOIN courses c ON r.course_id = c.course_id
-            WHERE 
-                LOWER(s.student_id) LIKE ? OR 
-                LOWER(s.name) LIKE ? OR
-                LOWER(c.course_id) LIKE ? OR
-                LOWER(c.course_name) LIKE ?
-            """,
-            (f"%{query}%", f"%{query}%", f"%{query}%", f"%{query}%")
-        )
-        records = self.database.cursor.fetchall()
-        for record in records:
-            self.tree_registrations.insert("", tk.END, values=record)
+        self.run_search(self.registrations_view, "search_registrations", query)
 
     def reset_registrations_search(self):
         """
         Reset the search in the 'Registrations' tab and repopulate all registration records.
         """
         self.registrations_search_var.set("")
+        self.cancel_search(self.registrations_view)
         self.populate_registrations()
 
     def save_data(self):
         """
         Save the current data (students, instructors, courses, registrations) to a file.
 
-        The user can choose between JSON and CSV file formats. Data is serialized using
-        the DataManagement class.
+        The user can choose between JSON, JSON Lines and CSV bundle formats. Data is read and
+        written on the database worker, so large databases do not freeze the window. JSON
+        Lines and CSV bundle exports stream rows from the database straight to disk.
 
         Raises:
             messagebox.showerror: If saving fails due to an exception.
             messagebox.showinfo: If saving is successful.
         """
-        filetypes = [("JSON files", "*.json"), ("CSV files", "*.csv")]
         filepath = filedialog.asksaveasfilename(
-            defaultextension=".json", filetypes=filetypes
+            defaultextension=".json", filetypes=self.FILETYPES
         )
         if not filepath:
             return
 
-        data = {
-            "students": [{"student_id": s[0], "name": s[1], "age": s[2], "email": s[3]} for s in self.database.get_students()],
-            "instructors": [{"instructor_id": i[0], "name": i[1], "age": i[2], "email": i[3]} for i in self.database.get_instructors()],
-            "courses": [{"course_id": c[0], "course_name": c[1], "instructor_id": c[2]} for c in self.database.get_courses()],
-            "registrations": [{"id": r[0], "student_id": r[1], "course_id": r[2]} for r in self.database.cursor.execute("SELECT * FROM registrations").fetchall()],
+        self.start_task(
+            "Saving data",
+            self.export_data,
+            filepath,
+            on_done=lambda _: messagebox.showinfo("Success", f"Data saved successfully to {filepath}."),
+        )
+
+    @staticmethod
+    def iter_tables(database):
+        """
+        Yield ``(section, columns, rows)`` for every table, with rows streamed from
+        database cursors.
+
+        Args:
+            database (Database): The database to read.
+        """
+        sources = {
+            "students": database.iter_students,
+            "instructors": database.iter_instructors,
+            "courses": database.iter_courses,
+            "registrations": database.iter_registrations,
         }
+        for section in SchoolManagementSystem.SECTIONS:
+            yield section, SchoolManagementSystem.EXPORT_COLUMNS[section], sources[section]()
+
+    @staticmethod
+    def iter_records(database):
+        """
+        Yield every row of the database as a ``(section, record)`` pair, table by table.
+
+        Rows are streamed from database cursors, so memory use does not depend on the
+        size of the database.
+
+        Args:
+            database (Database): The database to read.
+        """
+        for section, columns, rows in SchoolManagementSystem.iter_tables(database):
+            for row in rows:
+                yield section, dict(zip(columns, row))
+
+    @staticmethod
+    def export_data(job, filepath):
+        """
+        Write every table to a file. Runs on the database worker thread.
+
+        Args:
+            job (DatabaseJob): The running job.
+            filepath (str): The JSON, JSON Lines or CSV bundle file to write.
+        """
+        ext = os.path.splitext(filepath)[1].lower()
+        count = 0
+
+        def checked(rows):
+            nonlocal count
+            for row in rows:
+                count += 1
+                if count % SchoolManagementSystem.REPORT_INTERVAL == 0:
+                    job.check()
+                    job.report(count)
+                yield row
 
         try:
-            DataManagement.save_data(data, filepath)
-            messagebox.showinfo("Success", f"Data saved successfully to {filepath}.")
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to save data: {e}")
+            if ext in DataManagement.NDJSON_EXTENSIONS:
+                DataManagement.save_to_ndjson(
+                    checked(SchoolManagementSystem.iter_records(job.database)), filepath
+                )
+            elif ext == ".zip":
+                DataManagement.save_to_csv_bundle(
+                    (
+                        (section, columns, checked(rows))
+                        for section, columns, rows in SchoolManagementSystem.iter_tables(job.database)
+                    ),
+                    filepath,
+                )
+            else:
+                data = {section: [] for section in SchoolManagementSystem.SECTIONS}
+                for section, record in SchoolManagementSystem.iter_records(job.database):
+                    data[section].append(record)
+                job.check()
+                DataManagement.save_data(data, filepath)
+        except JobCancelled:
+            if os.path.isfile(filepath):
+                os.remove(filepath)
+            raise
 
     def load_data(self):
         """
-        Load data from a file (JSON or CSV) into the system.
+        Load data from a file (JSON, JSON Lines or CSV) into the system.
 
-        The user can select a JSON or CSV file. Data is deserialized using the DataManagement class.
-        Existing data in the database is cleared after user confirmation before loading new data.
+        The user can select a JSON, JSON Lines or CSV bundle file. Data is deserialized using
+        the DataManagement class. Existing data in the database is cleared after user
+        confirmation before loading new data. The import runs on the database worker, with
+        progress shown in the status bar, and can be cancelled.
 
         Raises:
             messagebox.showerror: If loading fails due to an exception or invalid data format.
             messagebox.showinfo: If loading is successful.
         """
-        filetypes = [("JSON files", "*.json"), ("CSV files", "*.csv")]
         filepath = filedialog.askopenfilename(
-            filetypes=filetypes
+            filetypes=self.FILETYPES
         )
         if not filepath:
             return
 
-        try:
-            data = DataManagement.load_data(filepath)
-            if not isinstance(data, dict):
-                messagebox.showerror("Error", "Invalid data format.")
-                return
+        clear = messagebox.askyesno("Confirm", "Are you sure you want to clear all existing data?")
+        self.start_task(
+            "Loading data",
+            self.import_data,
+            filepath,
+            clear,
+            on_done=lambda reports: self.show_import_result(filepath, reports),
+        )
+
+    def show_import_result(self, filepath, reports):
+        """
+        Tell the user how an import went, listing the first rows that were rejected or changed.
+
+        Args:
+            filepath (str): The imported file.
+            reports (list): ``(section, BulkInsertReport)`` for every section imported.
+        """
+        failures = [(section, failure) for section, report in reports for failure in report.failures]
+        warnings = [(section, warning) for section, report in reports for warning in report.warnings]
+        if not failures and not warnings:
+            messagebox.showinfo("Success", f"Data loaded successfully from {filepath}.")
+            return
+        loaded = sum(report.succeeded for _, report in reports)
+        lines = [
+            f"{section} row {row + 1} ({key}): {message}"
+            for section, (row, key, message) in (failures + warnings)[:self.IMPORT_ERRORS_SHOWN]
+        ]
+        if len(failures) + len(warnings) > self.IMPORT_ERRORS_SHOWN:
+            lines.append(f"... and {len(failures) + len(warnings) - self.IMPORT_ERRORS_SHOWN} more.")
+        messagebox.showwarning(
+            "Import Finished With Errors",
+            f"Loaded {loaded} rows from {filepath}; {len(failures)} rows were rejected and "
+            f"{len(warnings)} were changed:\n\n" + "\n".join(lines),
+        )
 
-            self.clear_database()
+    @staticmethod
+    def import_data(job, filepath, clear):
+        """
+        Read a file and bulk insert its contents. Runs on the database worker thread.
 
-            for s in data.get("students", []):
-                student = Student(name=s["name"], age=int(s["age"]), _email=s["email"], student_id=s["student_id"])
-                self.database.add_student(student)
+        JSON Lines files and CSV bundles are streamed: each run of records of the same type
+        is piped from the file into the matching bulk insert without being collected first.
+        Progress is reported as rows processed, out of the total when it is known. The
+        worker's connection uses the "fast-import" profile for the duration of the import.
+        Clearing and every section run in one transaction, so a cancelled or failed import
+        leaves the database as it was.
 
-            for i in data.get("instructors", []):
-                instructor = Instructor(name=i["name"], age=int(i["age"]), _email=i["email"], instructor_id=i["instructor_id"])
-                self.database.add_instructor(instructor)
+        Args:
+            job (DatabaseJob): The running job.
+            filepath (str): The JSON, JSON Lines or CSV bundle file to read.
+            clear (bool): Whether to delete the existing data first.
 
-            for c in data.get("courses", []):
-                instructor = None
-                if c["instructor_id"] != "None" and c["instructor_id"]:
-                    instructor_record = self.database.get_instructor_by_id(c["instructor_id"])
-                    if instructor_record:
-                        instructor = Instructor(name=instructor_record[1], age=instructor_record[2], _email=instructor_record[3], instructor_id=instructor_record[0])
-                course = Course(course_id=c["course_id"], course_name=c["course_name"], instructor=instructor)
-                self.database.add_course(course)
+        Returns:
+            list: ``(section, BulkInsertReport)`` for every run of records imported, in
+            file order.
 
-            for r in data.get("registrations", []):
-                self.database.register_student_to_course(r["student_id"], r["course_id"])
+        Raises:
+            ValueError: If the file does not contain a dictionary of tables.
+        """
+        database = job.database
+        ext = os.path.splitext(filepath)[1].lower()
+        if ext in DataManagement.NDJSON_EXTENSIONS:
+            records = DataManagement.iter_ndjson(filepath)
+            total = None
+        elif ext == ".zip":
+            manifest = DataManagement.load_csv_bundle_manifest(filepath)
+            records = (
+                (section, dict(zip(columns, row)))
+                for section, columns, rows in DataManagement.iter_csv_bundle(filepath)
+                for row in rows
+            )
+            total = sum(table["rows"] for table in manifest["tables"])
+        else:
+            data = DataManagement.load_data(filepath)
+            if not isinstance(data, dict):
+                raise ValueError("Invalid data format.")
+            records = (
+                (section, record)
+                for section in SchoolManagementSystem.SECTIONS
+                for record in data.get(section, [])
+            )
+            total = sum(len(data.get(section, [])) for section in SchoolManagementSystem.SECTIONS)
+        job.check()
 
-            self.populate_all_records()
-            self.populate_students()
-            self.populate_instructors()
-            self.populate_courses()
-            self.populate_registrations()
+        profile = database.profile
+        database.apply_profile("fast-import")
+        try:
+            with database.transaction():
+                if clear:
+                    database.clear_all()
+
+                done = 0
+                reports = []
+                processes = (
+                    os.cpu_count() or 1
+                    if total is not None and total >= SchoolManagementSystem.PARALLEL_VALIDATION_ROWS
+                    else 0
+                )
 
-            messagebox.showinfo("Success", f"Data loaded successfully from {filepath}.")
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to load data: {e}")
+                def progress(count):
+                    job.check()
+                    job.report(done + count, total)
+
+                for section, group in groupby(records, key=itemgetter(0)):
+                    report = SchoolManagementSystem.insert_section(
+                        database, section, (record for _, record in group), progress, processes
+                    )
+                    if report is not None:
+                        done += report.total
+                        reports.append((section, report))
+        finally:
+            database.apply_profile(profile)
+        return reports
+
+    @staticmethod
+    def insert_section(database, section, records, progress=None, processes=0):
+        """
+        Bulk insert the records of one section of an import file.
+
+        Students and instructors are checked by a BatchValidator on the way in. Rows with
+        an invalid age or email are skipped and listed in the report's failures alongside
+        the rows the database rejected, numbered by their position in the section. A
+        course's instructor is looked up by primary key as the course goes in; an unknown
+        instructor, or the "None" written by older exports, is stored as no instructor and
+        listed in the report's warnings. Registrations for unknown students or courses are
+        rejected by their foreign keys.
+
+        Args:
+            database (Database): The database to write to.
+            section (str): "students", "instructors", "courses" or "registrations".
+            records (iterable of dict): The records, as written by iter_records.
+            progress (callable, optional): Passed on to the bulk insert.
+            processes (int, optional): Worker processes for validation, or 0 to validate
+                on the calling thread. Defaults to 0.
+
+        Returns:
+            BulkInsertReport: The outcome, or None if the section is not recognised and
+            its records were skipped.
+        """
+        if section in ("students", "instructors"):
+            validator = BatchValidator(f"{section[:-1]}_id", processes=processes)
+            insert = database.add_students_bulk if section == "students" else database.add_instructors_bulk
+            report = insert(validator.validate(records), progress=progress)
+            validator.merge_into(report)
+            return report
+        if section == "courses":
+            nulled = []
+
+            def instructor(row_number, course):
+                instructor_id = course["instructor_id"]
+                if instructor_id in (None, "", "None"):
+                    return None
+                if database.get_instructor_by_id(instructor_id) is None:
+                    nulled.append(
+                        (row_number, course["course_id"], f"Unknown instructor {instructor_id}; imported without one.")
+                    )
+                    return None
+                return instructor_id
+
+            report = database.add_courses_bulk(
+                ((c["course_id"], c["course_name"], instructor(i, c)) for i, c in enumerate(records)),
+                progress=progress,
+            )
+            report.warnings.extend(nulled)
+            return report
+        if section == "registrations":
+            return database.register_bulk(
+                ((r["student_id"], r["course_id"]) for r in records),
+                progress=progress,
+            )
+        return None
 
     def clear_database(self):
         """
@@ -694,14 +1455,7 @@ class SchoolManagementSystem(Frame):
         if not confirm:
             return
 
-        try:
-            self.database.cursor.execute("DELETE FROM registrations")
-            self.database.cursor.execute("DELETE FROM courses")
-            self.database.cursor.execute("DELETE FROM instructors")
-            self.database.cursor.execute("DELETE FROM students")
-            self.database.conn.commit()
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to clear database: {e}")
+        self.start_task("Clearing database", lambda job: job.database.clear_all())
 
     def attach_context_menu(self, treeview, tab_type):
         """
@@ -740,11 +1494,11 @@ class SchoolManagementSystem(Frame):
         values = treeview.item(selected_item, 'values')
 
         if tab_type == 'students':
-            EditStudent(self.database, values, self.populate_students, self.populate_all_records)
+            self.open_action_window(EditStudent, values)
         elif tab_type == 'instructors':
-            EditInstructor(self.database, values, self.populate_instructors, self.populate_courses, self.populate_all_records)
+            self.open_action_window(EditInstructor, values)
         elif tab_type == 'courses':
-            EditCourse(self.database, values, self.populate_courses, self.populate_all_records)
+            self.open_action_window(EditCourse, values)
         elif tab_type == 'registrations':
             messagebox.showinfo("Info", "Registrations cannot be edited directly.")
         elif tab_type == 'all_records':
@@ -769,6 +1523,10 @@ class SchoolManagementSystem(Frame):
 
         values = treeview.item(selected_item, 'values')
 
+        if self.task is not None:
+            messagebox.showerror("Busy", "Wait for the running operation to finish.")
+            return
+
         confirm = messagebox.askyesno("Confirm Delete", "Are you sure you want to delete the selected record?")
         if not confirm:
             return
@@ -778,28 +1536,18 @@ class SchoolManagementSystem(Frame):
                 student_id = values[0]
                 self.database.delete_student(student_id)
                 messagebox.showinfo("Success", f"Student ID {student_id} deleted successfully.")
-                self.populate_students()
-                self.populate_all_records()
             elif tab_type == 'instructors':
                 instructor_id = values[0]
                 self.database.delete_instructor(instructor_id)
                 messagebox.showinfo("Success", f"Instructor ID {instructor_id} deleted successfully.")
-                self.populate_instructors()
-                self.populate_courses()
-                self.populate_all_records()
             elif tab_type == 'courses':
                 course_id = values[0]
                 self.database.delete_course(course_id)
                 messagebox.showinfo("Success", f"Course ID {course_id} deleted successfully.")
-                self.populate_courses()
-                self.populate_all_records()
             elif tab_type == 'registrations':
                 registration_id = values[0]
-                self.database.cursor.execute("DELETE FROM registrations WHERE id = ?", (registration_id,))
-                self.database.conn.commit()
+                self.database.delete_registration(registration_id)
                 messagebox.showinfo("Success", f"Registration ID {registration_id} deleted successfully.")
-                self.populate_registrations()
-                self.populate_all_records()
             elif tab_type == 'all_records':
                 messagebox.showinfo("Info", "Please use the specific tabs to delete records.")
         except Exception as e:
@@ -809,31 +1557,50 @@ class SchoolManagementSystem(Frame):
         """
         Open the 'Add Student' window.
         """
-        AddStudent(self.database, self.populate_students, self.populate_all_records)
+        self.open_action_window(AddStudent)
 
     def new_instructor_window(self):
         """
         Open the 'Add Instructor' window.
         """
-        AddInstructor(self.database, self.populate_instructors, self.populate_courses, self.populate_all_records)
+        self.open_action_window(AddInstructor)
 
     def new_course_window(self):
         """
         Open the 'Add Course' window.
         """
-        AddCourse(self.database, self.populate_courses, self.populate_all_records)
+        self.open_action_window(AddCourse)
 
     def register_course_window(self):
         """
         Open the 'Register Course' window.
         """
-        RegisterCourse(self.database, self.populate_registrations, self.populate_all_records)
+        self.open_action_window(RegisterCourse)
 
     def assign_instructor_window(self):
         """
         Open the 'Assign Instructor' window.
         """
-        AssignInstructor(self.database, self.populate_courses, self.populate_all_records)
+        self.open_action_window(AssignInstructor)
+
+    def open_action_window(self, window_class, *args):
+        """
+        Open a window that writes to the database, unless a background task is running.
+
+        Args:
+            window_class (type): The window to open, e.g. AddStudent.
+            *args: Extra arguments for the window after the database.
+        """
+        if self.task is not None:
+            messagebox.showerror("Busy", "Wait for the running operation to finish.")
+            return
+        self.action_windows.append(window_class(self.database, *args))
+
+    def diagnostics_window(self):
+        """
+        Open the 'Diagnostics' window.
+        """
+        DiagnosticsWindow(self.instrumentation, self.record_queries)
 
 
 class AddStudent(Toplevel):
@@ -841,23 +1608,20 @@ class AddStudent(Toplevel):
     A window for adding a new student to the system.
 
     This window collects student details such as name, age, email, and student ID.
-    Upon successful addition, it refreshes the student and all records views.
+    Upon successful addition, the main window picks the change up through
+    the database change notifications.
     """
 
-    def __init__(self, database, refresh_callback, refresh_all_records_callback):
+    def __init__(self, database):
         """
         Initialize the AddStudent window.
 
         Args:
             database (Database): The database instance to interact with.
-            refresh_callback (callable): Function to refresh the students view.
-            refresh_all_records_callback (callable): Function to refresh the all records view.
         """
         super().__init__()
         self.title("Add a Student")
         self.database = database
-        self.refresh_callback = refresh_callback
-        self.refresh_all_records_callback = refresh_all_records_callback
 
         self.label_name = tk.Label(self, text="Name:")
         self.label_name.pack(pady=(10, 0))
@@ -889,7 +1653,7 @@ class AddStudent(Toplevel):
         Add a new student to the database based on the input fields.
 
         Validates input data and shows appropriate error messages. If successful,
-        refreshes the views and closes the window.
+        closes the window.
 
         Raises:
             messagebox.showerror: If input validation fails or addition to the database fails.
@@ -921,8 +1685,6 @@ class AddStudent(Toplevel):
             messagebox.showinfo(
                 "Success", f"Student {new_student.name} added to the database!"
             )
-            self.refresh_callback()
-            self.refresh_all_records_callback()
             self.destroy()
         else:
             messagebox.showerror(
@@ -935,25 +1697,20 @@ class AddInstructor(Toplevel):
     A window for adding a new instructor to the system.
 
     This window collects instructor details such as name, age, email, and instructor ID.
-    Upon successful addition, it refreshes the instructor, courses, and all records views.
+    Upon successful addition, the main window picks the change up through
+    the database change notifications.
     """
 
-    def __init__(self, database, refresh_callback, refresh_courses_callback, refresh_all_records_callback):
+    def __init__(self, database):
         """
         Initialize the AddInstructor window.
 
         Args:
             database (Database): The database instance to interact with.
-            refresh_callback (callable): Function to refresh the instructors view.
-            refresh_courses_callback (callable): Function to refresh the courses view.
-            refresh_all_records_callback (callable): Function to refresh the all records view.
         """
         super().__init__()
         self.title("Add an Instructor")
         self.database = database
-        self.refresh_callback = refresh_callback
-        self.refresh_courses_callback = refresh_courses_callback
-        self.refresh_all_records_callback = refresh_all_records_callback
 
         self.label_name = tk.Label(self, text="Name:")
         self.label_name.pack(pady=(10, 0))
@@ -985,7 +1742,7 @@ class AddInstructor(Toplevel):
         Add a new instructor to the database based on the input fields.
 
         Validates input data and shows appropriate error messages. If successful,
-        refreshes the views and closes the window.
+        closes the window.
 
         Raises:
             messagebox.showerror: If input validation fails or addition to the database fails.
@@ -1017,9 +1774,6 @@ class AddInstructor(Toplevel):
             messagebox.showinfo(
                 "Success", f"Instructor {new_instructor.name} added to the database!"
             )
-            self.refresh_callback()
-            self.refresh_courses_callback()
-            self.refresh_all_records_callback()
             self.destroy()
         else:
             messagebox.showerror(
@@ -1036,20 +1790,16 @@ class AddCourse(Toplevel):
     it refreshes the courses and all records views.
     """
 
-    def __init__(self, database, refresh_callback, refresh_all_records_callback):
+    def __init__(self, database):
         """
         Initialize the AddCourse window.
 
         Args:
             database (Database): The database instance to interact with.
-            refresh_callback (callable): Function to refresh the courses view.
-            refresh_all_records_callback (callable): Function to refresh the all records view.
         """
         super().__init__()
         self.title("Add a Course")
         self.database = database
-        self.refresh_callback = refresh_callback
-        self.refresh_all_records_callback = refresh_all_records_callback
 
         self.label_course_id = tk.Label(self, text="Course ID:")
         self.label_course_id.pack(pady=(10, 0))
@@ -1064,17 +1814,13 @@ class AddCourse(Toplevel):
         self.label_instructor = tk.Label(self, text="Assign Instructor (Optional):")
         self.label_instructor.pack(pady=(10, 0))
 
-        instructors = self.database.get_instructors()
-        instructor_list = [f"{instr[0]}: {instr[1]}" for instr in instructors]
-        instructor_list.insert(0, "None")
-
         self.selected_instructor = tk.StringVar(self)
-        self.selected_instructor.set(instructor_list[0])
-        self.dropdown_instructors = ttk.Combobox(
+        self.selected_instructor.set("None")
+        self.dropdown_instructors = TypeAheadCombobox(
             self,
+            self.database.search_instructors_by_prefix,
+            allow_none=True,
             textvariable=self.selected_instructor,
-            values=instructor_list,
-            state="readonly",
             width=47,
         )
         self.dropdown_instructors.pack(pady=5)
@@ -1089,8 +1835,7 @@ class AddCourse(Toplevel):
         Add a new course to the database based on the input fields.
 
         Validates input data, handles optional instructor assignment, and shows
-        appropriate error messages. If successful, refreshes the views and closes
-        the window.
+        appropriate error messages. If successful, closes the window.
 
         Raises:
             messagebox.showerror: If input validation fails or addition to the database fails.
@@ -1098,7 +1843,6 @@ class AddCourse(Toplevel):
         """
         course_id = self.entry_course_id.get().strip()
         course_name = self.entry_course_name.get().strip()
-        selected_instructor = self.selected_instructor.get()
 
         if not course_id or not course_name:
             messagebox.showerror(
@@ -1106,11 +1850,11 @@ class AddCourse(Toplevel):
             )
             return
 
-        if selected_instructor == "None":
+        instructor_id = self.dropdown_instructors.selected_id()
+        if instructor_id is None:
             instructor = None
         else:
             try:
-                instructor_id, instructor_name = selected_instructor.split(": ", 1)
                 instructor_record = self.database.get_instructor_by_id(instructor_id)
                 if not instructor_record:
                     messagebox.showerror("Error", "Selected instructor does not exist.")
@@ -1136,8 +1880,6 @@ class AddCourse(Toplevel):
             messagebox.showinfo(
                 "Success", f"Course {new_course.course_name} added to the database!"
             )
-            self.refresh_callback()
-            self.refresh_all_records_callback()
             self.destroy()
         else:
             messagebox.showerror(
@@ -1150,64 +1892,55 @@ class RegisterCourse(Toplevel):
     A window for registering a student to a course.
 
     This window allows the user to select a student and a course from dropdown menus.
-    Upon successful registration, it refreshes the registrations and all records views.
+    Upon successful registration, the main window picks the change up through
+    the database change notifications.
     """
 
-    def __init__(self, database, refresh_callback, refresh_all_records_callback):
+    def __init__(self, database):
         """
         Initialize the RegisterCourse window.
 
         Args:
             database (Database): The database instance to interact with.
-            refresh_callback (callable): Function to refresh the registrations view.
-            refresh_all_records_callback (callable): Function to refresh the all records view.
         """
         super().__init__()
         self.title("Register Student for a Course")
         self.database = database
-        self.refresh_callback = refresh_callback
-        self.refresh_all_records_callback = refresh_all_records_callback
 
         self.label_student = tk.Label(self, text="Select Student:")
         self.label_student.pack(pady=(10, 0))
 
-        self.student_options = self.get_students()
-        if not self.student_options:
-            messagebox.showerror("No Students", "No students available to register.")
-            self.destroy()
-            return
-
         self.selected_student = tk.StringVar(self)
-        self.selected_student.set(self.student_options[0])
-
-        self.dropdown_students = ttk.Combobox(
+        self.dropdown_students = TypeAheadCombobox(
             self,
+            self.database.search_students_by_prefix,
             textvariable=self.selected_student,
-            values=self.student_options,
-            state="readonly",
             width=47,
         )
+        self.student_options = self.dropdown_students["values"]
+        if not self.student_options:
+            messagebox.showerror("No Students", "No students available to register.")
+            self.destroy()
+            return
+        self.selected_student.set(self.student_options[0])
         self.dropdown_students.pack(pady=5)
 
         self.label_course = tk.Label(self, text="Select Course:")
         self.label_course.pack(pady=(10, 0))
 
-        self.course_options = self.get_courses()
-        if not self.course_options:
-            messagebox.showerror("No Courses", "No courses available to register.")
-            self.destroy()
-            return
-
         self.selected_course = tk.StringVar(self)
-        self.selected_course.set(self.course_options[0])
-
-        self.dropdown_courses = ttk.Combobox(
+        self.dropdown_courses = TypeAheadCombobox(
             self,
+            self.database.search_courses_by_prefix,
             textvariable=self.selected_course,
-            values=self.course_options,
-            state="readonly",
             width=47,
         )
+        self.course_options = self.dropdown_courses["values"]
+        if not self.course_options:
+            messagebox.showerror("No Courses", "No courses available to register.")
+            self.destroy()
+            return
+        self.selected_course.set(self.course_options[0])
         self.dropdown_courses.pack(pady=5)
 
         self.button_register = Button(
@@ -1215,26 +1948,6 @@ class RegisterCourse(Toplevel):
         )
         self.button_register.pack(pady=20)
 
-    def get_students(self) -> list[str]:
-        """
-        Retrieve a list of students formatted for the dropdown menu.
-
-        Returns:
-            list[str]: A list of strings in the format "student_id: name".
-        """
-        students = self.database.get_students()
-        return [f"{student[0]}: {student[1]}" for student in students]
-
-    def get_courses(self) -> list[str]:
-        """
-        Retrieve a list of courses formatted for the dropdown menu.
-
-        Returns:
-            list[str]: A list of strings in the format "course_id: course_name".
-        """
-        courses = self.database.get_courses()
-        return [f"{course[0]}: {course[1]}" for course in courses]
-
     def register(self):
         """
         Register the selected student to the selected course.
@@ -1246,39 +1959,30 @@ class RegisterCourse(Toplevel):
             messagebox.showerror: If input validation fails or registration fails.
             messagebox.showinfo: If registration is successful.
         """
-        selected_student = self.selected_student.get()
-        selected_course = self.selected_course.get()
+        student_id = self.dropdown_students.selected_id()
+        course_id = self.dropdown_courses.selected_id()
 
-        if not selected_student or not selected_course:
+        if not student_id or not course_id:
             messagebox.showerror(
                 "Input Error", "Both Student and Course must be selected!"
             )
             return
 
-        try:
-            student_id, student_name = selected_student.split(": ", 1)
-        except ValueError:
-            messagebox.showerror("Input Error", "Invalid student selection.")
-            return
-
-        try:
-            course_id, course_name = selected_course.split(": ", 1)
-        except ValueError:
-            messagebox.showerror("Input Error", "Invalid course selection.")
-            return
-
         student_record = self.database.get_student_by_id(student_id)
         if not student_record:
             messagebox.showerror("Error", f"Student ID {student_id} does not exist.")
             return
 
+        course_record = self.database.get_course_by_id(course_id)
+        if not course_record:
+            messagebox.showerror("Error", f"Course ID {course_id} does not exist.")
+            return
+
         success = self.database.register_student_to_course(student_id, course_id)
         if success:
             messagebox.showinfo(
-                "Success", f"Student {student_record[1]} registered for {course_name}!"
+                "Success", f"Student {student_record[1]} registered for {course_record[1]}!"
             )
-            self.refresh_callback()
-            self.refresh_all_records_callback()
             self.destroy()
         else:
             messagebox.showerror("Error", "Failed to register student for the course.")
@@ -1289,68 +1993,59 @@ class AssignInstructor(Toplevel):
     A window for assigning an instructor to a course.
 
     This window allows the user to select an instructor and a course from dropdown menus.
-    Upon successful assignment, it refreshes the courses and all records views.
+    Upon successful assignment, the main window picks the change up through
+    the database change notifications.
     """
 
-    def __init__(self, database, refresh_courses_callback, refresh_all_records_callback):
+    def __init__(self, database):
         """
         Initialize the AssignInstructor window.
 
         Args:
             database (Database): The database instance to interact with.
-            refresh_courses_callback (callable): Function to refresh the courses view.
-            refresh_all_records_callback (callable): Function to refresh the all records view.
         """
         super().__init__()
         self.title("Assign Instructor to Course")
         self.database = database
-        self.refresh_courses_callback = refresh_courses_callback
-        self.refresh_all_records_callback = refresh_all_records_callback
 
         self.label_instructor = tk.Label(self, text="Select Instructor:")
         self.label_instructor.pack(pady=(10, 0))
 
-        self.instructor_options = self.get_instructors()
+        self.selected_instructor = tk.StringVar(self)
+        self.dropdown_instructors = TypeAheadCombobox(
+            self,
+            self.database.search_instructors_by_prefix,
+            textvariable=self.selected_instructor,
+            width=47,
+        )
+        self.instructor_options = self.dropdown_instructors["values"]
         if not self.instructor_options:
             messagebox.showerror(
                 "No Instructors", "No instructors available to assign."
             )
             self.destroy()
             return
-
-        self.selected_instructor = tk.StringVar(self)
         self.selected_instructor.set(self.instructor_options[0])
-
-        self.dropdown_instructors = ttk.Combobox(
-            self,
-            textvariable=self.selected_instructor,
-            values=self.instructor_options,
-            state="readonly",
-            width=47,
-        )
         self.dropdown_instructors.pack(pady=5)
 
         self.label_course = tk.Label(self, text="Select Course:")
         self.label_course.pack(pady=(10, 0))
 
-        self.course_options = self.get_courses()
+        self.selected_course = tk.StringVar(self)
+        self.dropdown_courses = TypeAheadCombobox(
+            self,
+            self.database.search_courses_by_prefix,
+            textvariable=self.selected_course,
+            width=47,
+        )
+        self.course_options = self.dropdown_courses["values"]
         if not self.course_options:
             messagebox.showerror(
                 "No Courses", "No courses available to assign instructors."
             )
             self.destroy()
             return
-
-        self.selected_course = tk.StringVar(self)
         self.selected_course.set(self.course_options[0])
-
-        self.dropdown_courses = ttk.Combobox(
-            self,
-            textvariable=self.selected_course,
-            values=self.course_options,
-            state="readonly",
-            width=47,
-        )
         self.dropdown_courses.pack(pady=5)
 
         self.button_assign = Button(
@@ -1358,26 +2053,6 @@ class AssignInstructor(Toplevel):
         )
         self.button_assign.pack(pady=20)
 
-    def get_instructors(self) -> list[str]:
-        """
-        Retrieve a list of instructors formatted for the dropdown menu.
-
-        Returns:
-            list[str]: A list of strings in the format "instructor_id: name".
-        """
-        instructors = self.database.get_instructors()
-        return [f"{instr[0]}: {instr[1]}" for instr in instructors]
-
-    def get_courses(self) -> list[str]:
-        """
-        Retrieve a list of courses formatted for the dropdown menu.
-
-        Returns:
-            list[str]: A list of strings in the format "course_id: course_name".
-        """
-        courses = self.database.get_courses()
-        return [f"{course[0]}: {course[1]}" for course in courses]
-
     def assign(self):
         """
         Assign the selected instructor to the selected course.
@@ -1389,29 +2064,26 @@ class AssignInstructor(Toplevel):
             messagebox.showerror: If input validation fails or assignment fails.
             messagebox.showinfo: If assignment is successful.
         """
-        selected_instructor = self.selected_instructor.get()
-        selected_course = self.selected_course.get()
+        instructor_id = self.dropdown_instructors.selected_id()
+        course_id = self.dropdown_courses.selected_id()
 
-        if not selected_instructor or not selected_course:
+        if not instructor_id or not course_id:
             messagebox.showerror(
                 "Input Error", "Both Instructor and Course must be selected!"
             )
             return
 
-        try:
-            instructor_id, instructor_name = selected_instructor.split(": ", 1)
-            course_id, course_name = selected_course.split(": ", 1)
-        except ValueError:
-            messagebox.showerror("Input Error", "Invalid selection format.")
+        instructor_record = self.database.get_instructor_by_id(instructor_id)
+        course_record = self.database.get_course_by_id(course_id)
+        if not instructor_record or not course_record:
+            messagebox.showerror("Input Error", "Invalid selection.")
             return
 
         success = self.database.assign_instructor_to_course(instructor_id, course_id)
         if success:
             messagebox.showinfo(
-                "Success", f"Instructor {instructor_name} assigned to {course_name}!"
+                "Success", f"Instructor {instructor_record[1]} assigned to {course_record[1]}!"
             )
-            self.refresh_courses_callback()
-            self.refresh_all_records_callback()
             self.destroy()
         else:
             messagebox.showerror("Error", "Failed to assign instructor to the course.")
@@ -1422,25 +2094,22 @@ class EditStudent(Toplevel):
     A window for editing an existing student's information.
 
     This window allows the user to update the name, age, and email of a selected student.
-    Upon successful update, it refreshes the student and all records views.
+    Upon successful update, the main window picks the change up through
+    the database change notifications.
     """
 
-    def __init__(self, database, student_values, refresh_callback, refresh_all_records_callback):
+    def __init__(self, database, student_values):
         """
         Initialize the EditStudent window.
 
         Args:
             database (Database): The database instance to interact with.
             student_values (tuple): The selected student's values from the treeview.
-            refresh_callback (callable): Function to refresh the students view.
-            refresh_all_records_callback (callable): Function to refresh the all records view.
         """
         super().__init__()
         self.title("Edit Student")
         self.database = database
         self.student_id = student_values[0]
-        self.refresh_callback = refresh_callback
-        self.refresh_all_records_callback = refresh_all_records_callback
 
         self.student_record = self.database.get_student_by_id(self.student_id)
         if not self.student_record:
@@ -1476,7 +2145,7 @@ class EditStudent(Toplevel):
         Update the student's information in the database based on the input fields.
 
         Validates input data and shows appropriate error messages. If successful,
-        refreshes the views and closes the window.
+        closes the window.
 
         Raises:
             messagebox.showerror: If input validation fails or update to the database fails.
@@ -1507,8 +2176,6 @@ class EditStudent(Toplevel):
             messagebox.showinfo(
                 "Success", f"Student {updated_student.name} updated successfully!"
             )
-            self.refresh_callback()
-            self.refresh_all_records_callback()
             self.destroy()
         else:
             messagebox.showerror(
@@ -1521,27 +2188,22 @@ class EditInstructor(Toplevel):
     A window for editing an existing instructor's information.
 
     This window allows the user to update the name, age, and email of a selected instructor.
-    Upon successful update, it refreshes the instructor, courses, and all records views.
+    Upon successful update, the main window picks the change up through
+    the database change notifications.
     """
 
-    def __init__(self, database, instructor_values, refresh_callback, refresh_courses_callback, refresh_all_records_callback):
+    def __init__(self, database, instructor_values):
         """
         Initialize the EditInstructor window.
 
         Args:
             database (Database): The database instance to interact with.
             instructor_values (tuple): The selected instructor's values from the treeview.
-            refresh_callback (callable): Function to refresh the instructors view.
-            refresh_courses_callback (callable): Function to refresh the courses view.
-            refresh_all_records_callback (callable): Function to refresh the all records view.
         """
         super().__init__()
         self.title("Edit Instructor")
         self.database = database
         self.instructor_id = instructor_values[0]
-        self.refresh_callback = refresh_callback
-        self.refresh_courses_callback = refresh_courses_callback
-        self.refresh_all_records_callback = refresh_all_records_callback
 
         self.instructor_record = self.database.get_instructor_by_id(self.instructor_id)
         if not self.instructor_record:
@@ -1577,7 +2239,7 @@ class EditInstructor(Toplevel):
         Update the instructor's information in the database based on the input fields.
 
         Validates input data and shows appropriate error messages. If successful,
-        refreshes the views and closes the window.
+        closes the window.
 
         Raises:
             messagebox.showerror: If input validation fails or update to the database fails.
@@ -1608,9 +2270,6 @@ class EditInstructor(Toplevel):
             messagebox.showinfo(
                 "Success", f"Instructor {updated_instructor.name} updated successfully!"
             )
-            self.refresh_callback()
-            self.refresh_courses_callback()
-            self.refresh_all_records_callback()
             self.destroy()
         else:
             messagebox.showerror(
@@ -1623,26 +2282,22 @@ class EditCourse(Toplevel):
     A window for editing an existing course's information.
 
     This window allows the user to update the course name and optionally assign
-    an instructor to the course. Upon successful update, it refreshes the courses
-    and all records views.
+    an instructor to the course. Upon successful update, the main window picks the
+    change up through the database change notifications.
     """
 
-    def __init__(self, database, course_values, refresh_callback, refresh_all_records_callback):
+    def __init__(self, database, course_values):
         """
         Initialize the EditCourse window.
 
         Args:
             database (Database): The database instance to interact with.
             course_values (tuple): The selected course's values from the treeview.
-            refresh_callback (callable): Function to refresh the courses view.
-            refresh_all_records_callback (callable): Function to refresh the all records view.
         """
         super().__init__()
         self.title("Edit Course")
         self.database = database
         self.course_id = course_values[0]
-        self.refresh_callback = refresh_callback
-        self.refresh_all_records_callback = refresh_all_records_callback
 
         self.course_record = self.database.get_course_by_id(self.course_id)
         if not self.course_record:
@@ -1659,23 +2314,20 @@ class EditCourse(Toplevel):
         self.label_instructor = tk.Label(self, text="Assign Instructor (Optional):")
         self.label_instructor.pack(pady=(10, 0))
 
-        instructors = self.database.get_instructors()
-        instructor_list = [f"{instr[0]}: {instr[1]}" for instr in instructors]
-        instructor_list.insert(0, "None")
-
         self.selected_instructor = tk.StringVar(self)
-        current_instructor_id = self.course_record[2] if self.course_record[2] else "None"
-        if current_instructor_id != "None" and current_instructor_id:
-            instructor_name = next((f"{instr[0]}: {instr[1]}" for instr in instructors if instr[0] == current_instructor_id), "None")
-            self.selected_instructor.set(instructor_name)
+        current_instructor = (
+            self.database.get_instructor_by_id(self.course_record[2]) if self.course_record[2] else None
+        )
+        if current_instructor:
+            self.selected_instructor.set(f"{current_instructor[0]}: {current_instructor[1]}")
         else:
             self.selected_instructor.set("None")
 
-        self.dropdown_instructors = ttk.Combobox(
+        self.dropdown_instructors = TypeAheadCombobox(
             self,
+            self.database.search_instructors_by_prefix,
+            allow_none=True,
             textvariable=self.selected_instructor,
-            values=instructor_list,
-            state="readonly",
             width=47,
         )
         self.dropdown_instructors.pack(pady=5)
@@ -1690,15 +2342,13 @@ class EditCourse(Toplevel):
         Update the course's information in the database based on the input fields.
 
         Validates input data, handles optional instructor assignment, and shows
-        appropriate error messages. If successful, refreshes the views and closes
-        the window.
+        appropriate error messages. If successful, closes the window.
 
         Raises:
             messagebox.showerror: If input validation fails or update to the database fails.
             messagebox.showinfo: If the course is updated successfully.
         """
         course_name = self.entry_course_name.get().strip()
-        selected_instructor = self.selected_instructor.get()
 
         if not course_name:
             messagebox.showerror(
@@ -1706,11 +2356,11 @@ class EditCourse(Toplevel):
             )
             return
 
-        if selected_instructor == "None":
+        instructor_id = self.dropdown_instructors.selected_id()
+        if instructor_id is None:
             instructor = None
         else:
             try:
-                instructor_id, instructor_name = selected_instructor.split(": ", 1)
                 instructor_record = self.database.get_instructor_by_id(instructor_id)
                 if not instructor_record:
                     messagebox.showerror("Error", "Selected instructor does not exist.")
@@ -1736,8 +2386,6 @@ class EditCourse(Toplevel):
             messagebox.showinfo(
                 "Success", f"Course {updated_course.course_name} updated successfully!"
             )
-            self.refresh_callback()
-            self.refresh_all_records_callback()
             self.destroy()
         else:
             messagebox.showerror(
@@ -1745,6 +2393,145 @@ class EditCourse(Toplevel):
             )
 
 
+class DiagnosticsWindow(Toplevel):
+    """
+    A window showing the query statistics and the slow-query log.
+
+    Statements are listed slowest in total first. Selecting a slow query shows the
+    query plan SQLite chose for it. The report can be exported as JSON.
+    """
+
+    STATEMENT_COLUMNS = ("Calls", "Total ms", "Mean ms", "P95 ms", "Rows", "SQL")
+    SLOW_COLUMNS = ("Time", "ms", "Rows", "SQL")
+
+    def __init__(self, instrumentation, recording):
+        """
+        Initialize the DiagnosticsWindow.
+
+        Args:
+            instrumentation (QueryInstrumentation): The statistics to show.
+            recording (tk.BooleanVar): Whether statistics are currently being recorded.
+        """
+        super().__init__()
+        self.title("Diagnostics")
+        self.geometry("900x600")
+        self.instrumentation = instrumentation
+        self.recording = recording
+        self.slow_queries = []
+
+        self.label_status = tk.Label(self, anchor="w")
+        self.label_status.pack(fill=tk.X, padx=10, pady=(10, 0))
+
+        tk.Label(self, text="Statements:").pack(anchor="w", padx=10, pady=(10, 0))
+        self.tree_statements = self.create_tree(self.STATEMENT_COLUMNS, height=10)
+
+        tk.Label(self, text="Slow Queries:").pack(anchor="w", padx=10, pady=(10, 0))
+        self.tree_slow = self.create_tree(self.SLOW_COLUMNS, height=6)
+        self.tree_slow.bind("<<TreeviewSelect>>", self.show_plan)
+
+        self.text_plan = tk.Text(self, height=6, state=tk.DISABLED)
+        self.text_plan.pack(fill=tk.X, padx=10, pady=5)
+
+        buttons = Frame(self)
+        buttons.pack(pady=10)
+        Button(buttons, text="Refresh", width=15, command=self.refresh).pack(side=tk.LEFT, padx=5)
+        Button(buttons, text="Reset", width=15, command=self.reset).pack(side=tk.LEFT, padx=5)
+        Button(buttons, text="Export JSON", width=15, command=self.export).pack(side=tk.LEFT, padx=5)
+
+        self.refresh()
+
+    def create_tree(self, columns, height):
+        """
+        Create and pack a Treeview whose last column, the SQL text, takes the spare width.
+
+        Args:
+            columns (tuple): The column headings.
+            height (int): Number of visible rows.
+
+        Returns:
+            ttk.Treeview: The new treeview.
+        """
+        tree = ttk.Treeview(self, columns=columns, show="headings", height=height)
+        for column in columns:
+            tree.heading(column, text=column)
+            tree.column(column, width=80, stretch=False, anchor="e")
+        tree.column(columns[-1], width=400, stretch=True, anchor="w")
+        tree.pack(fill=tk.BOTH, expand=True, padx=10)
+        return tree
+
+    def refresh(self):
+        """
+        Reload both tables from the instrumentation.
+        """
+        statements = self.instrumentation.statements()
+        self.slow_queries = self.instrumentation.slow_queries()
+        state = "on" if self.recording.get() else "off (enable it in the Diagnostics menu)"
+        self.label_status.config(
+            text=f"Recording: {state}    Slow query threshold: "
+            f"{self.instrumentation.slow_threshold * 1000:.0f} ms"
+        )
+
+        self.tree_statements.delete(*self.tree_statements.get_children())
+        for stats in statements:
+            self.tree_statements.insert("", tk.END, values=(
+                stats["calls"],
+                f"{stats['total_ms']:.1f}",
+                f"{stats['mean_ms']:.2f}",
+                f"{stats['p95_ms']:.2f}",
+                stats["rows"],
+                stats["sql"],
+            ))
+
+        self.tree_slow.delete(*self.tree_slow.get_children())
+        for index, query in enumerate(reversed(self.slow_queries)):
+            self.tree_slow.insert("", tk.END, iid=str(index), values=(
+                query["time"], f"{query['duration_ms']:.1f}", query["rows"], query["sql"]
+            ))
+        self.show_plan()
+
+    def show_plan(self, event=None):
+        """
+        Show the query plan of the selected slow query.
+        """
+        selected = self.tree_slow.selection()
+        plan = ""
+        if selected:
+            query = self.slow_queries[len(self.slow_queries) - 1 - int(selected[0])]
+            plan = "\n".join(query["plan"]) or "No query plan available."
+            if query["params"]:
+                plan = f"Parameters: {', '.join(query['params'])}\n{plan}"
+        self.text_plan.config(state=tk.NORMAL)
+        self.text_plan.delete("1.0", tk.END)
+        self.text_plan.insert(tk.END, plan)
+        self.text_plan.config(state=tk.DISABLED)
+
+    def reset(self):
+        """
+        Discard the recorded statistics.
+        """
+        self.instrumentation.reset()
+        self.refresh()
+
+    def export(self):
+        """
+        Save the statistics and the slow-query log to a JSON file.
+
+        Raises:
+            messagebox.showerror: If writing the file fails.
+            messagebox.showinfo: If the report is saved successfully.
+        """
+        filepath = filedialog.asksaveasfilename(
+            parent=self, defaultextension=".json", filetypes=[("JSON files", "*.json")]
+        )
+        if not filepath:
+            return
+        try:
+            self.instrumentation.dump(filepath)
+            messagebox.showinfo("Success", f"Diagnostics saved successfully to {filepath}.", parent=self)
+        except OSError as e:
+            messagebox.showerror("Error", f"Failed to save diagnostics: {e}", parent=self)
+
+
 def main():
     """
     Initialize and start the School Management System application.
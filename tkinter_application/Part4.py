@@ -8,19 +8,781 @@ courses, and registrations.
 
 Dependencies:
     - sqlite3: For interacting with the SQLite database.
+    - threading, queue: For running database jobs on a background thread.
+    - asyncio, concurrent.futures: For the AsyncDatabase facade.
+    - json: For dumping query statistics.
     - typing: For type annotations.
     - Part1: Contains the Course, Instructor, and Student classes.
 
+Constants:
+    SCHEMA_MIGRATIONS: Schema upgrades applied in order through PRAGMA user_version.
+    CONNECTION_PROFILES: Named PRAGMA presets ("durable", "fast-import", "read-mostly").
+
 Classes:
+    BulkInsertReport: Outcome of a bulk insert, with per-row failures.
+    ConnectionPool: A bounded pool of SQLite connections shared between threads.
+    QueryInstrumentation: Opt-in per-statement timing and a slow-query log.
+    InstrumentedCursor: A cursor wrapper that reports to a QueryInstrumentation.
+    RowCache: A bounded LRU cache of rows looked up by primary key.
     Database: Manages all database operations including CRUD for students, instructors,
              courses, and registrations.
+    JobCancelled: Raised when a background database job is cancelled.
+    DatabaseJob: A unit of work queued on a DatabaseWorker.
+    DatabaseWorker: Runs database jobs on a dedicated thread with its own connection.
+    AsyncDatabase: Coroutine versions of every Database method, run on dedicated threads.
 """
 
+import asyncio
+import functools
+import json
+import queue
 import sqlite3
-from typing import List, Optional, Tuple
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from itertools import islice
+from typing import AsyncIterator, Callable, ContextManager, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from Part1 import Course, Instructor, Student
 
+# Schema upgrades, applied in order on top of the base tables. Entry ``n`` moves a
+# database from ``PRAGMA user_version`` n to n + 1, so existing files are upgraded
+# in place the next time they are opened. Only ever append to this list.
+SCHEMA_MIGRATIONS: List[Tuple[str, ...]] = [
+    (
+        "CREATE INDEX IF NOT EXISTS idx_registrations_course ON registrations(course_id)",
+        "CREATE INDEX IF NOT EXISTS idx_courses_instructor ON courses(instructor_id)",
+        "CREATE INDEX IF NOT EXISTS idx_students_id_nocase ON students(student_id COLLATE NOCASE)",
+        "CREATE INDEX IF NOT EXISTS idx_students_name_nocase ON students(name COLLATE NOCASE)",
+        "CREATE INDEX IF NOT EXISTS idx_instructors_id_nocase ON instructors(instructor_id COLLATE NOCASE)",
+        "CREATE INDEX IF NOT EXISTS idx_instructors_name_nocase ON instructors(name COLLATE NOCASE)",
+        "CREATE INDEX IF NOT EXISTS idx_courses_id_nocase ON courses(course_id COLLATE NOCASE)",
+        "CREATE INDEX IF NOT EXISTS idx_courses_name_nocase ON courses(course_name COLLATE NOCASE)",
+    ),
+    # Full-text search: one external-content FTS5 table per entity, kept in sync by
+    # triggers and rebuilt from the base table when the migration first runs.
+    (
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS students_fts
+        USING fts5(student_id, name, content='students', prefix='2 3')
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS students_fts_insert AFTER INSERT ON students BEGIN
+            INSERT INTO students_fts (rowid, student_id, name)
+            VALUES (new.rowid, new.student_id, new.name);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS students_fts_delete AFTER DELETE ON students BEGIN
+            INSERT INTO students_fts (students_fts, rowid, student_id, name)
+            VALUES ('delete', old.rowid, old.student_id, old.name);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS students_fts_update AFTER UPDATE OF student_id, name ON students BEGIN
+            INSERT INTO students_fts (students_fts, rowid, student_id, name)
+            VALUES ('delete', old.rowid, old.student_id, old.name);
+            INSERT INTO students_fts (rowid, student_id, name)
+            VALUES (new.rowid, new.student_id, new.name);
+        END
+        """,
+        "INSERT INTO students_fts (students_fts) VALUES ('rebuild')",
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS instructors_fts
+        USING fts5(instructor_id, name, content='instructors', prefix='2 3')
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS instructors_fts_insert AFTER INSERT ON instructors BEGIN
+            INSERT INTO instructors_fts (rowid, instructor_id, name)
+            VALUES (new.rowid, new.instructor_id, new.name);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS instructors_fts_delete AFTER DELETE ON instructors BEGIN
+            INSERT INTO instructors_fts (instructors_fts, rowid, instructor_id, name)
+            VALUES ('delete', old.rowid, old.instructor_id, old.name);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS instructors_fts_update AFTER UPDATE OF instructor_id, name ON instructors BEGIN
+            INSERT INTO instructors_fts (instructors_fts, rowid, instructor_id, name)
+            VALUES ('delete', old.rowid, old.instructor_id, old.name);
+            INSERT INTO instructors_fts (rowid, instructor_id, name)
+            VALUES (new.rowid, new.instructor_id, new.name);
+        END
+        """,
+        "INSERT INTO instructors_fts (instructors_fts) VALUES ('rebuild')",
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS courses_fts
+        USING fts5(course_id, course_name, content='courses', prefix='2 3')
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS courses_fts_insert AFTER INSERT ON courses BEGIN
+            INSERT INTO courses_fts (rowid, course_id, course_name)
+            VALUES (new.rowid, new.course_id, new.course_name);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS courses_fts_delete AFTER DELETE ON courses BEGIN
+            INSERT INTO courses_fts (courses_fts, rowid, course_id, course_name)
+            VALUES ('delete', old.rowid, old.course_id, old.course_name);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS courses_fts_update AFTER UPDATE OF course_id, course_name ON courses BEGIN
+            INSERT INTO courses_fts (courses_fts, rowid, course_id, course_name)
+            VALUES ('delete', old.rowid, old.course_id, old.course_name);
+            INSERT INTO courses_fts (rowid, course_id, course_name)
+            VALUES (new.rowid, new.course_id, new.course_name);
+        END
+        """,
+        "INSERT INTO courses_fts (courses_fts) VALUES ('rebuild')",
+    ),
+    # Per-course aggregates: one course_stats row per course with its instructor and
+    # number of enrolled students, kept current by triggers so counts never need a
+    # COUNT(*) over registrations. Backfilled from the existing rows.
+    (
+        """
+        CREATE TABLE IF NOT EXISTS course_stats (
+            course_id TEXT PRIMARY KEY,
+            instructor_id TEXT,
+            enrolled INTEGER NOT NULL DEFAULT 0
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_course_stats_instructor ON course_stats(instructor_id)",
+        """
+        CREATE TRIGGER IF NOT EXISTS course_stats_course_insert AFTER INSERT ON courses BEGIN
+            INSERT INTO course_stats (course_id, instructor_id, enrolled)
+            VALUES (new.course_id, new.instructor_id, 0);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS course_stats_course_delete AFTER DELETE ON courses BEGIN
+            DELETE FROM course_stats WHERE course_id = old.course_id;
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS course_stats_course_update AFTER UPDATE OF course_id, instructor_id ON courses BEGIN
+            UPDATE course_stats SET course_id = new.course_id, instructor_id = new.instructor_id
+            WHERE course_id = old.course_id;
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS course_stats_registration_insert AFTER INSERT ON registrations BEGIN
+            UPDATE course_stats SET enrolled = enrolled + 1 WHERE course_id = new.course_id;
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS course_stats_registration_delete AFTER DELETE ON registrations BEGIN
+            UPDATE course_stats SET enrolled = enrolled - 1 WHERE course_id = old.course_id;
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS course_stats_registration_update AFTER UPDATE OF course_id ON registrations BEGIN
+            UPDATE course_stats SET enrolled = enrolled - 1 WHERE course_id = old.course_id;
+            UPDATE course_stats SET enrolled = enrolled + 1 WHERE course_id = new.course_id;
+        END
+        """,
+        "DELETE FROM course_stats",
+        """
+        INSERT INTO course_stats (course_id, instructor_id, enrolled)
+        SELECT c.course_id, c.instructor_id,
+               (SELECT COUNT(*) FROM registrations r WHERE r.course_id = c.course_id)
+        FROM courses c
+        """,
+    ),
+]
+
+
+# Adds the registrations with an id above ? to the course_stats counts. Bulk
+# registration imports run it once in place of the per-row insert trigger, which would
+# otherwise open a statement journal for every row. Registration ids come from
+# AUTOINCREMENT, so the rows an import added are exactly those above the largest id
+# before it started, and only the courses they name are touched. The unary + keeps the
+# planner from grouping through idx_registrations_course, which would scan every row,
+# so it reads just the new id range instead.
+ADD_NEW_ENROLLMENTS = """
+    UPDATE course_stats
+    SET enrolled = enrolled + added.count
+    FROM (
+        SELECT course_id, COUNT(*) AS count FROM registrations WHERE id > ? GROUP BY +course_id
+    ) AS added
+    WHERE course_stats.course_id = added.course_id
+"""
+
+
+# Named connection settings, applied as PRAGMAs when a Database is opened. All of them
+# use WAL journaling, so readers on other connections are not blocked by a writer, and
+# enforce foreign keys. Every profile sets the same PRAGMAs, so switching profiles on an
+# open connection leaves nothing behind from the previous one.
+#   durable:     every commit is synced to disk before it returns.
+#   fast-import: commits are only synced at checkpoints and the page cache is large,
+#                for bulk loads. A power cut can lose the last commits, but not corrupt
+#                the file.
+#   read-mostly: like fast-import, plus memory-mapped reads for search-heavy use.
+CONNECTION_PROFILES: Dict[str, Dict[str, object]] = {
+    "durable": {
+        "journal_mode": "WAL",
+        "synchronous": "FULL",
+        "cache_size": -2000,
+        "mmap_size": 0,
+        "wal_autocheckpoint": 1000,
+        "busy_timeout": 5000,
+        "temp_store": "MEMORY",
+        "foreign_keys": "ON",
+    },
+    "fast-import": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -65536,
+        "mmap_size": 0,
+        "wal_autocheckpoint": 10000,
+        "busy_timeout": 5000,
+        "temp_store": "MEMORY",
+        "foreign_keys": "ON",
+    },
+    "read-mostly": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -32768,
+        "mmap_size": 268435456,
+        "wal_autocheckpoint": 1000,
+        "busy_timeout": 5000,
+        "temp_store": "MEMORY",
+        "foreign_keys": "ON",
+    },
+}
+
+DEFAULT_PROFILE = "durable"
+
+
+class BulkInsertReport:
+    """
+    Outcome of a bulk insert.
+
+    Every input row either counts towards ``succeeded`` or is listed in ``failures``
+    together with its position in the input and the reason it was rejected.
+
+    Attributes:
+        succeeded (int): Number of rows that were written.
+        failures (List[Tuple[int, str, str]]): ``(row_number, key, error)`` for every
+            rejected row. Row numbers start at 0.
+        warnings (List[Tuple[int, str, str]]): ``(row_number, key, message)`` for rows
+            that were written, but with a value the caller had to change.
+    """
+
+    def __init__(self):
+        """
+        Initialize an empty report.
+        """
+        self.succeeded = 0
+        self.failures: List[Tuple[int, str, str]] = []
+        self.warnings: List[Tuple[int, str, str]] = []
+
+    @property
+    def total(self) -> int:
+        """
+        int: Number of rows processed, successful or not.
+        """
+        return self.succeeded + len(self.failures)
+
+    def __repr__(self):
+        return f"BulkInsertReport(succeeded={self.succeeded}, failed={len(self.failures)})"
+
+
+class ConnectionPool:
+    """
+    A bounded pool of SQLite connections shared between threads.
+
+    Connections are opened lazily, up to ``size``, and leased to one thread at a time.
+    When all of them are leased, acquire waits for one to be returned.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], sqlite3.Connection],
+        size: int,
+        configure: Optional[Callable[[sqlite3.Connection], None]] = None,
+        timeout: float = 30.0,
+    ):
+        """
+        Initialize an empty pool.
+
+        Args:
+            connect (Callable[[], sqlite3.Connection]): Opens and configures a new connection.
+            size (int): Maximum number of connections.
+            configure (Optional[Callable[[sqlite3.Connection], None]], optional): Applies
+                the current settings to an open connection after reconfigure was called.
+            timeout (float, optional): Seconds acquire waits for a free connection.
+                Defaults to 30.
+        """
+        self.size = size
+        self.timeout = timeout
+        self._connect = connect
+        self._configure = configure
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._generations: Dict[sqlite3.Connection, int] = {}
+        self._opening = 0
+        self._waiting = 0
+        self._generation = 0
+        self._closed = False
+        self._stats = {"leases": 0, "waits": 0, "wait_time": 0.0, "in_use": 0, "peak_in_use": 0}
+
+    def acquire(self) -> sqlite3.Connection:
+        """
+        Lease a connection, opening a new one if the pool is not full yet.
+
+        Returns:
+            sqlite3.Connection: The leased connection. Return it with release.
+
+        Raises:
+            sqlite3.OperationalError: If the pool is closed, or no connection was returned
+            within ``timeout``.
+        """
+        if self._closed:
+            raise sqlite3.OperationalError("The connection pool is closed.")
+        try:
+            # Leave returned connections to threads already waiting for one.
+            if self._waiting:
+                raise queue.Empty
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                create = len(self._generations) + self._opening < self.size
+                if create:
+                    self._opening += 1
+                    generation = self._generation
+                else:
+                    self._waiting += 1
+            if create:
+                try:
+                    conn = self._connect()
+                finally:
+                    with self._lock:
+                        self._opening -= 1
+                with self._lock:
+                    self._generations[conn] = generation
+            else:
+                start = time.perf_counter()
+                try:
+                    conn = self._idle.get(timeout=self.timeout)
+                except queue.Empty:
+                    raise sqlite3.OperationalError("Timed out waiting for a pooled connection.") from None
+                finally:
+                    with self._lock:
+                        self._waiting -= 1
+                with self._lock:
+                    self._stats["waits"] += 1
+                    self._stats["wait_time"] += time.perf_counter() - start
+        with self._lock:
+            stale = self._generations[conn] != self._generation
+            self._generations[conn] = self._generation
+            self._stats["leases"] += 1
+            self._stats["in_use"] += 1
+            self._stats["peak_in_use"] = max(self._stats["peak_in_use"], self._stats["in_use"])
+        if stale and self._configure:
+            self._configure(conn)
+        return conn
+
+    def release(self, conn: sqlite3.Connection):
+        """
+        Return a leased connection to the pool.
+
+        Args:
+            conn (sqlite3.Connection): A connection obtained from acquire.
+        """
+        if conn.in_transaction:
+            conn.rollback()
+        with self._lock:
+            self._stats["in_use"] -= 1
+            if self._closed:
+                self._generations.pop(conn, None)
+        if self._closed:
+            conn.close()
+        else:
+            self._idle.put(conn)
+
+    def reconfigure(self):
+        """
+        Mark every open connection as stale, so it is configured again on its next lease.
+        """
+        with self._lock:
+            self._generation += 1
+
+    def stats(self) -> Dict[str, object]:
+        """
+        Report lease accounting.
+
+        Returns:
+            Dict[str, object]: ``size``, ``open`` connections, total ``leases``, how many
+            leases had to ``wait`` and the total ``wait_time`` in seconds, and the current
+            and peak number of connections ``in_use``.
+        """
+        with self._lock:
+            return {"size": self.size, "open": len(self._generations), **self._stats}
+
+    def close(self):
+        """
+        Close every idle connection. Leased connections are closed when returned.
+        """
+        self._closed = True
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            with self._lock:
+                self._generations.pop(conn, None)
+            conn.close()
+
+
+class QueryInstrumentation:
+    """
+    Opt-in query statistics and slow-query log.
+
+    Attach an instance to one or more Database objects with Database.set_instrumentation.
+    Every statement their cursors run is then timed from ``execute`` until its last
+    row has been fetched, and aggregated by SQL text: call count, total, mean and
+    95th-percentile latency, and rows returned. Statements slower than
+    ``slow_threshold`` are also kept in a bounded slow-query log together with their
+    ``EXPLAIN QUERY PLAN`` output. Recording is thread-safe.
+    """
+
+    # Latency samples kept per statement for the percentile.
+    SAMPLE_SIZE = 1000
+
+    # Statements whose plan is worth capturing; PRAGMA, BEGIN, SAVEPOINT, etc. have none.
+    EXPLAINABLE = ("SELECT", "WITH", "INSERT", "UPDATE", "DELETE", "REPLACE")
+
+    def __init__(self, slow_threshold: float = 0.05, slow_log_size: int = 100):
+        """
+        Initialize empty statistics.
+
+        Args:
+            slow_threshold (float, optional): Seconds after which a statement is logged as
+                slow. Defaults to 0.05.
+            slow_log_size (int, optional): Number of slow queries kept; the oldest are
+                dropped first. Defaults to 100.
+        """
+        self.slow_threshold = slow_threshold
+        self._lock = threading.Lock()
+        self._statements: Dict[str, Dict[str, object]] = {}
+        self._slow: "deque[Dict[str, object]]" = deque(maxlen=slow_log_size)
+
+    def record(self, conn: sqlite3.Connection, sql: str, params, elapsed: float, rows: int):
+        """
+        Add one finished statement to the statistics.
+
+        Args:
+            conn (sqlite3.Connection): The connection the statement ran on, used to
+                explain it if it was slow.
+            sql (str): The statement.
+            params: Its parameters, or None if it ran through ``executemany``.
+            elapsed (float): Seconds spent executing it and fetching its rows.
+            rows (int): Rows it returned.
+        """
+        statement = " ".join(sql.split())
+        plan = None
+        if elapsed >= self.slow_threshold:
+            plan = self._explain(conn, statement, params)
+        with self._lock:
+            stats = self._statements.get(statement)
+            if stats is None:
+                stats = self._statements[statement] = {
+                    "calls": 0,
+                    "total": 0.0,
+                    "rows": 0,
+                    "samples": deque(maxlen=self.SAMPLE_SIZE),
+                }
+            stats["calls"] += 1
+            stats["total"] += elapsed
+            stats["rows"] += rows
+            stats["samples"].append(elapsed)
+            if plan is not None:
+                self._slow.append(
+                    {
+                        "time": time.strftime("%Y-%m-%d %H:%M:%S"),
+                        "sql": statement,
+                        "params": None if params is None else [str(value) for value in params],
+                        "duration_ms": elapsed * 1000,
+                        "rows": rows,
+                        "plan": plan,
+                    }
+                )
+
+    def _explain(self, conn: sqlite3.Connection, statement: str, params) -> List[str]:
+        """
+        Run ``EXPLAIN QUERY PLAN`` for a statement and return the plan's detail lines,
+        indented by depth. Returns an empty list if the statement cannot be explained.
+        """
+        if params is None or not statement.upper().startswith(self.EXPLAINABLE):
+            return []
+        try:
+            rows = conn.execute(f"EXPLAIN QUERY PLAN {statement}", params).fetchall()
+        except sqlite3.Error:
+            return []
+        depth = {0: -1}
+        plan = []
+        for node, parent, _, detail in rows:
+            depth[node] = depth.get(parent, -1) + 1
+            plan.append("  " * depth[node] + detail)
+        return plan
+
+    def statements(self) -> List[Dict[str, object]]:
+        """
+        Summarize every statement seen so far, slowest in total first.
+
+        Returns:
+            List[Dict[str, object]]: ``sql``, ``calls``, ``total_ms``, ``mean_ms``,
+            ``p95_ms`` and ``rows`` for each statement.
+        """
+        with self._lock:
+            items = [(sql, dict(stats), sorted(stats["samples"])) for sql, stats in self._statements.items()]
+        summary = []
+        for sql, stats, samples in items:
+            p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+            summary.append(
+                {
+                    "sql": sql,
+                    "calls": stats["calls"],
+                    "total_ms": stats["total"] * 1000,
+                    "mean_ms": stats["total"] * 1000 / stats["calls"],
+                    "p95_ms": p95 * 1000,
+                    "rows": stats["rows"],
+                }
+            )
+        summary.sort(key=lambda row: row["total_ms"], reverse=True)
+        return summary
+
+    def slow_queries(self) -> List[Dict[str, object]]:
+        """
+        Return the slow-query log, oldest first.
+
+        Returns:
+            List[Dict[str, object]]: ``time``, ``sql``, ``params``, ``duration_ms``,
+            ``rows`` and the ``plan`` lines for each slow statement.
+        """
+        with self._lock:
+            return list(self._slow)
+
+    def reset(self):
+        """
+        Discard all statistics and the slow-query log.
+        """
+        with self._lock:
+            self._statements.clear()
+            self._slow.clear()
+
+    def dump(self, filename: str):
+        """
+        Write the statistics and the slow-query log to a JSON file.
+
+        Args:
+            filename (str): The file to write.
+        """
+        report = {
+            "slow_threshold_ms": self.slow_threshold * 1000,
+            "statements": self.statements(),
+            "slow_queries": self.slow_queries(),
+        }
+        with open(filename, "w") as file:
+            json.dump(report, file, indent=4)
+
+
+class InstrumentedCursor:
+    """
+    A sqlite3.Cursor wrapper that reports every statement to a QueryInstrumentation.
+
+    A statement is recorded once the next one starts or the cursor is closed, so the
+    time spent fetching its rows is included. Anything not overridden here is
+    delegated to the wrapped cursor.
+    """
+
+    def __init__(self, cursor: sqlite3.Cursor, instrumentation: QueryInstrumentation):
+        """
+        Wrap a cursor.
+
+        Args:
+            cursor (sqlite3.Cursor): The cursor to wrap.
+            instrumentation (QueryInstrumentation): Where to report statements.
+        """
+        self._cursor = cursor
+        self._instrumentation = instrumentation
+        self._sql: Optional[str] = None
+        self._params = None
+        self._elapsed = 0.0
+        self._rows = 0
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def __iter__(self):
+        return iter(self.fetchone, None)
+
+    def _timed(self, method, *args):
+        """
+        Call a method of the wrapped cursor and add its duration to the current statement.
+        """
+        start = time.perf_counter()
+        try:
+            return method(*args)
+        finally:
+            self._elapsed += time.perf_counter() - start
+
+    def _finish(self):
+        """
+        Report the current statement, if any.
+        """
+        if self._sql is not None:
+            self._instrumentation.record(self._cursor.connection, self._sql, self._params, self._elapsed, self._rows)
+            self._sql = None
+
+    def execute(self, sql: str, parameters=()) -> "InstrumentedCursor":
+        self._finish()
+        self._sql, self._params, self._elapsed, self._rows = sql, parameters, 0.0, 0
+        self._timed(self._cursor.execute, sql, parameters)
+        return self
+
+    def executemany(self, sql: str, seq_of_parameters) -> "InstrumentedCursor":
+        self._finish()
+        self._sql, self._params, self._elapsed, self._rows = sql, None, 0.0, 0
+        self._timed(self._cursor.executemany, sql, seq_of_parameters)
+        return self
+
+    def fetchone(self):
+        row = self._timed(self._cursor.fetchone)
+        if row is not None:
+            self._rows += 1
+        return row
+
+    def fetchmany(self, size: Optional[int] = None) -> List:
+        rows = self._timed(self._cursor.fetchmany, self._cursor.arraysize if size is None else size)
+        self._rows += len(rows)
+        return rows
+
+    def fetchall(self) -> List:
+        rows = self._timed(self._cursor.fetchall)
+        self._rows += len(rows)
+        return rows
+
+    def close(self):
+        self._finish()
+        self._cursor.close()
+
+
+class RowCache:
+    """
+    A bounded, thread-safe LRU cache of rows looked up by primary key.
+
+    Entries are keyed by ``(table, key)`` and may hold None for a key that does not
+    exist. Every invalidation advances a generation counter; a row read from the
+    database is only stored if no invalidation happened since the lookup started, so
+    a concurrent write can never be overwritten by the stale row it replaced.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        """
+        Initialize an empty cache.
+
+        Args:
+            capacity (int, optional): Maximum number of entries, or 0 to disable caching.
+                Defaults to 1024.
+        """
+        self.capacity = capacity
+        self.generation = 0
+        self._rows: "OrderedDict[Tuple[str, object], Optional[Tuple]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+
+    def get(self, table: str, key) -> Tuple[bool, Optional[Tuple]]:
+        """
+        Look a row up and mark it as most recently used.
+
+        Args:
+            table (str): The table the row belongs to.
+            key: The row's primary key.
+
+        Returns:
+            Tuple[bool, Optional[Tuple]]: Whether the entry was cached, and the cached row.
+        """
+        with self._lock:
+            try:
+                row = self._rows[(table, key)]
+            except KeyError:
+                self._stats["misses"] += 1
+                return False, None
+            self._rows.move_to_end((table, key))
+            self._stats["hits"] += 1
+            return True, row
+
+    def put(self, table: str, key, row: Optional[Tuple], generation: int):
+        """
+        Store a row, evicting the least recently used entry if the cache is full.
+
+        Args:
+            table (str): The table the row belongs to.
+            key: The row's primary key.
+            row (Optional[Tuple]): The row, or None if it does not exist.
+            generation (int): The value of ``generation`` when the lookup started. The
+                row is dropped if the cache was invalidated since.
+        """
+        if not self.capacity:
+            return
+        with self._lock:
+            if generation != self.generation:
+                return
+            self._rows[(table, key)] = row
+            self._rows.move_to_end((table, key))
+            if len(self._rows) > self.capacity:
+                self._rows.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def invalidate(self, table: str, key=None):
+        """
+        Drop one row, or every row of a table.
+
+        Args:
+            table (str): The table that changed.
+            key (optional): The primary key of the changed row, or None for the whole table.
+        """
+        with self._lock:
+            self.generation += 1
+            self._stats["invalidations"] += 1
+            if key is not None:
+                self._rows.pop((table, key), None)
+                return
+            for entry in [entry for entry in self._rows if entry[0] == table]:
+                del self._rows[entry]
+
+    def clear(self):
+        """
+        Drop every row.
+        """
+        with self._lock:
+            self.generation += 1
+            self._stats["invalidations"] += 1
+            self._rows.clear()
+
+    def stats(self) -> Dict[str, object]:
+        """
+        Report cache usage.
+
+        Returns:
+            Dict[str, object]: ``capacity``, current ``size``, ``hits``, ``misses``, the
+            ``hit_rate``, and the number of ``evictions`` and ``invalidations``.
+        """
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                "capacity": self.capacity,
+                "size": len(self._rows),
+                **self._stats,
+                "hit_rate": self._stats["hits"] / lookups if lookups else 0.0,
+            }
+
 
 class Database:
     """
@@ -31,303 +793,1511 @@ class Database:
     It ensures data integrity through the use of primary keys and foreign keys.
     """
 
-    def __init__(self, db_name: str = "school.db"):
+    def __init__(
+        self, db_name: str = "school.db", profile: str = DEFAULT_PROFILE, readers: int = 0, cache_size: int = 1024
+    ):
         """
         Initialize the Database instance and create tables if they do not exist.
 
+        By default every query runs on a single connection, which may only be used from
+        the thread that created it. With ``readers`` set, the instance is thread-safe:
+        writes go through one writer connection, one thread at a time, and reads lease a
+        connection from a pool of up to ``readers`` read-only connections, which WAL lets
+        run alongside the writer.
+
+        Lookups by primary key are served from a RowCache of ``cache_size`` rows. Changes
+        made through this instance invalidate the affected rows; changes committed by any
+        other connection are detected through ``PRAGMA data_version`` and clear the cache.
+
         Args:
             db_name (str, optional): The name of the SQLite database file. Defaults to "school.db".
+            profile (str, optional): The name of the connection profile to apply, one of
+                CONNECTION_PROFILES. Defaults to "durable".
+            readers (int, optional): Size of the read connection pool, or 0 for a single
+                connection. Defaults to 0.
+            cache_size (int, optional): Number of rows kept by the lookup cache, or 0 to
+                disable it. Defaults to 1024.
         """
-        self.conn = sqlite3.connect(db_name)
-        self.cursor = self.conn.cursor()
+        self.db_name = db_name
+        self.profile = profile
+        self.conn = sqlite3.connect(db_name, check_same_thread=readers == 0)
+        self._write_lock = threading.RLock()
+        self._write_stats = {"leases": 0, "waits": 0, "wait_time": 0.0}
+        self._pool = (
+            ConnectionPool(self._connect_reader, readers, lambda conn: self._configure(conn, self.profile))
+            if readers
+            else None
+        )
+        self._listeners: List[Callable[[str, str, object], None]] = []
+        self.instrumentation: Optional[QueryInstrumentation] = None
+        self._row_cache = RowCache(cache_size)
+        self._data_versions: Dict[sqlite3.Connection, int] = {}
+        self._transaction_depth = 0
+        self._pending_events: List[Tuple[str, str, object]] = []
+        self.apply_profile(profile)
         self.create_tables()
 
-    def create_tables(self):
+    def _connect_reader(self) -> sqlite3.Connection:
         """
-        Create the necessary tables for students, instructors, courses, and registrations.
+        Open a read-only connection for the pool, configured with the current profile.
+        """
+        conn = sqlite3.connect(self.db_name, check_same_thread=False)
+        self._configure(conn, self.profile)
+        conn.execute("PRAGMA query_only = ON")
+        return conn
 
-        This method ensures that all required tables are present in the database with
-        appropriate constraints such as primary keys, foreign keys, and unique fields.
+    @staticmethod
+    def _configure(conn: sqlite3.Connection, profile: str):
         """
-        self.cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS students (
-                student_id TEXT PRIMARY KEY,
-                name TEXT NOT NULL,
-                age INTEGER NOT NULL,
-                email TEXT NOT NULL UNIQUE
-            )
-            """
-        )
+        Apply a profile's PRAGMA settings to a connection.
+        """
+        for pragma, value in CONNECTION_PROFILES[profile].items():
+            conn.execute(f"PRAGMA {pragma} = {value}")
 
-        self.cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS instructors (
-                instructor_id TEXT PRIMARY KEY,
-                name TEXT NOT NULL,
-                age INTEGER NOT NULL,
-                email TEXT NOT NULL UNIQUE
-            )
-            """
-        )
+    def _cursor(self, conn: sqlite3.Connection):
+        """
+        Open a cursor on ``conn``, wrapped in an InstrumentedCursor while instrumentation is on.
+        """
+        instrumentation = self.instrumentation
+        if instrumentation is None:
+            return conn.cursor()
+        return InstrumentedCursor(conn.cursor(), instrumentation)
 
-        self.cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS courses (
-                course_id TEXT PRIMARY KEY,
-                course_name TEXT NOT NULL,
-                instructor_id TEXT,
-                FOREIGN KEY (instructor_id) REFERENCES instructors(instructor_id)
-            )
-            """
-        )
+    @contextmanager
+    def _writing(self) -> Iterator[sqlite3.Cursor]:
+        """
+        Lease a cursor on the writer connection, holding the write lock until it is returned.
 
-        self.cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS registrations (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                student_id TEXT NOT NULL,
-                course_id TEXT NOT NULL,
-                FOREIGN KEY (student_id) REFERENCES students(student_id),
-                FOREIGN KEY (course_id) REFERENCES courses(course_id),
-                UNIQUE(student_id, course_id)
-            )
-            """
-        )
+        The lock is reentrant, so a thread that already holds it can lease again.
+        """
+        if not self._write_lock.acquire(blocking=False):
+            start = time.perf_counter()
+            self._write_lock.acquire()
+            self._write_stats["waits"] += 1
+            self._write_stats["wait_time"] += time.perf_counter() - start
+        self._write_stats["leases"] += 1
+        cursor = self._cursor(self.conn)
+        try:
+            yield cursor
+        finally:
+            cursor.close()
+            self._write_lock.release()
 
-        self.conn.commit()
+    @contextmanager
+    def _reading(self) -> Iterator[sqlite3.Cursor]:
+        """
+        Lease a cursor for a read: from the read pool if there is one, otherwise on the
+        single connection.
+        """
+        if self._pool is None:
+            with self._writing() as cursor:
+                yield cursor
+            return
+        conn = self._pool.acquire()
+        cursor = self._cursor(conn)
+        try:
+            yield cursor
+        finally:
+            cursor.close()
+            self._pool.release(conn)
 
-    def add_student(self, student: Student) -> bool:
+    @contextmanager
+    def _trigger_suspended(self, cursor: sqlite3.Cursor, name: str):
         """
-        Add a new student to the database.
+        Drop a trigger for the rest of a transaction and recreate it afterwards.
+
+        Schema changes are transactional in SQLite, so if the transaction rolls back the
+        trigger comes back with it. Must be used inside an open transaction.
 
         Args:
-            student (Student): The Student instance to be added.
+            cursor (sqlite3.Cursor): A cursor on the writer connection.
+            name (str): The trigger to suspend.
+        """
+        cursor.execute("SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name = ?", (name,))
+        row = cursor.fetchone()
+        if row is None:
+            yield
+            return
+        cursor.execute(f"DROP TRIGGER {name}")
+        yield
+        cursor.execute(row[0])
+
+    @contextmanager
+    def _enrollments_counted_afterwards(self, cursor: sqlite3.Cursor):
+        """
+        Suspend the per-row course_stats update for registrations inserted in the block,
+        and add them to the counts in one statement at its end.
 
-        Returns:
-            bool: True if the student was added successfully, False otherwise.
+        Args:
+            cursor (sqlite3.Cursor): A cursor on the writer connection, inside an open
+                transaction.
         """
-        try:
-            self.cursor.execute(
-                """
-                INSERT INTO students (student_id, name, age, email)
-                VALUES (?, ?, ?, ?)
-                """,
-                (student.student_id, student.name, student.age, student.email),
-            )
-            self.conn.commit()
-            return True
-        except sqlite3.IntegrityError as e:
-            print(f"Error adding student: {e}")
-            return False
+        last_id = cursor.execute("SELECT COALESCE(MAX(id), 0) FROM registrations").fetchone()[0]
+        with self._trigger_suspended(cursor, "course_stats_registration_insert"):
+            yield
+            cursor.execute(ADD_NEW_ENROLLMENTS, (last_id,))
 
-    def add_instructor(self, instructor: Instructor) -> bool:
+    def get_pool_stats(self) -> Dict[str, object]:
         """
-        Add a new instructor to the database.
+        Report how connections have been leased.
+
+        Returns:
+            Dict[str, object]: ``mode`` ("single" or "pooled"), ``writer`` with the number of
+            leases, how many had to wait for the write lock and the total wait in seconds,
+            and ``readers`` with the read pool's ConnectionPool.stats, or None in single mode.
+        """
+        with self._write_lock:
+            writer = dict(self._write_stats)
+        return {
+            "mode": "single" if self._pool is None else "pooled",
+            "writer": writer,
+            "readers": None if self._pool is None else self._pool.stats(),
+        }
+
+    def set_instrumentation(self, instrumentation: Optional[QueryInstrumentation]):
+        """
+        Start or stop recording query statistics.
+
+        Instrumentation is off by default. Cursors leased after this call report every
+        statement they run to ``instrumentation``; one instance can be shared by several
+        Database objects to collect their statistics together.
 
         Args:
-            instructor (Instructor): The Instructor instance to be added.
+            instrumentation (Optional[QueryInstrumentation]): Where to record statements,
+                or None to stop recording.
+        """
+        self.instrumentation = instrumentation
+
+    def get_cache_stats(self) -> Dict[str, object]:
+        """
+        Report how the lookup cache behind get_*_by_id is used.
 
         Returns:
-            bool: True if the instructor was added successfully, False otherwise.
+            Dict[str, object]: The RowCache.stats of this instance.
         """
-        try:
-            self.cursor.execute(
-                """
-                INSERT INTO instructors (instructor_id, name, age, email)
-                VALUES (?, ?, ?, ?)
-                """,
-                (
-                    instructor.instructor_id,
-                    instructor.name,
-                    instructor.age,
-                    instructor.email,
-                ),
+        return self._row_cache.stats()
+
+    def clear_cache(self):
+        """
+        Drop every row from the lookup cache.
+        """
+        self._row_cache.clear()
+
+    def apply_profile(self, profile: str):
+        """
+        Apply a connection profile's PRAGMA settings to this connection.
+
+        Profiles can be switched at any time outside a transaction, e.g. to
+        "fast-import" for the duration of a bulk load. Pooled read connections pick up
+        the new settings the next time they are leased.
+
+        Args:
+            profile (str): The name of a profile in CONNECTION_PROFILES.
+
+        Raises:
+            ValueError: If the profile does not exist.
+        """
+        if profile not in CONNECTION_PROFILES:
+            raise ValueError(
+                f"Unknown connection profile {profile!r}; expected one of {', '.join(CONNECTION_PROFILES)}."
             )
-            self.conn.commit()
-            return True
-        except sqlite3.IntegrityError as e:
-            print(f"Error adding instructor: {e}")
-            return False
+        with self._writing():
+            self._configure(self.conn, profile)
+            self.profile = profile
+        if self._pool is not None:
+            self._pool.reconfigure()
 
-    def add_course(self, course: Course) -> bool:
+    def get_settings(self) -> Dict[str, object]:
         """
-        Add a new course to the database.
+        Read back the current value of every PRAGMA used by the connection profiles.
+
+        Returns:
+            Dict[str, object]: The writer connection's setting values, e.g.
+            ``{"journal_mode": "wal", ...}``.
+        """
+        names = dict.fromkeys(name for settings in CONNECTION_PROFILES.values() for name in settings)
+        with self._writing() as cursor:
+            return {name: cursor.execute(f"PRAGMA {name}").fetchone()[0] for name in names}
+
+    def subscribe(self, listener: Callable[[str, str, object], None]):
+        """
+        Register a listener for row-level change events.
+
+        After every committed change the listener is called as
+        ``listener(table, action, key)``. ``table`` is one of "students", "instructors",
+        "courses" or "registrations". ``action`` is "insert", "update" or "delete", and
+        ``key`` is the primary key of the affected row. Bulk operations that touch many
+        rows emit a single "reload" event with ``key`` set to None instead.
+
+        When a single-row change alters enrollment counts, a "course_stats" "update"
+        event follows for each affected course ID. A "reload" of "registrations" or
+        "courses" implies that counts may have changed as well.
+
+        Args:
+            listener (Callable[[str, str, object], None]): The function to call.
+        """
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener: Callable[[str, str, object], None]):
+        """
+        Remove a listener registered with subscribe.
+
+        Args:
+            listener (Callable[[str, str, object], None]): The function to remove.
+        """
+        self._listeners.remove(listener)
+
+    def _notify(self, table: str, action: str, key=None):
+        """
+        Send a change event to every listener.
+
+        Args:
+            table (str): The table that changed.
+            action (str): "insert", "update", "delete" or "reload".
+            key (optional): The primary key of the affected row.
+        """
+        if self._transaction_depth:
+            self._pending_events.append((table, action, key))
+            return
+        # Listeners typically fetch the changed row again, so drop it first.
+        self._row_cache.invalidate(table, None if action == "reload" else key)
+        for listener in list(self._listeners):
+            listener(table, action, key)
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """
+        Run several bulk operations as one transaction.
+
+        clear_all and the ``*_bulk`` methods called inside the block do not commit on
+        their own: everything is committed when the block exits, or rolled back if it
+        raises. Their change events are held back until the commit and dropped on a
+        rollback, so listeners never see rows that are not yet visible to them. The
+        writer is held for the whole block.
+        """
+        with self._writing() as cursor:
+            if not self.conn.in_transaction:
+                cursor.execute("BEGIN IMMEDIATE")
+            self._transaction_depth += 1
+            try:
+                yield
+            except BaseException:
+                self._transaction_depth -= 1
+                if not self._transaction_depth:
+                    self.conn.rollback()
+                    self._pending_events.clear()
+                    self._row_cache.clear()
+                raise
+            self._transaction_depth -= 1
+            if not self._transaction_depth:
+                self.conn.commit()
+                events, self._pending_events = self._pending_events, []
+                for event in events:
+                    self._notify(*event)
+
+    def _commit(self):
+        """
+        Commit the writer connection, unless inside a transaction block.
+        """
+        if not self._transaction_depth:
+            self.conn.commit()
+
+    def create_tables(self):
+        """
+        Create the necessary tables for students, instructors, courses, and registrations.
+
+        This method ensures that all required tables are present in the database with
+        appropriate constraints such as primary keys, foreign keys, and unique fields.
+        """
+        with self._writing() as cursor:
+            cursor.execute(
+                """
+                CREATE TABLE IF NOT EXISTS students (
+                    student_id TEXT PRIMARY KEY,
+                    name TEXT NOT NULL,
+                    age INTEGER NOT NULL,
+                    email TEXT NOT NULL UNIQUE
+                )
+                """
+            )
+
+            cursor.execute(
+                """
+                CREATE TABLE IF NOT EXISTS instructors (
+                    instructor_id TEXT PRIMARY KEY,
+                    name TEXT NOT NULL,
+                    age INTEGER NOT NULL,
+                    email TEXT NOT NULL UNIQUE
+                )
+                """
+            )
+
+            cursor.execute(
+                """
+                CREATE TABLE IF NOT EXISTS courses (
+                    course_id TEXT PRIMARY KEY,
+                    course_name TEXT NOT NULL,
+                    instructor_id TEXT,
+                    FOREIGN KEY (instructor_id) REFERENCES instructors(instructor_id)
+                )
+                """
+            )
+
+            cursor.execute(
+                """
+                CREATE TABLE IF NOT EXISTS registrations (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    student_id TEXT NOT NULL,
+                    course_id TEXT NOT NULL,
+                    FOREIGN KEY (student_id) REFERENCES students(student_id),
+                    FOREIGN KEY (course_id) REFERENCES courses(course_id),
+                    UNIQUE(student_id, course_id)
+                )
+                """
+            )
+
+            self.conn.commit()
+            self.migrate()
+
+    def migrate(self):
+        """
+        Bring the schema up to date by applying any pending entries of SCHEMA_MIGRATIONS.
+
+        The current version is kept in ``PRAGMA user_version``. Each step runs in its own
+        transaction, so an interrupted upgrade resumes from the last completed version.
+        """
+        with self._writing() as cursor:
+            version = cursor.execute("PRAGMA user_version").fetchone()[0]
+            for target, statements in enumerate(SCHEMA_MIGRATIONS[version:], start=version + 1):
+                try:
+                    cursor.execute("BEGIN")
+                    for statement in statements:
+                        cursor.execute(statement)
+                    cursor.execute(f"PRAGMA user_version = {target}")
+                    self.conn.commit()
+                except sqlite3.Error:
+                    self.conn.rollback()
+                    raise
+
+    def add_student(self, student: Student) -> bool:
+        """
+        Add a new student to the database.
+
+        Args:
+            student (Student): The Student instance to be added.
+
+        Returns:
+            bool: True if the student was added successfully, False otherwise.
+        """
+        with self._writing() as cursor:
+            try:
+                cursor.execute(
+                    """
+                    INSERT INTO students (student_id, name, age, email)
+                    VALUES (?, ?, ?, ?)
+                    """,
+                    (student.student_id, student.name, student.age, student.email),
+                )
+                self.conn.commit()
+                self._notify("students", "insert", student.student_id)
+                return True
+            except (sqlite3.IntegrityError, sqlite3.OperationalError) as e:
+                self.conn.rollback()
+                print(f"Error adding student: {e}")
+                return False
+
+    def add_instructor(self, instructor: Instructor) -> bool:
+        """
+        Add a new instructor to the database.
+
+        Args:
+            instructor (Instructor): The Instructor instance to be added.
+
+        Returns:
+            bool: True if the instructor was added successfully, False otherwise.
+        """
+        with self._writing() as cursor:
+            try:
+                cursor.execute(
+                    """
+                    INSERT INTO instructors (instructor_id, name, age, email)
+                    VALUES (?, ?, ?, ?)
+                    """,
+                    (
+                        instructor.instructor_id,
+                        instructor.name,
+                        instructor.age,
+                        instructor.email,
+                    ),
+                )
+                self.conn.commit()
+                self._notify("instructors", "insert", instructor.instructor_id)
+                return True
+            except (sqlite3.IntegrityError, sqlite3.OperationalError) as e:
+                self.conn.rollback()
+                print(f"Error adding instructor: {e}")
+                return False
+
+    def add_course(self, course: Course) -> bool:
+        """
+        Add a new course to the database.
+
+        Args:
+            course (Course): The Course instance to be added.
+
+        Returns:
+            bool: True if the course was added successfully, False otherwise.
+        """
+        with self._writing() as cursor:
+            try:
+                cursor.execute(
+                    """
+                    INSERT INTO courses (course_id, course_name, instructor_id)
+                    VALUES (?, ?, ?)
+                    """,
+                    (
+                        course.course_id,
+                        course.course_name,
+                        course.instructor.instructor_id if course.instructor else None,
+                    ),
+                )
+                self.conn.commit()
+                self._notify("courses", "insert", course.course_id)
+                return True
+            except (sqlite3.IntegrityError, sqlite3.OperationalError) as e:
+                self.conn.rollback()
+                print(f"Error adding course: {e}")
+                return False
+
+    def register_student_to_course(self, student_id: str, course_id: str) -> bool:
+        """
+        Register a student to a course.
+
+        Args:
+            student_id (str): The ID of the student.
+            course_id (str): The ID of the course.
+
+        Returns:
+            bool: True if the registration was successful, False otherwise.
+        """
+        with self._writing() as cursor:
+            try:
+                cursor.execute(
+                    """
+                    SELECT * FROM registrations
+                    WHERE student_id = ? AND course_id = ?
+                    """,
+                    (student_id, course_id),
+                )
+                if cursor.fetchone():
+                    print("Student is already registered for this course.")
+                    return False
+
+                cursor.execute(
+                    """
+                    INSERT INTO registrations (student_id, course_id)
+                    VALUES (?, ?)
+                    """,
+                    (student_id, course_id),
+                )
+                registration_id = cursor.lastrowid
+                self.conn.commit()
+                self._notify("registrations", "insert", registration_id)
+                self._notify("course_stats", "update", course_id)
+                return True
+            except (sqlite3.IntegrityError, sqlite3.OperationalError) as e:
+                self.conn.rollback()
+                print(f"Error registering student to course: {e}")
+                return False
+
+    def add_students_bulk(
+        self, students: Iterable, batch_size: int = 1000, progress: Optional[Callable[[int], None]] = None
+    ) -> BulkInsertReport:
+        """
+        Add many students in a single transaction.
+
+        Args:
+            students (Iterable): Student instances or ``(student_id, name, age, email)`` tuples.
+            batch_size (int, optional): Rows handed to each ``executemany`` call. Defaults to 1000.
+            progress (Optional[Callable[[int], None]], optional): Called after every batch
+                with the number of rows processed so far.
+
+        Returns:
+            BulkInsertReport: How many students were added and which were rejected
+            (for example because of a duplicate ID or email).
+        """
+        rows = (
+            (s.student_id, s.name, s.age, s.email) if isinstance(s, Student) else tuple(s)
+            for s in students
+        )
+        return self._insert_bulk(
+            "students",
+            """
+            INSERT INTO students (student_id, name, age, email)
+            VALUES (?, ?, ?, ?)
+            """,
+            rows,
+            batch_size,
+            progress,
+        )
+
+    def add_instructors_bulk(
+        self, instructors: Iterable, batch_size: int = 1000, progress: Optional[Callable[[int], None]] = None
+    ) -> BulkInsertReport:
+        """
+        Add many instructors in a single transaction.
+
+        Args:
+            instructors (Iterable): Instructor instances or ``(instructor_id, name, age, email)`` tuples.
+            batch_size (int, optional): Rows handed to each ``executemany`` call. Defaults to 1000.
+            progress (Optional[Callable[[int], None]], optional): Called after every batch
+                with the number of rows processed so far.
+
+        Returns:
+            BulkInsertReport: How many instructors were added and which were rejected.
+        """
+        rows = (
+            (i.instructor_id, i.name, i.age, i.email) if isinstance(i, Instructor) else tuple(i)
+            for i in instructors
+        )
+        return self._insert_bulk(
+            "instructors",
+            """
+            INSERT INTO instructors (instructor_id, name, age, email)
+            VALUES (?, ?, ?, ?)
+            """,
+            rows,
+            batch_size,
+            progress,
+        )
+
+    def add_courses_bulk(
+        self, courses: Iterable, batch_size: int = 1000, progress: Optional[Callable[[int], None]] = None
+    ) -> BulkInsertReport:
+        """
+        Add many courses in a single transaction.
+
+        Args:
+            courses (Iterable): Course instances or ``(course_id, course_name, instructor_id)`` tuples.
+            batch_size (int, optional): Rows handed to each ``executemany`` call. Defaults to 1000.
+            progress (Optional[Callable[[int], None]], optional): Called after every batch
+                with the number of rows processed so far.
+
+        Returns:
+            BulkInsertReport: How many courses were added and which were rejected.
+        """
+        rows = (
+            (
+                c.course_id,
+                c.course_name,
+                c.instructor.instructor_id if c.instructor else None,
+            )
+            if isinstance(c, Course)
+            else tuple(c)
+            for c in courses
+        )
+        return self._insert_bulk(
+            "courses",
+            """
+            INSERT INTO courses (course_id, course_name, instructor_id)
+            VALUES (?, ?, ?)
+            """,
+            rows,
+            batch_size,
+            progress,
+        )
+
+    def register_bulk(
+        self,
+        registrations: Iterable[Tuple[str, str]],
+        batch_size: int = 1000,
+        progress: Optional[Callable[[int], None]] = None,
+    ) -> BulkInsertReport:
+        """
+        Register many students to courses in a single transaction.
+
+        Duplicate registrations are rejected, both against existing rows and within
+        the batch itself.
+
+        Args:
+            registrations (Iterable[Tuple[str, str]]): ``(student_id, course_id)`` pairs.
+            batch_size (int, optional): Rows handed to each ``executemany`` call. Defaults to 1000.
+            progress (Optional[Callable[[int], None]], optional): Called after every batch
+                with the number of rows processed so far.
+
+        Returns:
+            BulkInsertReport: How many registrations were added and which were rejected.
+        """
+        return self._insert_bulk(
+            "registrations",
+            """
+            INSERT INTO registrations (student_id, course_id)
+            VALUES (?, ?)
+            """,
+            (tuple(r) for r in registrations),
+            batch_size,
+            progress,
+            deferred=self._enrollments_counted_afterwards,
+        )
+
+    def _insert_bulk(
+        self,
+        table: str,
+        sql: str,
+        rows: Iterable[Tuple],
+        batch_size: int,
+        progress: Optional[Callable[[int], None]] = None,
+        deferred: Optional[Callable[[sqlite3.Cursor], ContextManager]] = None,
+    ) -> BulkInsertReport:
+        """
+        Insert rows with ``executemany`` and commit once at the end, or leave the
+        commit to the enclosing transaction block.
+
+        Each batch runs inside a savepoint. If a batch violates a constraint it is
+        rolled back and replayed row by row, so only the offending rows are rejected
+        and everything else still goes into the same transaction.
+
+        Args:
+            table (str): The table being filled, used for the change event.
+            sql (str): The parameterized INSERT statement.
+            rows (Iterable[Tuple]): Parameter tuples; the first element is the row key
+                used in the report (registrations report ``student_id:course_id``).
+            batch_size (int): Rows per ``executemany`` call.
+            progress (Optional[Callable[[int], None]], optional): Called after every batch
+                with the number of rows processed so far. An exception raised by it aborts
+                the insert and rolls the whole transaction back.
+            deferred (Optional[Callable[[sqlite3.Cursor], ContextManager]], optional): Called
+                with the cursor to get a context manager the batches run in, e.g. one that
+                replaces a per-row trigger with a single statement once all rows are in.
+                It is entered and left inside the same transaction.
+
+        Returns:
+            BulkInsertReport: The per-row outcome.
+        """
+        with self._writing() as cursor:
+            report = BulkInsertReport()
+            rows = iter(rows)
+            try:
+                # A SAVEPOINT outside a transaction would open one that its RELEASE commits,
+                # so start the enclosing transaction explicitly. IMMEDIATE takes the write
+                # lock up front: the reads that precede the first insert would otherwise
+                # leave a read transaction that cannot be upgraded once another connection
+                # has written.
+                if not self.conn.in_transaction:
+                    cursor.execute("BEGIN IMMEDIATE")
+                with deferred(cursor) if deferred else nullcontext():
+                    self._insert_batches(cursor, sql, rows, batch_size, progress, report)
+                self._commit()
+            except Exception:
+                self.conn.rollback()
+                raise
+            if report.succeeded:
+                self._notify(table, "reload")
+            return report
+
+    def _insert_batches(
+        self,
+        cursor: sqlite3.Cursor,
+        sql: str,
+        rows: Iterator[Tuple],
+        batch_size: int,
+        progress: Optional[Callable[[int], None]],
+        report: BulkInsertReport,
+    ):
+        """
+        Run the batches of an ``_insert_bulk`` call inside its open transaction.
+
+        Args:
+            cursor (sqlite3.Cursor): A cursor on the writer connection.
+            sql (str): The parameterized INSERT statement.
+            rows (Iterator[Tuple]): The remaining parameter tuples.
+            batch_size (int): Rows per ``executemany`` call.
+            progress (Optional[Callable[[int], None]]): Called after every batch.
+            report (BulkInsertReport): Filled in with the per-row outcome.
+        """
+        row_number = 0
+        while True:
+            batch = list(islice(rows, batch_size))
+            if not batch:
+                break
+            cursor.execute("SAVEPOINT bulk_batch")
+            try:
+                cursor.executemany(sql, batch)
+                report.succeeded += len(batch)
+            except sqlite3.IntegrityError:
+                cursor.execute("ROLLBACK TO SAVEPOINT bulk_batch")
+                for offset, row in enumerate(batch):
+                    try:
+                        cursor.execute(sql, row)
+                        report.succeeded += 1
+                    except sqlite3.IntegrityError as e:
+                        key = ":".join(str(v) for v in row[:2]) if len(row) == 2 else str(row[0])
+                        report.failures.append((row_number + offset, key, str(e)))
+            cursor.execute("RELEASE SAVEPOINT bulk_batch")
+            row_number += len(batch)
+            if progress:
+                progress(row_number)
+
+    def assign_instructor_to_course(self, instructor_id: str, course_id: str) -> bool:
+        """
+        Assign an instructor to a course.
+
+        Args:
+            instructor_id (str): The ID of the instructor.
+            course_id (str): The ID of the course.
+
+        Returns:
+            bool: True if the assignment was successful, False otherwise.
+        """
+        with self._writing() as cursor:
+            try:
+                cursor.execute(
+                    "SELECT * FROM instructors WHERE instructor_id = ?", (instructor_id,)
+                )
+                instructor = cursor.fetchone()
+                if not instructor:
+                    print(f"Instructor ID {instructor_id} does not exist.")
+                    return False
+
+                cursor.execute(
+                    "SELECT * FROM courses WHERE course_id = ?", (course_id,)
+                )
+                course = cursor.fetchone()
+                if not course:
+                    print(f"Course ID {course_id} does not exist.")
+                    return False
+
+                cursor.execute(
+                    """
+                    UPDATE courses
+                    SET instructor_id = ?
+                    WHERE course_id = ?
+                    """,
+                    (instructor_id, course_id),
+                )
+                self.conn.commit()
+                self._notify("courses", "update", course_id)
+                return True
+            except (sqlite3.IntegrityError, sqlite3.OperationalError) as e:
+                self.conn.rollback()
+                print(f"Error assigning instructor to course: {e}")
+                return False
+
+    def get_students(self) -> List[Tuple]:
+        """
+        Retrieve all students from the database.
+
+        Returns:
+            List[Tuple]: A list of tuples, each representing a student record.
+        """
+        with self._reading() as cursor:
+            cursor.execute("SELECT * FROM students")
+            return cursor.fetchall()
+
+    def get_instructors(self) -> List[Tuple]:
+        """
+        Retrieve all instructors from the database.
+
+        Returns:
+            List[Tuple]: A list of tuples, each representing an instructor record.
+        """
+        with self._reading() as cursor:
+            cursor.execute("SELECT * FROM instructors")
+            return cursor.fetchall()
+
+    def get_courses(self) -> List[Tuple]:
+        """
+        Retrieve all courses from the database.
+
+        Returns:
+            List[Tuple]: A list of tuples, each representing a course record.
+        """
+        with self._reading() as cursor:
+            cursor.execute("SELECT * FROM courses")
+            return cursor.fetchall()
+
+    def iter_students(self, batch_size: int = 1000) -> Iterator[Tuple]:
+        """
+        Stream all students, ordered by student ID, without loading them all at once.
+
+        Args:
+            batch_size (int, optional): Rows fetched from SQLite at a time. Defaults to 1000.
+
+        Yields:
+            Tuple: One student record at a time.
+        """
+        return self._iter_rows("SELECT * FROM students ORDER BY student_id", batch_size)
+
+    def iter_instructors(self, batch_size: int = 1000) -> Iterator[Tuple]:
+        """
+        Stream all instructors, ordered by instructor ID, without loading them all at once.
+
+        Args:
+            batch_size (int, optional): Rows fetched from SQLite at a time. Defaults to 1000.
+
+        Yields:
+            Tuple: One instructor record at a time.
+        """
+        return self._iter_rows("SELECT * FROM instructors ORDER BY instructor_id", batch_size)
+
+    def iter_courses(self, batch_size: int = 1000) -> Iterator[Tuple]:
+        """
+        Stream all courses, ordered by course ID, without loading them all at once.
+
+        Args:
+            batch_size (int, optional): Rows fetched from SQLite at a time. Defaults to 1000.
+
+        Yields:
+            Tuple: One course record at a time.
+        """
+        return self._iter_rows("SELECT * FROM courses ORDER BY course_id", batch_size)
+
+    def iter_registrations(self, batch_size: int = 1000) -> Iterator[Tuple]:
+        """
+        Stream all registrations, ordered by ID, without loading them all at once.
+
+        Args:
+            batch_size (int, optional): Rows fetched from SQLite at a time. Defaults to 1000.
+
+        Yields:
+            Tuple: ``(id, student_id, course_id)`` for one registration at a time.
+        """
+        return self._iter_rows("SELECT id, student_id, course_id FROM registrations ORDER BY id", batch_size)
+
+    def _iter_rows(self, sql: str, batch_size: int) -> Iterator[Tuple]:
+        """
+        Run a query and yield its rows, fetching ``batch_size`` at a time.
+
+        The cursor is leased for as long as the generator is being consumed.
+        """
+        with self._reading() as cursor:
+            cursor.execute(sql)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield from rows
+
+    def _fetch_page(
+        self,
+        select: str,
+        key: str,
+        after=None,
+        before=None,
+        limit: Optional[int] = 100,
+        where: Optional[str] = None,
+        params: Tuple = (),
+    ) -> List[Tuple]:
+        """
+        Run a keyset-paginated query.
+
+        Args:
+            select (str): A SELECT statement without WHERE, ORDER BY or LIMIT clauses.
+            key (str): The unique column to paginate on.
+            after (optional): Return rows whose key is greater than this value.
+            before (optional): Return rows whose key is smaller than this value. Takes
+                precedence over ``after``.
+            limit (Optional[int], optional): Maximum number of rows, or None for all of
+                them. Defaults to 100.
+            where (Optional[str], optional): An extra filter combined with the key condition.
+            params (Tuple, optional): Parameters for ``where``.
+
+        Returns:
+            List[Tuple]: The page, in ascending key order.
+        """
+        with self._reading() as cursor:
+            conditions = [f"({where})"] if where else []
+            arguments = list(params)
+            if before is not None:
+                conditions.append(f"{key} < ?")
+                arguments.append(before)
+            elif after is not None:
+                conditions.append(f"{key} > ?")
+                arguments.append(after)
+            clause = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+            order = "DESC" if before is not None else "ASC"
+            arguments.append(-1 if limit is None else limit)
+            cursor.execute(f"{select}{clause} ORDER BY {key} {order} LIMIT ?", arguments)
+            rows = cursor.fetchall()
+            if before is not None:
+                rows.reverse()
+            return rows
+
+    def get_students_page(self, after: Optional[str] = None, before: Optional[str] = None, limit: int = 100) -> List[Tuple]:
+        """
+        Retrieve one page of students, ordered by student ID.
+
+        Args:
+            after (Optional[str]): Return students whose ID sorts after this one.
+            before (Optional[str]): Return students whose ID sorts before this one.
+            limit (int, optional): Page size. Defaults to 100.
+
+        Returns:
+            List[Tuple]: The student records on the page.
+        """
+        return self._fetch_page("SELECT * FROM students", "student_id", after, before, limit)
+
+    def get_instructors_page(self, after: Optional[str] = None, before: Optional[str] = None, limit: int = 100) -> List[Tuple]:
+        """
+        Retrieve one page of instructors, ordered by instructor ID.
+
+        Args:
+            after (Optional[str]): Return instructors whose ID sorts after this one.
+            before (Optional[str]): Return instructors whose ID sorts before this one.
+            limit (int, optional): Page size. Defaults to 100.
+
+        Returns:
+            List[Tuple]: The instructor records on the page.
+        """
+        return self._fetch_page("SELECT * FROM instructors", "instructor_id", after, before, limit)
+
+    def get_courses_page(self, after: Optional[str] = None, before: Optional[str] = None, limit: int = 100) -> List[Tuple]:
+        """
+        Retrieve one page of courses, ordered by course ID.
+
+        Args:
+            after (Optional[str]): Return courses whose ID sorts after this one.
+            before (Optional[str]): Return courses whose ID sorts before this one.
+            limit (int, optional): Page size. Defaults to 100.
+
+        Returns:
+            List[Tuple]: The course records on the page.
+        """
+        return self._fetch_page("SELECT * FROM courses", "course_id", after, before, limit)
+
+    # Courses joined with the name of their instructor, if any.
+    _COURSES_WITH_INSTRUCTORS = """
+        SELECT c.course_id, c.course_name, c.instructor_id, i.name, COALESCE(cs.enrolled, 0)
+        FROM courses c
+        LEFT JOIN instructors i ON c.instructor_id = i.instructor_id
+        LEFT JOIN course_stats cs ON cs.course_id = c.course_id
+    """
+
+    def get_courses_with_instructors(
+        self,
+        where: Optional[str] = None,
+        params: Tuple = (),
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Tuple]:
+        """
+        Retrieve courses together with their instructor names and enrollment counts in a
+        single query.
+
+        Without ``after``, ``before`` or ``limit`` every matching course is returned. With
+        them, this also works as a keyset-paginated page source.
+
+        Args:
+            where (Optional[str], optional): A filter predicate over the aliases ``c``
+                (courses) and ``i`` (instructors), e.g. ``"c.instructor_id = ?"``.
+            params (Tuple, optional): Parameters for ``where``.
+            after (Optional[str], optional): Return courses whose ID sorts after this one.
+            before (Optional[str], optional): Return courses whose ID sorts before this one.
+            limit (Optional[int], optional): Maximum number of rows. Defaults to no limit.
+
+        Returns:
+            List[Tuple]: ``(course_id, course_name, instructor_id, instructor_name, enrolled)``
+            for each course, ordered by course ID. ``instructor_name`` is None when the
+            course has no instructor.
+        """
+        return self._fetch_page(
+            self._COURSES_WITH_INSTRUCTORS, "c.course_id", after, before, limit, where, params
+        )
+
+    def get_course_with_instructor(self, course_id: str) -> Optional[Tuple]:
+        """
+        Retrieve a single course together with its instructor name and enrollment count.
+
+        Args:
+            course_id (str): The ID of the course.
+
+        Returns:
+            Optional[Tuple]: ``(course_id, course_name, instructor_id, instructor_name, enrolled)``
+            if found, None otherwise.
+        """
+        rows = self.get_courses_with_instructors(where="c.course_id = ?", params=(course_id,))
+        return rows[0] if rows else None
+
+    def get_course_stats(self, course_id: Optional[str] = None) -> List[Tuple]:
+        """
+        Retrieve the enrollment count of every course, or of one course.
+
+        Counts come from the ``course_stats`` table, which triggers keep up to date on
+        every registration and course change, so no registrations are counted here.
+
+        Args:
+            course_id (Optional[str], optional): Only return this course. Defaults to all.
+
+        Returns:
+            List[Tuple]: ``(course_id, course_name, instructor_id, enrolled)`` for each
+            course, ordered by course ID.
+        """
+        with self._reading() as cursor:
+            cursor.execute(
+                """
+                SELECT cs.course_id, c.course_name, cs.instructor_id, cs.enrolled
+                FROM course_stats cs
+                JOIN courses c ON c.course_id = cs.course_id
+                WHERE ?1 IS NULL OR cs.course_id = ?1
+                ORDER BY cs.course_id
+                """,
+                (course_id,),
+            )
+            return cursor.fetchall()
+
+    def get_instructor_stats(self) -> List[Tuple]:
+        """
+        Retrieve how many courses, and enrolled students over those courses, each
+        instructor has, from the ``course_stats`` table.
+
+        Returns:
+            List[Tuple]: ``(instructor_id, name, courses, enrolled)`` for each instructor,
+            including those without courses, ordered by instructor ID.
+        """
+        with self._reading() as cursor:
+            cursor.execute(
+                """
+                SELECT i.instructor_id, i.name, COUNT(cs.course_id), COALESCE(SUM(cs.enrolled), 0)
+                FROM instructors i
+                LEFT JOIN course_stats cs ON cs.instructor_id = i.instructor_id
+                GROUP BY i.instructor_id
+                ORDER BY i.instructor_id
+                """
+            )
+            return cursor.fetchall()
+
+    # Registrations joined with the student and course they link.
+    _REGISTRATIONS = """
+        SELECT r.id, s.student_id, s.name, c.course_id, c.course_name
+        FROM registrations r
+        JOIN students s ON r.student_id = s.student_id
+        JOIN courses c ON r.course_id = c.course_id
+    """
+
+    def get_registrations_page(self, after: Optional[int] = None, before: Optional[int] = None, limit: int = 100) -> List[Tuple]:
+        """
+        Retrieve one page of registrations with student and course names.
+
+        Args:
+            after (Optional[int]): Return registrations whose ID is greater than this one.
+            before (Optional[int]): Return registrations whose ID is smaller than this one.
+            limit (int, optional): Page size. Defaults to 100.
+
+        Returns:
+            List[Tuple]: ``(registration_id, student_id, student_name, course_id, course_name)``
+            for each registration on the page.
+        """
+        return self._fetch_page(self._REGISTRATIONS, "r.id", after, before, limit)
+
+    def get_registration_record(self, registration_id: int) -> Optional[Tuple]:
+        """
+        Retrieve a single registration with student and course names.
+
+        Args:
+            registration_id (int): The ID of the registration.
+
+        Returns:
+            Optional[Tuple]: The row in the get_registrations_page format if found,
+            None otherwise.
+        """
+        rows = self._fetch_page(self._REGISTRATIONS, "r.id", where="r.id = ?", params=(registration_id,))
+        return rows[0] if rows else None
+
+    # Registrations joined with their student, course and the course's instructor.
+    _ALL_RECORDS = """
+        SELECT r.id, s.student_id, s.name, c.course_id, c.course_name, i.instructor_id, i.name
+        FROM registrations r
+        JOIN students s ON r.student_id = s.student_id
+        JOIN courses c ON r.course_id = c.course_id
+        LEFT JOIN instructors i ON c.instructor_id = i.instructor_id
+    """
+
+    def get_all_records_page(self, after: Optional[int] = None, before: Optional[int] = None, limit: int = 100) -> List[Tuple]:
+        """
+        Retrieve one page of the combined registration, course and instructor view.
+
+        Args:
+            after (Optional[int]): Return rows whose registration ID is greater than this one.
+            before (Optional[int]): Return rows whose registration ID is smaller than this one.
+            limit (int, optional): Page size. Defaults to 100.
+
+        Returns:
+            List[Tuple]: ``(registration_id, student_id, student_name, course_id, course_name,
+            instructor_id, instructor_name)`` for each row on the page.
+        """
+        return self._fetch_page(self._ALL_RECORDS, "r.id", after, before, limit)
+
+    def get_all_records_row(self, registration_id: int) -> Optional[Tuple]:
+        """
+        Retrieve a single row of the combined registration, course and instructor view.
+
+        Args:
+            registration_id (int): The ID of the registration.
+
+        Returns:
+            Optional[Tuple]: The row in the get_all_records_page format if found,
+            None otherwise.
+        """
+        rows = self._fetch_page(self._ALL_RECORDS, "r.id", where="r.id = ?", params=(registration_id,))
+        return rows[0] if rows else None
+
+    def get_student_by_id(self, student_id: str) -> Optional[Tuple]:
+        """
+        Retrieve a student by their ID.
+
+        Args:
+            student_id (str): The ID of the student.
+
+        Returns:
+            Optional[Tuple]: The student record as a tuple if found, None otherwise.
+        """
+        return self._get_by_id("students", "student_id", student_id)
+
+    def get_course_by_id(self, course_id: str) -> Optional[Tuple]:
+        """
+        Retrieve a course by its ID.
+
+        Args:
+            course_id (str): The ID of the course.
+
+        Returns:
+            Optional[Tuple]: The course record as a tuple if found, None otherwise.
+        """
+        return self._get_by_id("courses", "course_id", course_id)
+
+    def get_instructor_by_id(self, instructor_id: str) -> Optional[Tuple]:
+        """
+        Retrieve an instructor by their ID.
+
+        Args:
+            instructor_id (str): The ID of the instructor.
+
+        Returns:
+            Optional[Tuple]: The instructor record as a tuple if found, None otherwise.
+        """
+        return self._get_by_id("instructors", "instructor_id", instructor_id)
+
+    def _get_by_id(self, table: str, column: str, key) -> Optional[Tuple]:
+        """
+        Look a row up by primary key, through the row cache.
+        """
+        with self._reading() as cursor:
+            if self._row_cache.capacity:
+                self._check_data_version(cursor)
+                cached, row = self._row_cache.get(table, key)
+                if cached:
+                    return row
+            generation = self._row_cache.generation
+            row = cursor.execute(f"SELECT * FROM {table} WHERE {column} = ?", (key,)).fetchone()
+        self._row_cache.put(table, key, row, generation)
+        return row
+
+    def _check_data_version(self, cursor: sqlite3.Cursor):
+        """
+        Clear the row cache if another connection committed since the last check.
+
+        ``PRAGMA data_version`` changes whenever a different connection, in this process
+        or another one, commits to the database file. It is read on the connection the
+        lookup already leased, so a cache hit never waits for the writer. Each connection
+        counts separately, so the last value is kept per connection. With a read pool,
+        the writer's own commits also count as changes, which clears more often than
+        needed but never serves a stale row. A connection seen for the first time has
+        nothing to compare with, so it clears the cache as well.
+
+        Args:
+            cursor (sqlite3.Cursor): A cursor on the connection used for the lookup.
+        """
+        conn = cursor.connection
+        version = cursor.execute("PRAGMA data_version").fetchone()[0]
+        last = self._data_versions.get(conn)
+        if version != last:
+            self._row_cache.clear()
+            self._data_versions[conn] = version
+
+    @staticmethod
+    def _prefix_pattern(prefix: str) -> str:
+        """
+        Build a LIKE pattern matching values that start with ``prefix``.
+
+        Wildcards in the prefix are escaped so that they match literally; queries using
+        the pattern must declare ``ESCAPE '\\'``.
+
+        Args:
+            prefix (str): The text the values should start with.
+
+        Returns:
+            str: The escaped LIKE pattern.
+        """
+        escaped = prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        return f"{escaped}%"
+
+    def search_students_by_prefix(self, prefix: str, limit: int = 20) -> List[Tuple]:
+        """
+        Retrieve students whose ID or name starts with the given text, ignoring case.
+
+        The lookup is served by the NOCASE indexes on ``student_id`` and ``name``; see
+        _search_by_prefix.
 
         Args:
-            course (Course): The Course instance to be added.
+            prefix (str): The text the student ID or name should start with.
+            limit (int, optional): Maximum number of rows to return. Defaults to 20.
 
         Returns:
-            bool: True if the course was added successfully, False otherwise.
+            List[Tuple]: Matching student records ordered by name.
         """
-        try:
-            self.cursor.execute(
-                """
-                INSERT INTO courses (course_id, course_name, instructor_id)
-                VALUES (?, ?, ?)
-                """,
-                (
-                    course.course_id,
-                    course.course_name,
-                    course.instructor.instructor_id if course.instructor else None,
-                ),
-            )
-            self.conn.commit()
-            return True
-        except sqlite3.IntegrityError as e:
-            print(f"Error adding course: {e}")
-            return False
+        return self._search_by_prefix("students", "student_id", "name", prefix, limit)
 
-    def register_student_to_course(self, student_id: str, course_id: str) -> bool:
+    def search_instructors_by_prefix(self, prefix: str, limit: int = 20) -> List[Tuple]:
         """
-        Register a student to a course.
+        Retrieve instructors whose ID or name starts with the given text, ignoring case.
 
         Args:
-            student_id (str): The ID of the student.
-            course_id (str): The ID of the course.
+            prefix (str): The text the instructor ID or name should start with.
+            limit (int, optional): Maximum number of rows to return. Defaults to 20.
 
         Returns:
-            bool: True if the registration was successful, False otherwise.
+            List[Tuple]: Matching instructor records ordered by name.
         """
-        try:
-            self.cursor.execute(
-                """
-                SELECT * FROM registrations
-                WHERE student_id = ? AND course_id = ?
-                """,
-                (student_id, course_id),
-            )
-            if self.cursor.fetchone():
-                print("Student is already registered for this course.")
-                return False
-
-            self.cursor.execute(
-                """
-                INSERT INTO registrations (student_id, course_id)
-                VALUES (?, ?)
-                """,
-                (student_id, course_id),
-            )
-            self.conn.commit()
-            return True
-        except sqlite3.IntegrityError as e:
-            print(f"Error registering student to course: {e}")
-            return False
+        return self._search_by_prefix("instructors", "instructor_id", "name", prefix, limit)
 
-    def assign_instructor_to_course(self, instructor_id: str, course_id: str) -> bool:
+    def search_courses_by_prefix(self, prefix: str, limit: int = 20) -> List[Tuple]:
         """
-        Assign an instructor to a course.
+        Retrieve courses whose ID or name starts with the given text, ignoring case.
 
         Args:
-            instructor_id (str): The ID of the instructor.
-            course_id (str): The ID of the course.
+            prefix (str): The text the course ID or name should start with.
+            limit (int, optional): Maximum number of rows to return. Defaults to 20.
 
         Returns:
-            bool: True if the assignment was successful, False otherwise.
+            List[Tuple]: Matching course records ordered by name.
         """
-        try:
-            self.cursor.execute(
-                "SELECT * FROM instructors WHERE instructor_id = ?", (instructor_id,)
-            )
-            instructor = self.cursor.fetchone()
-            if not instructor:
-                print(f"Instructor ID {instructor_id} does not exist.")
-                return False
+        return self._search_by_prefix("courses", "course_id", "course_name", prefix, limit)
 
-            self.cursor.execute(
-                "SELECT * FROM courses WHERE course_id = ?", (course_id,)
-            )
-            course = self.cursor.fetchone()
-            if not course:
-                print(f"Course ID {course_id} does not exist.")
-                return False
+    def _search_by_prefix(self, table: str, id_column: str, name_column: str, prefix: str, limit: int) -> List[Tuple]:
+        """
+        Retrieve up to ``limit`` rows of ``table`` whose ID or name starts with ``prefix``.
 
-            self.cursor.execute(
-                """
-                UPDATE courses
-                SET instructor_id = ?
-                WHERE course_id = ?
+        Each column is searched separately, walking its NOCASE index in order and
+        stopping after ``limit`` rows, and the two short lists are merged by name. The
+        cost therefore depends on ``limit`` rather than on how many rows match, which
+        keeps short prefixes typed into a type-ahead box fast on large tables. ID
+        matches are taken in ID order before the merge.
+        """
+        with self._reading() as cursor:
+            cursor.execute(
+                f"""
+                SELECT * FROM (
+                    SELECT * FROM (
+                        SELECT * FROM {table} WHERE {name_column} LIKE ?1 ESCAPE '\\'
+                        ORDER BY {name_column} COLLATE NOCASE LIMIT ?2
+                    )
+                    UNION
+                    SELECT * FROM (
+                        SELECT * FROM {table} WHERE {id_column} LIKE ?1 ESCAPE '\\'
+                        ORDER BY {id_column} COLLATE NOCASE LIMIT ?2
+                    )
+                )
+                ORDER BY {name_column} COLLATE NOCASE
+                LIMIT ?2
                 """,
-                (instructor_id, course_id),
+                (self._prefix_pattern(prefix), limit),
             )
-            self.conn.commit()
-            return True
-        except sqlite3.IntegrityError as e:
-            print(f"Error assigning instructor to course: {e}")
-            return False
+            return cursor.fetchall()
 
-    def get_students(self) -> List[Tuple]:
+    @staticmethod
+    def _match_expression(query: str) -> Optional[str]:
         """
-        Retrieve all students from the database.
+        Turn free text typed by the user into an FTS5 MATCH expression.
+
+        Every whitespace-separated token becomes a quoted prefix query and all tokens
+        must match, so ``"ali sm"`` finds "Alice Smith". Quoting keeps FTS5 operators
+        and punctuation in the input from being interpreted as query syntax.
+
+        Args:
+            query (str): The search text.
 
         Returns:
-            List[Tuple]: A list of tuples, each representing a student record.
+            Optional[str]: The MATCH expression, or None if the query has no tokens.
         """
-        self.cursor.execute("SELECT * FROM students")
-        return self.cursor.fetchall()
+        tokens = query.split()
+        if not tokens:
+            return None
+        return " ".join('"' + token.replace('"', '""') + '"*' for token in tokens)
 
-    def get_instructors(self) -> List[Tuple]:
+    def rebuild_search_index(self):
         """
-        Retrieve all instructors from the database.
+        Rebuild the full-text search tables from the base tables.
+
+        The triggers keep the index in sync during normal use. A rebuild is only needed
+        if the base tables were modified with the triggers absent, or after a VACUUM,
+        which may renumber the rowids the index refers to.
+        """
+        with self._writing() as cursor:
+            for table in ("students", "instructors", "courses"):
+                cursor.execute(f"INSERT INTO {table}_fts ({table}_fts) VALUES ('rebuild')")
+            self.conn.commit()
+
+    def search_students(self, query: str) -> List[Tuple]:
+        """
+        Full-text search over student IDs and names.
+
+        Args:
+            query (str): One or more tokens; each is matched as a prefix.
 
         Returns:
-            List[Tuple]: A list of tuples, each representing an instructor record.
+            List[Tuple]: Matching student records, best matches first.
         """
-        self.cursor.execute("SELECT * FROM instructors")
-        return self.cursor.fetchall()
+        with self._reading() as cursor:
+            expression = self._match_expression(query)
+            if expression is None:
+                return []
+            cursor.execute(
+                """
+                SELECT s.*
+                FROM students_fts f
+                JOIN students s ON s.rowid = f.rowid
+                WHERE students_fts MATCH ?
+                ORDER BY f.rank
+                """,
+                (expression,),
+            )
+            return cursor.fetchall()
 
-    def get_courses(self) -> List[Tuple]:
+    def search_instructors(self, query: str) -> List[Tuple]:
         """
-        Retrieve all courses from the database.
+        Full-text search over instructor IDs and names.
+
+        Args:
+            query (str): One or more tokens; each is matched as a prefix.
 
         Returns:
-            List[Tuple]: A list of tuples, each representing a course record.
+            List[Tuple]: Matching instructor records, best matches first.
         """
-        self.cursor.execute("SELECT * FROM courses")
-        return self.cursor.fetchall()
+        with self._reading() as cursor:
+            expression = self._match_expression(query)
+            if expression is None:
+                return []
+            cursor.execute(
+                """
+                SELECT i.*
+                FROM instructors_fts f
+                JOIN instructors i ON i.rowid = f.rowid
+                WHERE instructors_fts MATCH ?
+                ORDER BY f.rank
+                """,
+                (expression,),
+            )
+            return cursor.fetchall()
 
-    def get_student_by_id(self, student_id: str) -> Optional[Tuple]:
+    def search_courses(self, query: str) -> List[Tuple]:
         """
-        Retrieve a student by their ID.
+        Full-text search over course IDs and names.
 
         Args:
-            student_id (str): The ID of the student.
+            query (str): One or more tokens; each is matched as a prefix.
 
         Returns:
-            Optional[Tuple]: The student record as a tuple if found, None otherwise.
+            List[Tuple]: ``(course_id, course_name, instructor_id, instructor_name, enrolled)``
+            for each matching course, best matches first.
         """
-        self.cursor.execute(
-            "SELECT * FROM students WHERE student_id = ?", (student_id,)
+        with self._reading() as cursor:
+            expression = self._match_expression(query)
+            if expression is None:
+                return []
+            cursor.execute(
+                self._COURSES_WITH_INSTRUCTORS
+                + """
+                JOIN courses_fts f ON f.rowid = c.rowid
+                WHERE courses_fts MATCH ?
+                ORDER BY f.rank
+                """,
+                (expression,),
+            )
+            return cursor.fetchall()
+
+    # Registrations whose student or course matches the query, with the best rank of
+    # either side. Both halves resolve matches through the FTS tables and then use the
+    # indexes on registrations(student_id, ...) and registrations(course_id).
+    _REGISTRATION_MATCHES = """
+        WITH matches AS (
+            SELECT r.id AS registration_id, f.rank AS rank
+            FROM students_fts f
+            JOIN students s ON s.rowid = f.rowid
+            JOIN registrations r ON r.student_id = s.student_id
+            WHERE students_fts MATCH ?
+            UNION ALL
+            SELECT r.id, f.rank
+            FROM courses_fts f
+            JOIN courses c ON c.rowid = f.rowid
+            JOIN registrations r ON r.course_id = c.course_id
+            WHERE courses_fts MATCH ?
+        ),
+        ranked AS (
+            SELECT registration_id, MIN(rank) AS rank
+            FROM matches
+            GROUP BY registration_id
         )
-        return self.cursor.fetchone()
+    """
 
-    def get_course_by_id(self, course_id: str) -> Optional[Tuple]:
+    def search_registrations(self, query: str) -> List[Tuple]:
         """
-        Retrieve a course by its ID.
+        Full-text search for registrations by student ID/name or course ID/name.
 
         Args:
-            course_id (str): The ID of the course.
+            query (str): One or more tokens; each is matched as a prefix.
 
         Returns:
-            Optional[Tuple]: The course record as a tuple if found, None otherwise.
+            List[Tuple]: ``(registration_id, student_id, student_name, course_id, course_name)``
+            for each match, best matches first.
         """
-        self.cursor.execute("SELECT * FROM courses WHERE course_id = ?", (course_id,))
-        return self.cursor.fetchone()
+        with self._reading() as cursor:
+            expression = self._match_expression(query)
+            if expression is None:
+                return []
+            cursor.execute(
+                self._REGISTRATION_MATCHES
+                + """
+                SELECT r.id, s.student_id, s.name, c.course_id, c.course_name
+                FROM ranked m
+                JOIN registrations r ON r.id = m.registration_id
+                JOIN students s ON r.student_id = s.student_id
+                JOIN courses c ON r.course_id = c.course_id
+                ORDER BY m.rank, r.id
+                """,
+                (expression, expression),
+            )
+            return cursor.fetchall()
 
-    def get_instructor_by_id(self, instructor_id: str) -> Optional[Tuple]:
+    def search_all_records(self, query: str) -> List[Tuple]:
         """
-        Retrieve an instructor by their ID.
+        Full-text search over the combined registration, course and instructor view.
 
         Args:
-            instructor_id (str): The ID of the instructor.
+            query (str): One or more tokens matched against student and course IDs/names.
 
         Returns:
-            Optional[Tuple]: The instructor record as a tuple if found, None otherwise.
+            List[Tuple]: ``(registration_id, student_id, student_name, course_id, course_name,
+            instructor_id, instructor_name)`` for each match, best matches first.
         """
-        self.cursor.execute(
-            "SELECT * FROM instructors WHERE instructor_id = ?", (instructor_id,)
-        )
-        return self.cursor.fetchone()
+        with self._reading() as cursor:
+            expression = self._match_expression(query)
+            if expression is None:
+                return []
+            cursor.execute(
+                self._REGISTRATION_MATCHES
+                + """
+                SELECT r.id, s.student_id, s.name, c.course_id, c.course_name, i.instructor_id, i.name
+                FROM ranked m
+                JOIN registrations r ON r.id = m.registration_id
+                JOIN students s ON r.student_id = s.student_id
+                JOIN courses c ON r.course_id = c.course_id
+                LEFT JOIN instructors i ON c.instructor_id = i.instructor_id
+                ORDER BY m.rank, r.id
+                """,
+                (expression, expression),
+            )
+            return cursor.fetchall()
 
     def get_student_courses(self, student_id: str) -> List[Tuple]:
         """
@@ -339,16 +2309,17 @@ class Database:
         Returns:
             List[Tuple]: A list of tuples, each representing a course the student is registered for.
         """
-        self.cursor.execute(
-            """
-            SELECT c.course_id, c.course_name
-            FROM courses c
-            JOIN registrations r ON c.course_id = r.course_id
-            WHERE r.student_id = ?
-            """,
-            (student_id,),
-        )
-        return self.cursor.fetchall()
+        with self._reading() as cursor:
+            cursor.execute(
+                """
+                SELECT c.course_id, c.course_name
+                FROM courses c
+                JOIN registrations r ON c.course_id = r.course_id
+                WHERE r.student_id = ?
+                """,
+                (student_id,),
+            )
+            return cursor.fetchall()
 
     def update_student(self, student: Student) -> bool:
         """
@@ -360,20 +2331,23 @@ class Database:
         Returns:
             bool: True if the update was successful, False otherwise.
         """
-        try:
-            self.cursor.execute(
-                """
-                UPDATE students
-                SET name = ?, age = ?, email = ?
-                WHERE student_id = ?
-                """,
-                (student.name, student.age, student.email, student.student_id),
-            )
-            self.conn.commit()
-            return True
-        except sqlite3.IntegrityError as e:
-            print(f"Error updating student: {e}")
-            return False
+        with self._writing() as cursor:
+            try:
+                cursor.execute(
+                    """
+                    UPDATE students
+                    SET name = ?, age = ?, email = ?
+                    WHERE student_id = ?
+                    """,
+                    (student.name, student.age, student.email, student.student_id),
+                )
+                self.conn.commit()
+                self._notify("students", "update", student.student_id)
+                return True
+            except (sqlite3.IntegrityError, sqlite3.OperationalError) as e:
+                self.conn.rollback()
+                print(f"Error updating student: {e}")
+                return False
 
     def update_instructor(self, instructor: Instructor) -> bool:
         """
@@ -385,25 +2359,28 @@ class Database:
         Returns:
             bool: True if the update was successful, False otherwise.
         """
-        try:
-            self.cursor.execute(
-                """
-                UPDATE instructors
-                SET name = ?, age = ?, email = ?
-                WHERE instructor_id = ?
-                """,
-                (
-                    instructor.name,
-                    instructor.age,
-                    instructor.email,
-                    instructor.instructor_id,
-                ),
-            )
-            self.conn.commit()
-            return True
-        except sqlite3.IntegrityError as e:
-            print(f"Error updating instructor: {e}")
-            return False
+        with self._writing() as cursor:
+            try:
+                cursor.execute(
+                    """
+                    UPDATE instructors
+                    SET name = ?, age = ?, email = ?
+                    WHERE instructor_id = ?
+                    """,
+                    (
+                        instructor.name,
+                        instructor.age,
+                        instructor.email,
+                        instructor.instructor_id,
+                    ),
+                )
+                self.conn.commit()
+                self._notify("instructors", "update", instructor.instructor_id)
+                return True
+            except (sqlite3.IntegrityError, sqlite3.OperationalError) as e:
+                self.conn.rollback()
+                print(f"Error updating instructor: {e}")
+                return False
 
     def update_course(self, course: Course) -> bool:
         """
@@ -415,28 +2392,31 @@ class Database:
         Returns:
             bool: True if the update was successful, False otherwise.
         """
-        try:
-            self.cursor.execute(
-                """
-                UPDATE courses
-                SET course_name = ?, instructor_id = ?
-                WHERE course_id = ?
-                """,
-                (
-                    course.course_name,
-                    course.instructor.instructor_id if course.instructor else None,
-                    course.course_id,
-                ),
-            )
-            self.conn.commit()
-            return True
-        except sqlite3.IntegrityError as e:
-            print(f"Error updating course: {e}")
-            return False
+        with self._writing() as cursor:
+            try:
+                cursor.execute(
+                    """
+                    UPDATE courses
+                    SET course_name = ?, instructor_id = ?
+                    WHERE course_id = ?
+                    """,
+                    (
+                        course.course_name,
+                        course.instructor.instructor_id if course.instructor else None,
+                        course.course_id,
+                    ),
+                )
+                self.conn.commit()
+                self._notify("courses", "update", course.course_id)
+                return True
+            except (sqlite3.IntegrityError, sqlite3.OperationalError) as e:
+                self.conn.rollback()
+                print(f"Error updating course: {e}")
+                return False
 
     def delete_student(self, student_id: str) -> bool:
         """
-        Delete a student from the database.
+        Delete a student and their registrations from the database.
 
         Args:
             student_id (str): The ID of the student to be deleted.
@@ -444,39 +2424,57 @@ class Database:
         Returns:
             bool: True if the deletion was successful, False otherwise.
         """
-        try:
-            self.cursor.execute(
-                "DELETE FROM students WHERE student_id = ?", (student_id,)
-            )
-            self.conn.commit()
-            return True
-        except sqlite3.IntegrityError as e:
-            print(f"Error deleting student: {e}")
-            return False
+        with self._writing() as cursor:
+            try:
+                cursor.execute(
+                    "DELETE FROM registrations WHERE student_id = ? RETURNING course_id", (student_id,)
+                )
+                course_ids = [row[0] for row in cursor.fetchall()]
+                cursor.execute(
+                    "DELETE FROM students WHERE student_id = ?", (student_id,)
+                )
+                self.conn.commit()
+                self._notify("students", "delete", student_id)
+                for course_id in course_ids:
+                    self._notify("course_stats", "update", course_id)
+                return True
+            except (sqlite3.IntegrityError, sqlite3.OperationalError) as e:
+                self.conn.rollback()
+                print(f"Error deleting student: {e}")
+                return False
 
     def delete_instructor(self, instructor_id: str) -> bool:
         """
         Delete an instructor from the database.
 
+        Courses taught by the instructor are kept, without an instructor.
+
         Args:
             instructor_id (str): The ID of the instructor to be deleted.
 
         Returns:
             bool: True if the deletion was successful, False otherwise.
         """
-        try:
-            self.cursor.execute(
-                "DELETE FROM instructors WHERE instructor_id = ?", (instructor_id,)
-            )
-            self.conn.commit()
-            return True
-        except sqlite3.IntegrityError as e:
-            print(f"Error deleting instructor: {e}")
-            return False
+        with self._writing() as cursor:
+            try:
+                cursor.execute(
+                    "UPDATE courses SET instructor_id = NULL WHERE instructor_id = ?", (instructor_id,)
+                )
+                cursor.execute(
+                    "DELETE FROM instructors WHERE instructor_id = ?", (instructor_id,)
+                )
+                self.conn.commit()
+                self._row_cache.invalidate("courses")
+                self._notify("instructors", "delete", instructor_id)
+                return True
+            except (sqlite3.IntegrityError, sqlite3.OperationalError) as e:
+                self.conn.rollback()
+                print(f"Error deleting instructor: {e}")
+                return False
 
     def delete_course(self, course_id: str) -> bool:
         """
-        Delete a course from the database.
+        Delete a course and its registrations from the database.
 
         Args:
             course_id (str): The ID of the course to be deleted.
@@ -484,19 +2482,527 @@ class Database:
         Returns:
             bool: True if the deletion was successful, False otherwise.
         """
-        try:
-            self.cursor.execute("DELETE FROM courses WHERE course_id = ?", (course_id,))
-            self.conn.commit()
-            return True
-        except sqlite3.IntegrityError as e:
-            print(f"Error deleting course: {e}")
-            return False
+        with self._writing() as cursor:
+            try:
+                cursor.execute("DELETE FROM registrations WHERE course_id = ?", (course_id,))
+                cursor.execute("DELETE FROM courses WHERE course_id = ?", (course_id,))
+                self.conn.commit()
+                self._notify("courses", "delete", course_id)
+                return True
+            except (sqlite3.IntegrityError, sqlite3.OperationalError) as e:
+                self.conn.rollback()
+                print(f"Error deleting course: {e}")
+                return False
+
+    def delete_registration(self, registration_id: int) -> bool:
+        """
+        Delete a registration from the database.
+
+        Args:
+            registration_id (int): The ID of the registration to be deleted.
+
+        Returns:
+            bool: True if the deletion was successful, False otherwise.
+        """
+        with self._writing() as cursor:
+            try:
+                cursor.execute("DELETE FROM registrations WHERE id = ? RETURNING course_id", (registration_id,))
+                deleted = cursor.fetchall()
+                self.conn.commit()
+                self._notify("registrations", "delete", int(registration_id))
+                for (course_id,) in deleted:
+                    self._notify("course_stats", "update", course_id)
+                return True
+            except (sqlite3.IntegrityError, sqlite3.OperationalError) as e:
+                self.conn.rollback()
+                print(f"Error deleting registration: {e}")
+                return False
+
+    def clear_all(self):
+        """
+        Delete every registration, course, instructor and student in one transaction,
+        or as part of the enclosing transaction block.
+        """
+        with self._writing() as cursor:
+            try:
+                if not self.conn.in_transaction:
+                    cursor.execute("BEGIN IMMEDIATE")
+                # Deleting the courses removes their course_stats rows, so the per-row
+                # decrements of the registration trigger would be wasted work.
+                with self._trigger_suspended(cursor, "course_stats_registration_delete"):
+                    cursor.execute("DELETE FROM registrations")
+                cursor.execute("DELETE FROM courses")
+                cursor.execute("DELETE FROM instructors")
+                cursor.execute("DELETE FROM students")
+                self._commit()
+            except sqlite3.Error:
+                self.conn.rollback()
+                raise
+            for table in ("students", "instructors", "courses", "registrations"):
+                self._notify(table, "reload")
 
     def close(self):
         """
-        Close the database connection.
+        Close the database connections.
 
         This method should be called when the database operations are complete to ensure
         that all resources are properly released.
         """
+        if self._pool is not None:
+            self._pool.close()
         self.conn.close()
+
+
+class JobCancelled(Exception):
+    """
+    Raised inside a DatabaseJob, and passed to its ``on_error`` callback, when the
+    job was cancelled.
+    """
+
+
+class DatabaseJob:
+    """
+    A unit of work queued on a DatabaseWorker.
+
+    The job function runs on the worker thread and receives the job itself, so it can
+    reach the worker's Database through ``job.database``, report progress and check
+    for cancellation between steps.
+    """
+
+    def __init__(self, worker, func, args, on_done=None, on_error=None, on_progress=None):
+        """
+        Initialize the job. Use DatabaseWorker.submit instead of calling this directly.
+
+        Args:
+            worker (DatabaseWorker): The worker that runs the job.
+            func (Callable): Called as ``func(job, *args)`` on the worker thread.
+            args (tuple): Extra positional arguments for ``func``.
+            on_done (Callable, optional): Called with the return value of ``func``.
+            on_error (Callable, optional): Called with the exception ``func`` raised, or
+                with a JobCancelled instance if the job was cancelled.
+            on_progress (Callable, optional): Called as ``on_progress(done, total)``.
+        """
+        self.worker = worker
+        self.func = func
+        self.args = args
+        self.on_done = on_done
+        self.on_error = on_error
+        self.on_progress = on_progress
+        self.cancelled = False
+
+    @property
+    def database(self) -> "Database":
+        """
+        Database: The worker's own Database. Only use it from the job function.
+        """
+        return self.worker.database
+
+    def cancel(self):
+        """
+        Cancel the job.
+
+        A queued job is skipped. A running job has its current SQL statement interrupted,
+        which rolls back any transaction it left open.
+        """
+        self.cancelled = True
+        self.worker._interrupt(self)
+
+    def check(self):
+        """
+        Raise JobCancelled if the job was cancelled. Call it between steps of a long job.
+        """
+        if self.cancelled:
+            raise JobCancelled()
+
+    def report(self, done: int, total: Optional[int] = None):
+        """
+        Send a progress update to the ``on_progress`` callback.
+
+        Args:
+            done (int): Units of work finished so far.
+            total (Optional[int], optional): Total units of work, if known.
+        """
+        if self.on_progress:
+            self.worker._results.put(("progress", self, (done, total)))
+
+
+class DatabaseWorker:
+    """
+    Runs database jobs on a dedicated thread with its own SQLite connection.
+
+    Jobs are queued with submit and executed one at a time. Their results, progress
+    updates and the worker Database's change events are queued for the owning thread,
+    which delivers them by calling poll, e.g. from a Tk ``after()`` loop. Callbacks
+    therefore always run on the thread that calls poll.
+    """
+
+    # Number of SQLite virtual machine instructions between cancellation checks.
+    PROGRESS_INTERVAL = 10000
+
+    def __init__(self, db_name: str = "school.db", profile: str = DEFAULT_PROFILE):
+        """
+        Start the worker thread and open its connection.
+
+        Args:
+            db_name (str, optional): The name of the SQLite database file. Defaults to "school.db".
+            profile (str, optional): The connection profile for the worker's connection.
+                Defaults to "durable".
+        """
+        self.db_name = db_name
+        self.profile = profile
+        self.database: Optional[Database] = None
+        self._jobs: "queue.Queue[Optional[DatabaseJob]]" = queue.Queue()
+        self._results: "queue.Queue[Tuple[str, Optional[DatabaseJob], object]]" = queue.Queue()
+        self._listeners: List[Callable[[str, str, object], None]] = []
+        self._current: Optional[DatabaseJob] = None
+        self._lock = threading.Lock()
+        ready = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(ready,), name="DatabaseWorker", daemon=True)
+        self._thread.start()
+        ready.wait()
+
+    def submit(self, func: Callable, *args, on_done=None, on_error=None, on_progress=None) -> DatabaseJob:
+        """
+        Queue a job.
+
+        Args:
+            func (Callable): Called as ``func(job, *args)`` on the worker thread.
+            *args: Extra positional arguments for ``func``.
+            on_done (Callable, optional): Called with the return value of ``func``.
+            on_error (Callable, optional): Called with the exception ``func`` raised. If
+                omitted, the error is printed.
+            on_progress (Callable, optional): Called as ``on_progress(done, total)``.
+
+        Returns:
+            DatabaseJob: A handle that can be used to cancel the job.
+        """
+        job = DatabaseJob(self, func, args, on_done, on_error, on_progress)
+        self._jobs.put(job)
+        return job
+
+    def subscribe(self, listener: Callable[[str, str, object], None]):
+        """
+        Register a listener for change events made by jobs on this worker.
+
+        Events are delivered by poll, in order with job results, with the same
+        arguments as Database.subscribe.
+
+        Args:
+            listener (Callable[[str, str, object], None]): The function to call.
+        """
+        self._listeners.append(listener)
+
+    def poll(self) -> int:
+        """
+        Deliver all queued results, progress updates and change events.
+
+        A job cancelled after it finished, but before its result was delivered, is
+        reported as cancelled rather than done.
+
+        Returns:
+            int: The number of messages delivered.
+        """
+        count = 0
+        while True:
+            try:
+                kind, job, payload = self._results.get_nowait()
+            except queue.Empty:
+                return count
+            count += 1
+            if kind == "event":
+                for listener in list(self._listeners):
+                    listener(*payload)
+            elif kind == "progress":
+                if not job.cancelled:
+                    job.on_progress(*payload)
+            elif kind == "done" and not job.cancelled:
+                if job.on_done:
+                    job.on_done(payload)
+            elif kind == "done":
+                if job.on_error:
+                    job.on_error(JobCancelled())
+            elif job.on_error:
+                job.on_error(payload)
+            elif not isinstance(payload, JobCancelled):
+                print(f"Database job failed: {payload}")
+
+    def close(self):
+        """
+        Finish the queued jobs, stop the thread and close its connection.
+        """
+        self._jobs.put(None)
+        self._thread.join()
+
+    def _run(self, ready: threading.Event):
+        """
+        The worker thread's main loop.
+        """
+        self.database = Database(self.db_name, self.profile)
+        self.database.subscribe(lambda *event: self._results.put(("event", None, event)))
+        self.database.conn.set_progress_handler(self._should_abort, self.PROGRESS_INTERVAL)
+        ready.set()
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                break
+            with self._lock:
+                self._current = job
+            try:
+                job.check()
+                result = job.func(job, *job.args)
+                self._results.put(("done", job, result))
+            except Exception as e:
+                if self.database.conn.in_transaction:
+                    self.database.conn.rollback()
+                self._results.put(("error", job, JobCancelled() if job.cancelled else e))
+            finally:
+                with self._lock:
+                    self._current = None
+        self.database.close()
+
+    def _should_abort(self) -> int:
+        """
+        SQLite progress handler: a non-zero return aborts the running statement.
+        """
+        job = self._current
+        return 1 if job is not None and job.cancelled else 0
+
+    def _interrupt(self, job: DatabaseJob):
+        """
+        Interrupt the running statement if ``job`` is the job being executed.
+        """
+        with self._lock:
+            if self._current is job:
+                self.database.conn.interrupt()
+
+
+class AsyncDatabase:
+    """
+    An asyncio facade over a pooled Database.
+
+    Every public Database method is available as a coroutine with the same name and
+    arguments, e.g. ``await db.add_student(student)``. Calls run on dedicated threads,
+    so they never block the event loop: writes run one at a time on a writer thread that
+    uses the Database's writer connection, and reads (``get_*``, ``iter_*`` and
+    ``search_*``) run on ``readers`` reader threads, each with a pooled read connection,
+    so they proceed concurrently with each other and with the writer under WAL. The
+    ``iter_*`` methods become async generators for ``async for``, and listeners passed
+    to subscribe are called on the event loop. Use run_in_transaction in place of
+    Database.transaction.
+
+    Use it as an async context manager, or call open and close explicitly::
+
+        async with AsyncDatabase("school.db") as db:
+            await db.add_student(student)
+            async for row in db.iter_students():
+                ...
+
+    A stream holds a read connection until it is exhausted or closed. Streams run on
+    their own ``streams`` threads and the pool has a connection for each of them on top
+    of the ``readers`` connections, so open streams never starve the other reads. At
+    most ``streams`` can be open at once; another one waits until one of them ends. To
+    stop early, wrap a stream in ``contextlib.aclosing`` so its connection is returned
+    right away.
+    """
+
+    # Database methods that stream rows; mirrored as async generators.
+    STREAMING_METHODS = ("iter_students", "iter_instructors", "iter_courses", "iter_registrations")
+    # Database methods with these prefixes only read, and run on the reader threads.
+    READ_PREFIXES = ("get_", "iter_", "search_")
+    # Database methods that cannot be mirrored as a single call; see run_in_transaction.
+    UNMIRRORED_METHODS = ("transaction",)
+
+    def __init__(
+        self,
+        db_name: str = "school.db",
+        profile: str = DEFAULT_PROFILE,
+        readers: int = 4,
+        cache_size: int = 1024,
+        streams: int = 2,
+    ):
+        """
+        Initialize the facade and its threads. The database is opened by open, or on first use.
+
+        Args:
+            db_name (str, optional): The name of the SQLite database file. Defaults to "school.db".
+            profile (str, optional): The connection profile, one of CONNECTION_PROFILES.
+                Defaults to "durable".
+            readers (int, optional): Number of reads, other than streams, that can run
+                concurrently, each on a read connection of its own. At least 1. Defaults to 4.
+            cache_size (int, optional): Number of rows kept by the lookup cache. Defaults to 1024.
+            streams (int, optional): Number of ``iter_*`` streams that can be open at once,
+                each with a read connection of its own. At least 1. Defaults to 2.
+        """
+        self.db_name = db_name
+        self.profile = profile
+        self.readers = max(readers, 1)
+        self.streams = max(streams, 1)
+        self.cache_size = cache_size
+        self.database: Optional[Database] = None
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="AsyncDatabase-writer")
+        self._reader = ThreadPoolExecutor(max_workers=self.readers, thread_name_prefix="AsyncDatabase-reader")
+        self._streamer = ThreadPoolExecutor(max_workers=self.streams, thread_name_prefix="AsyncDatabase-stream")
+        self._opening: Optional[asyncio.Lock] = None
+        self._open_streams: Optional[asyncio.Semaphore] = None
+        self._listeners: Dict[Callable[[str, str, object], None], Callable[[str, str, object], None]] = {}
+
+    async def __aenter__(self) -> "AsyncDatabase":
+        await self.open()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def open(self) -> "AsyncDatabase":
+        """
+        Open the database on the writer thread, creating and migrating tables as needed.
+
+        Returns:
+            AsyncDatabase: This instance.
+        """
+        if self.database is None:
+            if self._opening is None:
+                self._opening = asyncio.Lock()
+            async with self._opening:
+                if self.database is None:
+                    self.database = await asyncio.get_running_loop().run_in_executor(
+                        self._writer,
+                        Database,
+                        self.db_name,
+                        self.profile,
+                        self.readers + self.streams,
+                        self.cache_size,
+                    )
+        return self
+
+    async def _call(self, name: str, *args, **kwargs):
+        """
+        Run the Database method ``name`` on the reader or writer threads and return its result.
+        """
+        if self.database is None:
+            await self.open()
+        method = getattr(self.database, name)
+        executor = self._reader if name.startswith(self.READ_PREFIXES) else self._writer
+        return await asyncio.get_running_loop().run_in_executor(
+            executor, functools.partial(method, *args, **kwargs)
+        )
+
+    async def _stream(self, name: str, batch_size: int = 1000) -> AsyncIterator[Tuple]:
+        """
+        Iterate a streaming Database method, fetching ``batch_size`` rows per stream thread call.
+
+        The read connection stays leased until the iteration ends or is abandoned. Waits
+        for a free slot while ``streams`` streams are already open.
+        """
+        if self.database is None:
+            await self.open()
+        if self._open_streams is None:
+            self._open_streams = asyncio.Semaphore(self.streams)
+        loop = asyncio.get_running_loop()
+        async with self._open_streams:
+            rows = getattr(self.database, name)(batch_size)
+            try:
+                while True:
+                    batch = await loop.run_in_executor(self._streamer, list, islice(rows, batch_size))
+                    if not batch:
+                        break
+                    for row in batch:
+                        yield row
+            finally:
+                await loop.run_in_executor(self._streamer, rows.close)
+
+    async def run_in_transaction(self, func: Callable, *args):
+        """
+        Run several Database calls as one transaction on the writer thread.
+
+        Database.transaction is a synchronous context manager tied to the writer
+        connection, so it is not mirrored. Instead, ``func`` is called as
+        ``func(database, *args)`` inside it, on the writer thread: everything it does is
+        committed together, or rolled back if it raises. Change events reach listeners
+        after the commit.
+
+        Args:
+            func (Callable): Called with the underlying Database and ``args``; it must not
+                await anything.
+            *args: Extra positional arguments for ``func``.
+
+        Returns:
+            The return value of ``func``.
+        """
+        if self.database is None:
+            await self.open()
+        database = self.database
+
+        def run():
+            with database.transaction():
+                return func(database, *args)
+
+        return await asyncio.get_running_loop().run_in_executor(self._writer, run)
+
+    def subscribe(self, listener: Callable[[str, str, object], None]):
+        """
+        Register a listener for changes made through this instance.
+
+        The listener is called on the event loop that is running now, with the same
+        arguments as Database.subscribe. Call it from a coroutine, after open.
+
+        Args:
+            listener (Callable[[str, str, object], None]): The function to call.
+        """
+        loop = asyncio.get_running_loop()
+
+        def deliver(*event):
+            loop.call_soon_threadsafe(listener, *event)
+
+        self._listeners[listener] = deliver
+        self.database.subscribe(deliver)
+
+    def unsubscribe(self, listener: Callable[[str, str, object], None]):
+        """
+        Remove a listener registered with subscribe.
+
+        Args:
+            listener (Callable[[str, str, object], None]): The function to remove.
+        """
+        deliver = self._listeners.pop(listener, None)
+        if deliver is not None:
+            self.database.unsubscribe(deliver)
+
+    async def close(self):
+        """
+        Close the database connections and stop the threads once pending calls finish.
+        """
+        if self.database is not None:
+            await asyncio.get_running_loop().run_in_executor(self._writer, self.database.close)
+            self.database = None
+        self._reader.shutdown(wait=False)
+        self._streamer.shutdown(wait=False)
+        self._writer.shutdown(wait=False)
+
+    @staticmethod
+    def _mirror(name: str, method: Callable) -> Callable:
+        """
+        Build the coroutine, or async generator, that stands in for a Database method.
+        """
+        if name in AsyncDatabase.STREAMING_METHODS:
+
+            def stream(self, batch_size: int = 1000) -> AsyncIterator[Tuple]:
+                return self._stream(name, batch_size)
+
+            return functools.wraps(method)(stream)
+
+        async def call(self, *args, **kwargs):
+            return await self._call(name, *args, **kwargs)
+
+        return functools.wraps(method)(call)
+
+
+for _name, _method in vars(Database).items():
+    if (
+        not _name.startswith("_")
+        and callable(_method)
+        and not hasattr(AsyncDatabase, _name)
+        and _name not in AsyncDatabase.UNMIRRORED_METHODS
+    ):
+        setattr(AsyncDatabase, _name, AsyncDatabase._mirror(_name, _method))
+del _name, _method
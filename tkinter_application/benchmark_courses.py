@@ -0,0 +1,123 @@
+"""
+Course Listing Benchmark
+
+This script compares the two ways the Courses tab has loaded its rows: the old path,
+which fetched the courses and then looked each course's instructor up by ID (one
+statement per course, the N+1 pattern), and Database.get_courses_with_instructors,
+which returns the same rows from a single joined query. Every statement SQLite runs is
+counted through the connection's trace callback, and the row cache is off by default so
+the count reflects what reaches the database.
+
+Usage:
+    python benchmark_courses.py [--courses N] [--instructors N] [--repeat N] [--cache-size N]
+
+Functions:
+    count_statements: Runs a function and counts the statements it sends to SQLite.
+    courses_per_lookup: Loads the course listing with one instructor lookup per course.
+    courses_joined: Loads the course listing with get_courses_with_instructors.
+    main: Parses the command line, builds the database and prints a comparison table.
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from typing import Callable, List, Tuple
+
+from Part4 import Database
+
+
+def count_statements(database: Database, func: Callable[[Database], List[Tuple]]) -> Tuple[List[Tuple], int, float]:
+    """
+    Run ``func`` on ``database`` and count the statements it executes.
+
+    Args:
+        database (Database): A database without a read pool, so every read uses ``conn``.
+        func (Callable[[Database], List[Tuple]]): The listing to run.
+
+    Returns:
+        Tuple[List[Tuple], int, float]: The rows, the number of statements and the elapsed seconds.
+    """
+    statements = []
+    database.conn.set_trace_callback(statements.append)
+    try:
+        start = time.perf_counter()
+        rows = func(database)
+        elapsed = time.perf_counter() - start
+    finally:
+        database.conn.set_trace_callback(None)
+    return rows, len(statements), elapsed
+
+
+def courses_per_lookup(database: Database) -> List[Tuple]:
+    """
+    Load every course with its instructor name, one instructor lookup per course.
+
+    Args:
+        database (Database): The database to read.
+
+    Returns:
+        List[Tuple]: ``(course_id, course_name, instructor_id, instructor_name)`` per course.
+    """
+    rows = []
+    for course in database.get_courses():
+        instructor_record = database.get_instructor_by_id(course[2]) if course[2] else None
+        rows.append((course[0], course[1], course[2], instructor_record[1] if instructor_record else None))
+    return rows
+
+
+def courses_joined(database: Database) -> List[Tuple]:
+    """
+    Load every course with its instructor name from a single query.
+
+    Args:
+        database (Database): The database to read.
+
+    Returns:
+        List[Tuple]: ``(course_id, course_name, instructor_id, instructor_name)`` per course.
+    """
+    return [row[:4] for row in database.get_courses_with_instructors()]
+
+
+def main():
+    """
+    Build a database of courses and time both ways of listing them.
+    """
+    parser = argparse.ArgumentParser(description="Compare per-course instructor lookups with a joined query.")
+    parser.add_argument("--courses", type=int, default=10000)
+    parser.add_argument("--instructors", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--cache-size", type=int, default=0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        database = Database(os.path.join(directory, "courses.db"), cache_size=args.cache_size)
+        database.add_instructors_bulk(
+            (f"I{i:05}", f"Instructor {i}", 30 + i % 30, f"i{i}@school.edu") for i in range(args.instructors)
+        )
+        # Every seventh course has no instructor
+        database.add_courses_bulk(
+            (f"C{i:06}", f"Course {i}", None if i % 7 == 0 else f"I{i % args.instructors:05}")
+            for i in range(args.courses)
+        )
+
+        results = {}
+        for name, func in (("per-course lookup", courses_per_lookup), ("joined query", courses_joined)):
+            best = None
+            for _ in range(args.repeat):
+                rows, statements, elapsed = count_statements(database, func)
+                best = elapsed if best is None else min(best, elapsed)
+            results[name] = (rows, statements, best)
+        database.close()
+
+    (expected, _, _), *others = results.values()
+    if any(rows != expected for rows, _, _ in others):
+        print("Warning: the listings returned different rows.")
+
+    print(f"{'listing':<20}{'rows':>10}{'statements':>12}{'best (ms)':>12}")
+    for name, (rows, statements, best) in results.items():
+        print(f"{name:<20}{len(rows):>10}{statements:>12}{best * 1000:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Connection Pool Benchmark
+
+This script measures how read throughput of a pooled Part4.Database scales with the
+number of threads. Each run opens the same WAL database with a read pool as large as
+the thread count and splits a fixed number of lookups between the threads. SQLite
+releases the GIL while it executes a statement, so reads on separate pooled
+connections run in parallel. A baseline where the largest number of threads shares a
+single read connection is reported first.
+
+Usage:
+    python benchmark_pool.py [--students N] [--operations N] [--threads 1 2 4 8]
+
+Functions:
+    read_workload: Runs a share of the lookups on the calling thread.
+    run: Times the lookups split over a number of threads.
+    main: Parses the command line, builds the database and prints throughput per thread count.
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import threading
+import time
+from typing import Dict, Tuple
+
+from Part4 import Database
+
+
+def read_workload(database: Database, operations: int, students: int, seed: int):
+    """
+    Run ``operations`` lookups of the kinds the Treeview tabs issue.
+
+    Args:
+        database (Database): The database to read from.
+        operations (int): Number of lookups to run.
+        students (int): Number of students in the database.
+        seed (int): Seed for choosing which rows to look up.
+    """
+    rng = random.Random(seed)
+    for _ in range(operations):
+        student_id = f"S{rng.randrange(students):07}"
+        database.get_student_by_id(student_id)
+        database.search_students(f"Student {rng.randrange(students)}")
+        database.get_all_records_page(after=rng.randrange(students * 2))
+
+
+def run(path: str, threads: int, readers: int, operations: int, students: int) -> Tuple[float, Dict]:
+    """
+    Time ``operations`` lookups split evenly over ``threads`` threads.
+
+    Args:
+        path (str): The database file.
+        threads (int): Number of reader threads.
+        readers (int): Size of the read connection pool.
+        operations (int): Total number of lookups.
+        students (int): Number of students in the database.
+
+    Returns:
+        Tuple[float, Dict]: Lookups per second, and the database's get_pool_stats.
+    """
+    database = Database(path, "read-mostly", readers=readers)
+    workers = [
+        threading.Thread(target=read_workload, args=(database, operations // threads, students, seed))
+        for seed in range(threads)
+    ]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start
+    stats = database.get_pool_stats()
+    database.close()
+    return operations / elapsed, stats
+
+
+def main():
+    """
+    Build a database and print read throughput for each thread count.
+    """
+    parser = argparse.ArgumentParser(description="Measure read scaling of the pooled Database.")
+    parser.add_argument("--students", type=int, default=50000)
+    parser.add_argument("--operations", type=int, default=4000)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "pool.db")
+        database = Database(path, "fast-import")
+        database.add_students_bulk(
+            (f"S{i:07}", f"Student {i}", 18 + i % 10, f"s{i}@school.edu") for i in range(args.students)
+        )
+        database.add_courses_bulk((f"C{i:04}", f"Course {i}", None) for i in range(100))
+        database.register_bulk((f"S{i:07}", f"C{(i * 7 + k) % 100:04}") for i in range(args.students) for k in range(2))
+        database.close()
+
+        threads = max(args.threads)
+        baseline, stats = run(path, threads, 1, args.operations, args.students)
+        print(f"{'threads':>8}{'readers':>9}{'lookups/s':>12}{'speedup':>10}{'pool waits':>12}")
+        print(f"{threads:>8}{1:>9}{baseline:>12.0f}{'':>10}{stats['readers']['waits']:>12}")
+        single = None
+        for threads in args.threads:
+            throughput, stats = run(path, threads, threads, args.operations, args.students)
+            single = single or throughput
+            print(
+                f"{threads:>8}{threads:>9}{throughput:>12.0f}{throughput / single:>10.2f}"
+                f"{stats['readers']['waits']:>12}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Connection Profile Benchmark
+
+This script compares the connection profiles in Part4.CONNECTION_PROFILES on the
+workloads the School Management System produces: bulk imports, one-row edits that each
+commit, and the searches and page fetches behind the Treeview tabs. Every profile runs
+against a fresh database file in a temporary directory.
+
+Usage:
+    python benchmark_profiles.py [--students N] [--courses N] [--edits N] [--searches N]
+
+Functions:
+    run_profile: Runs every workload against one profile and returns the timings.
+    main: Parses the command line, runs all profiles and prints a comparison table.
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from typing import Dict
+
+from Part1 import Student
+from Part4 import CONNECTION_PROFILES, Database
+
+
+def run_profile(profile: str, directory: str, students: int, courses: int, edits: int, searches: int) -> Dict[str, float]:
+    """
+    Run every workload against a fresh database opened with ``profile``.
+
+    Args:
+        profile (str): The name of the connection profile.
+        directory (str): Where to create the database file.
+        students (int): Number of students to bulk insert; each is registered to two courses.
+        courses (int): Number of courses to bulk insert.
+        edits (int): Number of single-row inserts, each in its own transaction.
+        searches (int): Number of full-text searches, prefix searches and page fetches.
+
+    Returns:
+        Dict[str, float]: Elapsed seconds per workload.
+    """
+    database = Database(os.path.join(directory, f"{profile}.db"), profile)
+    timings = {}
+    rng = random.Random(0)
+
+    start = time.perf_counter()
+    database.add_students_bulk((f"S{i:07}", f"Student {i}", 18 + i % 10, f"s{i}@school.edu") for i in range(students))
+    database.add_courses_bulk((f"C{i:04}", f"Course {i}", None) for i in range(courses))
+    database.register_bulk(
+        (f"S{i:07}", f"C{(i * 7 + k) % courses:04}") for i in range(students) for k in range(2)
+    )
+    timings["bulk import"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(edits):
+        database.add_student(Student(f"Edit {i}", 20, f"e{i}@school.edu", f"E{i:06}"))
+    timings["single-row commits"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(searches):
+        database.search_students(f"Student {rng.randrange(students)}")
+        database.search_registrations(f"S{rng.randrange(students):07}")
+    timings["full-text search"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(searches):
+        database.search_students_by_prefix(f"S{rng.randrange(students):07}"[:5])
+        database.get_students_page(after=f"S{rng.randrange(students):07}")
+        database.get_all_records_page(after=rng.randrange(students * 2))
+    timings["prefix search + pages"] = time.perf_counter() - start
+
+    database.close()
+    return timings
+
+
+def main():
+    """
+    Run the benchmark for every connection profile and print the results.
+    """
+    parser = argparse.ArgumentParser(description="Compare SQLite connection profiles.")
+    parser.add_argument("--students", type=int, default=50000)
+    parser.add_argument("--courses", type=int, default=200)
+    parser.add_argument("--edits", type=int, default=500)
+    parser.add_argument("--searches", type=int, default=500)
+    args = parser.parse_args()
+
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for profile in CONNECTION_PROFILES:
+            results[profile] = run_profile(
+                profile, directory, args.students, args.courses, args.edits, args.searches
+            )
+
+    workloads = list(next(iter(results.values())))
+    print(f"{'workload (s)':<24}" + "".join(f"{profile:>14}" for profile in results))
+    for workload in workloads:
+        print(f"{workload:<24}" + "".join(f"{results[profile][workload]:>14.3f}" for profile in results))
+
+
+if __name__ == "__main__":
+    main()
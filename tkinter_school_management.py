@@ -1,6 +1,6 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-from oop_school_management import Student, Instructor, Course, save_data, load_data
+from oop_school_management import Student, Instructor, Course, SchoolRegistry, SchoolJournal
 
 class SchoolManagementSystemTk(tk.Tk):
     def __init__(self):
@@ -8,10 +8,11 @@ class SchoolManagementSystemTk(tk.Tk):
         self.title("School Management System")
         self.geometry("800x600")
 
-        # Data storage for students, instructors, and courses
-        self.students = []
-        self.instructors = []
-        self.courses = []
+        # Data storage for students, instructors, and courses, indexed by id and name.
+        # Every change is appended to a journal, so it is saved as soon as it is made.
+        self.journal = SchoolJournal()
+        self.registry = self.journal.registry
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
 
         # Create the forms and buttons
         self.create_forms()
@@ -97,8 +98,13 @@ class SchoolManagementSystemTk(tk.Tk):
         student_id = self.student_id.get()
         if name and student_id:
             student = Student(name, 20, "example@example.com", student_id)
-            self.students.append(student)
-            self.student_dropdown['values'] = [student.name for student in self.students]
+            added = self.record(self.journal.add_student, student)
+            if added is None:
+                return
+            if not added:
+                messagebox.showerror("Error", f"Student ID {student_id} already exists.")
+                return
+            self.update_dropdowns()
             messagebox.showinfo("Success", f"Student {name} added.")
         else:
             messagebox.showerror("Error", "Please enter all fields.")
@@ -109,7 +115,12 @@ class SchoolManagementSystemTk(tk.Tk):
         instructor_id = self.instructor_id.get()
         if name and instructor_id:
             instructor = Instructor(name, 30, "instructor@example.com", instructor_id)
-            self.instructors.append(instructor)
+            added = self.record(self.journal.add_instructor, instructor)
+            if added is None:
+                return
+            if not added:
+                messagebox.showerror("Error", f"Instructor ID {instructor_id} already exists.")
+                return
             messagebox.showinfo("Success", f"Instructor {name} added.")
         else:
             messagebox.showerror("Error", "Please enter all fields.")
@@ -120,49 +131,91 @@ class SchoolManagementSystemTk(tk.Tk):
         course_id = self.course_id.get()
         if name and course_id:
             course = Course(course_id, name)
-            self.courses.append(course)
-            self.course_dropdown['values'] = [course.course_name for course in self.courses]
+            added = self.record(self.journal.add_course, course)
+            if added is None:
+                return
+            if not added:
+                messagebox.showerror("Error", f"Course ID {course_id} already exists.")
+                return
+            self.update_dropdowns()
             messagebox.showinfo("Success", f"Course {name} added.")
         else:
             messagebox.showerror("Error", "Please enter all fields.")
 
     # Function to register a student for a course
     def register_student(self):
-        selected_student_name = self.student_dropdown.get()
-        selected_course_name = self.course_dropdown.get()
-        student = next((s for s in self.students if s.name == selected_student_name), None)
-        course = next((c for c in self.courses if c.course_name == selected_course_name), None)
+        # Dropdown entries are "Name (ID)" labels, resolved by id
+        student = self.registry.resolve_student(self.student_dropdown.get())
+        course = self.registry.resolve_course(self.course_dropdown.get())
         if student and course:
-            student.register_course(course)
-            messagebox.showinfo("Success", f"Student {student.name} registered for {course.course_name}")
+            registered = self.record(self.journal.register_course, student, course)
+            if registered is None:
+                return
+            if registered:
+                messagebox.showinfo("Success", f"Student {student.name} registered for {course.course_name}")
+            else:
+                messagebox.showwarning("Warning", f"Student {student.name} is already registered for {course.course_name}.")
         else:
             messagebox.showerror("Error", "Please select valid student and course.")
 
+    # Run a journal operation; returns None after reporting saved data that cannot be read
+    def record(self, operation, *args):
+        try:
+            result = operation(*args)
+        except ValueError as e:
+            messagebox.showerror("Error", f"Saved data is corrupt, so changes cannot be saved: {e}")
+            return None
+        # The journal loads the saved data first if that failed at startup
+        self.registry = self.journal.registry
+        return result
+
+    # Function to refill the registration dropdowns with unique "Name (ID)" labels
+    def update_dropdowns(self):
+        self.student_dropdown['values'] = [SchoolRegistry.label(student) for student in self.registry.students]
+        self.course_dropdown['values'] = [SchoolRegistry.label(course) for course in self.registry.courses]
+
     # Function to refresh the display table
     def refresh_table(self):
         for row in self.tree.get_children():
             self.tree.delete(row)
-        for student in self.students:
+        for student in self.registry.students:
             self.tree.insert("", "end", values=("Student", student.name, student.student_id, f"Courses: {[course.course_name for course in student.registered_courses]}"))
-        for instructor in self.instructors:
+        for instructor in self.registry.instructors:
             self.tree.insert("", "end", values=("Instructor", instructor.name, instructor.instructor_id, f"Courses: {[course.course_name for course in instructor.assigned_courses]}"))
-        for course in self.courses:
+        for course in self.registry.courses:
             self.tree.insert("", "end", values=("Course", course.course_name, course.course_id, f"Instructor: {course.instructor.name if course.instructor else 'None'}"))
 
     # Function to load existing data from a file
     def load_existing_data(self):
         try:
-            self.students, self.instructors, self.courses = load_data()
-            messagebox.showinfo("Success", "Data loaded successfully.")
+            if not self.journal.load():
+                messagebox.showwarning("Warning", "No saved data found.")
+                return
+            self.registry = self.journal.registry
+            report = self.journal.load_report
+            if report and not report.ok:
+                messagebox.showwarning("Warning", f"Data loaded with problems:\n{report.summary()}")
+            else:
+                messagebox.showinfo("Success", "Data loaded successfully.")
+            self.update_dropdowns()
             self.refresh_table()
-        except FileNotFoundError:
-            messagebox.showwarning("Warning", "No saved data found.")
+        except ValueError as e:
+            messagebox.showerror("Error", f"Saved data is corrupt: {e}")
 
-    # Function to save data to a file
+    # Function to save data to a file: folds the journal into a fresh snapshot
     def save_data(self):
-        save_data(self.students, self.instructors, self.courses)
+        try:
+            self.journal.compact()
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Error", f"Data not saved: {e}")
+            return
         messagebox.showinfo("Success", "Data saved successfully.")
 
+    # Finish any background compaction before the window closes
+    def on_close(self):
+        self.journal.close()
+        self.destroy()
+
 if __name__ == "__main__":
     app = SchoolManagementSystemTk()
     app.mainloop()